@@ -1,20 +1,22 @@
 """
 AI 어시스턴트 모듈
 로컬 LLM을 사용하여 버그 리포트 내용을 자동 생성합니다.
+추론 서버 연동은 llm_backends 모듈의 백엔드를 사용합니다.
 """
-import json
 import logging
 import os
+import threading
 from typing import Dict, Any, Optional, List
-from pathlib import Path
+
+from config import AIConfig
+from llm_backends import LLMBackend, OLLAMA_AVAILABLE, get_default_backend
+from response_parser import ResponseFieldScanner, parse_response_fields
+from text_index import ExampleIndex, format_example
+from preset_store import get_preset_db_store
 
 logger = logging.getLogger(__name__)
 
-try:
-    import ollama
-    OLLAMA_AVAILABLE = True
-except ImportError:
-    OLLAMA_AVAILABLE = False
+if not OLLAMA_AVAILABLE and AIConfig.BACKEND == 'ollama':
     logger.warning("ollama 패키지가 설치되지 않았습니다. AI 기능을 사용하려면 'pip install ollama'를 실행하세요.")
 
 
@@ -23,61 +25,84 @@ class AIAssistant:
     
     DEFAULT_MODEL = "gemma2:2b"  # 가벼운 모델 (RAM 4GB, 빠름) - 추천: qwen2.5:1.5b (더 빠름)
     
-    def __init__(self, model_name: Optional[str] = None, preset_dir: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, preset_dir: Optional[str] = None,
+                 backend: Optional[LLMBackend] = None):
         """
         AI 어시스턴트 초기화
         
         Args:
             model_name: 사용할 모델 이름 (기본값: gemma2:2b)
             preset_dir: preset 파일들이 있는 디렉토리 경로
+            backend: 사용할 LLM 백엔드 (기본값: AIConfig.BACKEND 설정의 공용 백엔드)
         """
         self.model_name = model_name or self.DEFAULT_MODEL
         self.preset_dir = preset_dir
-        self.example_presets = []
+        self.backend = backend or get_default_backend()
+        self.example_index = ExampleIndex(preset_dir)
+        
+        if not self.backend.is_available():
+            logger.error(f"LLM 백엔드({self.backend.name})를 사용할 수 없습니다.")
+        
+        # preset 스캔과 클라이언트 import는 warm_up() 또는 첫 생성 시 수행 (생성자는 가볍게 유지)
+    
+    def warm_up(self):
+        """
+        백엔드 클라이언트 로드 및 예시 인덱스 구축
         
-        if not OLLAMA_AVAILABLE:
-            logger.error("Ollama가 설치되지 않았습니다.")
+        백그라운드 스레드에서 미리 호출해 두면 첫 AI 생성 요청이 대기하지 않습니다.
+        """
+        if not self.backend.is_available():
+            return
+        
+        try:
+            self.backend.warm_up()
+        except Exception as e:
+            logger.error(f"LLM 백엔드({self.backend.name}) 준비 실패: {e}")
             return
         
-        # preset 디렉토리에서 예시 데이터 로드
         if self.preset_dir:
             self._load_example_presets()
+        logger.info("AI 어시스턴트 준비 완료")
+    
+    @property
+    def example_presets(self) -> List[Dict[str, str]]:
+        """인덱싱된 예시 preset 목록"""
+        return self.example_index.examples()
     
-    def _load_example_presets(self, max_examples: int = 2):
+    def _load_example_presets(self):
         """
-        preset 파일들에서 예시 데이터를 로드
+        preset 파일들로 예시 인덱스를 구축/갱신
         
-        Args:
-            max_examples: 로드할 최대 예시 개수
+        변경된 파일만 다시 읽으므로 생성 요청마다 호출해도 부담이 적습니다.
         """
         if not self.preset_dir or not os.path.exists(self.preset_dir):
             logger.warning(f"preset 디렉토리를 찾을 수 없습니다: {self.preset_dir}")
             return
         
         try:
-            preset_files = list(Path(self.preset_dir).glob('*.json'))[:max_examples]
-            
-            for preset_file in preset_files:
-                try:
-                    with open(preset_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        # 필요한 필드만 추출
-                        example = {
-                            'summary': data.get('summary', ''),
-                            'priority': data.get('priority', ''),
-                            'severity': data.get('severity', ''),
-                            'steps': data.get('steps', ''),
-                            'description': data.get('description', ''),
-                            'label': data.get('label', '')
-                        }
-                        if example['summary']:  # summary가 있는 경우만 추가
-                            self.example_presets.append(example)
-                except Exception as e:
-                    logger.warning(f"preset 파일 로드 실패 ({preset_file.name}): {e}")
-                    
-            logger.info(f"{len(self.example_presets)}개의 예시 preset을 로드했습니다.")
+            store = get_preset_db_store(self.preset_dir)
+            if store is not None:
+                # SQLite 저장소 사용 시 DB의 (키, 저장 시각)으로 증분 갱신
+                changed = self.example_index.refresh(store.stamps(), loader=store.load)
+            else:
+                changed = self.example_index.refresh()
+            if changed:
+                logger.info(f"{len(self.example_index)}개의 예시 preset을 인덱싱했습니다.")
         except Exception as e:
-            logger.error(f"preset 디렉토리 읽기 실패: {e}")
+            logger.error(f"preset 인덱스 갱신 실패: {e}")
+    
+    def _select_examples(self, summary: str) -> List[Dict[str, str]]:
+        """버그 제목과 가장 유사한 예시를 토큰 예산 안에서 선택"""
+        if not self.preset_dir:
+            return []
+        
+        self._load_example_presets()
+        return self.example_index.select_examples(
+            summary,
+            max_examples=AIConfig.MAX_EXAMPLE_PRESETS,
+            token_budget=AIConfig.EXAMPLE_TOKEN_BUDGET,
+            min_score=AIConfig.EXAMPLE_MIN_SIMILARITY
+        )
     
     def _build_prompt(self, summary: str) -> str:
         """
@@ -89,11 +114,17 @@ class AIAssistant:
         Returns:
             생성된 프롬프트
         """
-        # 예시 데이터는 프롬프트 길이 때문에 제외 (속도 향상)
+        # 유사한 예시 1~2개만 토큰 예산 안에서 포함 (프롬프트 길이 제한)
+        examples = self._select_examples(summary)
+        examples_text = ""
+        if examples:
+            examples_text = "참고 예시 (같은 팀이 작성한 유사 버그):\n\n" + "\n\n".join(
+                format_example(example) for example in examples
+            ) + "\n\n"
         
         prompt = f"""게임 QA 전문가로서 JIRA 버그 리포트를 작성합니다.
 
-버그 제목: {summary}
+{examples_text}버그 제목: {summary}
 
 다음 JSON 형식으로 작성:
 
@@ -114,12 +145,18 @@ JSON만 출력하세요:"""
         
         return prompt
     
-    def generate_bug_details(self, summary: str) -> Optional[Dict[str, str]]:
+    def generate_bug_details(self, summary: str,
+                             cancel_event: Optional[threading.Event] = None) -> Optional[Dict[str, str]]:
         """
         버그 제목을 바탕으로 세부 정보를 생성
         
+        스트리밍 API로 응답을 받으며, cancel_event가 설정되면 스트림을 닫아
+        HTTP 연결을 끊습니다. 연결이 끊기면 추론 서버도 생성을 중단하므로
+        다음 요청이 고아 요청 뒤에서 대기하지 않습니다.
+        
         Args:
             summary: 버그 요약 (제목)
+            cancel_event: 취소 요청 이벤트 (설정 시 생성 중단 후 None 반환)
             
         Returns:
             생성된 버그 정보 딕셔너리 또는 None (실패 시)
@@ -130,8 +167,8 @@ JSON만 출력하세요:"""
                 'description': str
             }
         """
-        if not OLLAMA_AVAILABLE:
-            logger.error("Ollama가 설치되지 않았습니다.")
+        if not self.backend.is_available():
+            logger.error(f"LLM 백엔드({self.backend.name})를 사용할 수 없습니다.")
             return None
         
         if not summary or not summary.strip():
@@ -142,42 +179,51 @@ JSON만 출력하세요:"""
             # 프롬프트 생성
             prompt = self._build_prompt(summary)
             
-            logger.info(f"AI 생성 시작 - 모델: {self.model_name}, 제목: {summary[:50]}...")
+            logger.info(f"AI 생성 시작 - 백엔드: {self.backend.name}, 모델: {self.model_name}, 제목: {summary[:50]}...")
+            
+            # 스트리밍 청크를 바로 스캔하여 필수 필드가 모두 나오면 생성을 조기 종료
+            scanner = ResponseFieldScanner()
             
-            # Ollama API 호출 (속도 최적화)
-            response = ollama.generate(
-                model=self.model_name,
-                prompt=prompt,
+            # 백엔드 호출 (스트리밍 - 청크 단위로 취소 여부 확인)
+            generated_text = self.backend.generate(
+                self.model_name,
+                prompt,
                 options={
                     'temperature': 0.3,  # 낮춰서 더 빠르고 일관적으로
                     'top_p': 0.9,
                     'top_k': 40,
                     'num_predict': 1024,  # 최대 토큰 수 제한 (속도 향상)
                     'num_ctx': 2048,  # 컨텍스트 크기 제한 (메모리/속도 향상)
-                }
+                },
+                cancel_event=cancel_event,
+                on_chunk=scanner.feed
             )
             
-            # 응답에서 텍스트 추출
-            generated_text = response.get('response', '').strip()
+            if generated_text is None:
+                logger.info("AI 생성이 취소되었습니다.")
+                return None
             
             if not generated_text:
                 logger.error("AI가 빈 응답을 반환했습니다.")
                 return None
             
             # 응답 전체를 로그에 저장 (디버깅용)
-            logger.debug(f"AI 응답 (처음 500자): {generated_text[:500]}")
-            logger.debug(f"AI 응답 길이: {len(generated_text)} 문자")
+            logger.debug("AI 응답 (처음 500자): %.500s", generated_text)
+            logger.debug("AI 응답 길이: %d 문자", len(generated_text))
             
             # 응답을 파일로 저장 (디버깅용)
-            try:
-                with open('last_ai_response.txt', 'w', encoding='utf-8') as f:
-                    f.write(generated_text)
-                logger.debug("AI 응답을 'last_ai_response.txt'에 저장했습니다.")
-            except:
-                pass
+            if AIConfig.LAST_RESPONSE_FILE:
+                try:
+                    with open(AIConfig.LAST_RESPONSE_FILE, 'w', encoding='utf-8') as f:
+                        f.write(generated_text)
+                    logger.debug(f"AI 응답을 '{AIConfig.LAST_RESPONSE_FILE}'에 저장했습니다.")
+                except:
+                    pass
             
-            # JSON 파싱
-            result = self._parse_response(generated_text)
+            # 스캔 결과 확정 (잘린 마지막 문자열 복구 포함)
+            result = scanner.close()
+            if scanner.truncated:
+                logger.warning("잘린 응답에서 마지막 필드를 복구했습니다.")
             
             if result:
                 logger.info("AI 생성 완료")
@@ -193,7 +239,7 @@ JSON만 출력하세요:"""
     
     def _parse_response(self, response_text: str) -> Optional[Dict[str, str]]:
         """
-        AI 응답을 파싱
+        AI 응답을 파싱 (한 번의 선형 스캔으로 필드 복구)
         
         Args:
             response_text: AI가 생성한 텍스트
@@ -202,122 +248,25 @@ JSON만 출력하세요:"""
             파싱된 딕셔너리 또는 None
         """
         try:
-            # JSON 블록 찾기 (```json ... ``` 또는 { ... })
-            json_text = response_text
-            
-            # 코드 블록 제거
-            if '```json' in json_text:
-                json_text = json_text.split('```json')[1].split('```')[0]
-            elif '```' in json_text:
-                json_text = json_text.split('```')[1].split('```')[0]
-            
-            # JSON 텍스트 정리 (제어 문자 처리)
-            json_text = json_text.strip()
-            
-            # JSON 파싱 시도 (strict=False로 제어 문자 허용)
-            try:
-                data = json.loads(json_text, strict=False)
-            except json.JSONDecodeError:
-                # strict=False로도 실패하면 제어 문자를 이스케이프 처리
-                logger.warning("JSON 파싱 실패, 제어 문자 정리 시도 중...")
-                
-                # 제어 문자를 이스케이프 처리
-                import re
-                # 줄바꿈 문자를 \\n으로 변환 (JSON 문자열 내부의 줄바꿈)
-                json_text_cleaned = json_text.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-                
-                # 다시 원래대로 복구 (JSON 구조상 필요한 줄바꿈)
-                # JSON 키-값 사이의 줄바꿈은 유지
-                json_text_cleaned = re.sub(r'\\n(?=\s*["}])', '\n', json_text_cleaned)
-                json_text_cleaned = re.sub(r'(?<=[{,])\s*\\n\s*', '\n', json_text_cleaned)
-                
-                try:
-                    data = json.loads(json_text_cleaned, strict=False)
-                except json.JSONDecodeError:
-                    # 최후의 수단: 정규식으로 필드 추출
-                    logger.warning("JSON 파싱 실패, 정규식으로 필드 추출 시도 중...")
-                    return self._extract_fields_with_regex(response_text)
-            
-            # 필수 필드 확인
-            required_fields = ['priority', 'severity', 'steps', 'description']
-            if not all(field in data for field in required_fields):
-                logger.error(f"필수 필드 누락: {required_fields}, 받은 필드: {list(data.keys())}")
-                # 정규식으로 재시도
-                return self._extract_fields_with_regex(response_text)
-            
-            return {
-                'priority': str(data['priority']),
-                'severity': str(data['severity']),
-                'steps': str(data['steps']),
-                'description': str(data['description'])
-            }
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON 파싱 오류: {e}")
-            logger.debug(f"파싱 실패한 텍스트 (처음 500자): {response_text[:500]}")
-            # 정규식으로 재시도
-            return self._extract_fields_with_regex(response_text)
+            return parse_response_fields(response_text)
         except Exception as e:
             logger.error(f"응답 파싱 중 오류: {e}", exc_info=True)
             return None
     
-    def _extract_fields_with_regex(self, response_text: str) -> Optional[Dict[str, str]]:
-        """
-        정규식을 사용하여 응답에서 필드를 추출 (JSON 파싱 실패 시 백업)
-        
-        Args:
-            response_text: AI 응답 텍스트
-            
-        Returns:
-            추출된 필드 딕셔너리 또는 None
-        """
-        try:
-            import re
-            
-            result = {}
-            
-            # Priority 추출
-            priority_match = re.search(r'"priority"\s*:\s*"([^"]+)"', response_text, re.IGNORECASE)
-            if priority_match:
-                result['priority'] = priority_match.group(1)
-            
-            # Severity 추출
-            severity_match = re.search(r'"severity"\s*:\s*"([^"]+)"', response_text, re.IGNORECASE)
-            if severity_match:
-                result['severity'] = severity_match.group(1)
-            
-            # Steps 추출 (여러 줄 가능)
-            steps_match = re.search(r'"steps"\s*:\s*"((?:[^"\\]|\\.)*)"', response_text, re.IGNORECASE | re.DOTALL)
-            if steps_match:
-                result['steps'] = steps_match.group(1).replace('\\n', '\n').replace('\\"', '"')
-            
-            # Description 추출 (여러 줄 가능)
-            desc_match = re.search(r'"description"\s*:\s*"((?:[^"\\]|\\.)*)"', response_text, re.IGNORECASE | re.DOTALL)
-            if desc_match:
-                result['description'] = desc_match.group(1).replace('\\n', '\n').replace('\\"', '"')
-            
-            # 필수 필드 확인
-            required_fields = ['priority', 'severity', 'steps', 'description']
-            if all(field in result for field in required_fields):
-                logger.info("정규식을 사용한 필드 추출 성공")
-                return result
-            else:
-                logger.error(f"정규식 추출 실패: 추출된 필드 {list(result.keys())}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"정규식 추출 중 오류: {e}", exc_info=True)
-            return None
-    
     @staticmethod
     def is_ollama_available() -> bool:
         """Ollama가 사용 가능한지 확인"""
         return OLLAMA_AVAILABLE
     
+    @staticmethod
+    def is_backend_available() -> bool:
+        """설정된 LLM 백엔드를 사용할 수 있는지 확인"""
+        return get_default_backend().is_available()
+    
     @staticmethod
     def check_model_exists(model_name: str) -> bool:
         """
-        모델이 로컬에 설치되어 있는지 확인
+        모델이 백엔드 서버에 설치되어 있는지 확인
         
         Args:
             model_name: 확인할 모델 이름
@@ -325,27 +274,17 @@ JSON만 출력하세요:"""
         Returns:
             설치 여부
         """
-        if not OLLAMA_AVAILABLE:
+        backend = get_default_backend()
+        if not backend.is_available():
             return False
         
         try:
-            models = ollama.list()
-            model_list = models.get('models', [])
+            model_names = backend.list_models()
             
-            if not model_list:
+            if not model_names:
                 logger.warning("설치된 모델이 없습니다.")
                 return False
             
-            # 모델 이름 추출 (ollama 패키지 버전에 따라 다름)
-            model_names = []
-            for model in model_list:
-                if hasattr(model, 'model'):
-                    model_names.append(model.model)
-                elif isinstance(model, dict) and 'model' in model:
-                    model_names.append(model['model'])
-                elif isinstance(model, dict) and 'name' in model:
-                    model_names.append(model['name'])
-            
             logger.debug(f"설치된 모델 목록: {model_names}")
             
             # 모델 이름 매칭 (정확한 이름 또는 태그 포함)
@@ -360,8 +299,8 @@ JSON만 출력하세요:"""
             return False
             
         except ConnectionError as e:
-            logger.error(f"Ollama 서비스에 연결할 수 없습니다: {e}")
-            logger.error("Ollama 데스크톱 애플리케이션이 실행 중인지 확인해주세요.")
+            logger.error(f"LLM 서버({backend.name})에 연결할 수 없습니다: {e}")
+            logger.error("Ollama 데스크톱 애플리케이션 또는 추론 서버가 실행 중인지 확인해주세요.")
             return False
         except Exception as e:
             logger.error(f"모델 확인 중 오류: {e}", exc_info=True)
@@ -370,32 +309,21 @@ JSON만 출력하세요:"""
     @staticmethod
     def get_available_models() -> List[str]:
         """
-        로컬에 설치된 모델 목록 가져오기
+        백엔드 서버에 설치된 모델 목록 가져오기
         
         Returns:
             모델 이름 리스트
         """
-        if not OLLAMA_AVAILABLE:
+        backend = get_default_backend()
+        if not backend.is_available():
             return []
         
         try:
-            models = ollama.list()
-            model_list = models.get('models', [])
-            
-            # 모델 이름 추출 (ollama 패키지 버전에 따라 다름)
-            model_names = []
-            for model in model_list:
-                if hasattr(model, 'model'):
-                    model_names.append(model.model)
-                elif isinstance(model, dict) and 'model' in model:
-                    model_names.append(model['model'])
-                elif isinstance(model, dict) and 'name' in model:
-                    model_names.append(model['name'])
-            
+            model_names = backend.list_models()
             logger.info(f"설치된 모델 {len(model_names)}개: {model_names}")
             return model_names
         except ConnectionError as e:
-            logger.error(f"Ollama 서비스에 연결할 수 없습니다: {e}")
+            logger.error(f"LLM 서버({backend.name})에 연결할 수 없습니다: {e}")
             return []
         except Exception as e:
             logger.error(f"모델 목록 조회 중 오류: {e}", exc_info=True)
@@ -440,6 +368,7 @@ JSON만 출력하세요:"""
 
 # 전역 인스턴스 (싱글톤 패턴)
 _ai_assistant_instance: Optional[AIAssistant] = None
+_ai_assistant_lock = threading.Lock()
 
 
 def get_ai_assistant(preset_dir: Optional[str] = None, model_name: Optional[str] = None) -> AIAssistant:
@@ -455,11 +384,29 @@ def get_ai_assistant(preset_dir: Optional[str] = None, model_name: Optional[str]
     """
     global _ai_assistant_instance
     
-    if _ai_assistant_instance is None:
-        _ai_assistant_instance = AIAssistant(
-            model_name=model_name,
-            preset_dir=preset_dir
-        )
+    # 백그라운드 초기화 스레드와 생성 스레드가 동시에 호출할 수 있음
+    with _ai_assistant_lock:
+        if _ai_assistant_instance is None:
+            _ai_assistant_instance = AIAssistant(
+                model_name=model_name,
+                preset_dir=preset_dir
+            )
     
     return _ai_assistant_instance
 
+
+def warm_up_ai_assistant(preset_dir: Optional[str] = None, model_name: Optional[str] = None) -> AIAssistant:
+    """
+    AI 어시스턴트를 생성하고 미리 준비 (백그라운드 스레드에서 호출용)
+    
+    Args:
+        preset_dir: preset 디렉토리 경로
+        model_name: 모델 이름
+        
+    Returns:
+        준비된 AIAssistant 인스턴스
+    """
+    assistant = get_ai_assistant(preset_dir=preset_dir, model_name=model_name)
+    assistant.warm_up()
+    return assistant
+
@@ -0,0 +1,256 @@
+"""
+일괄 이슈 생성 CLI (PyQt5 없이 실행)
+야간 QA 일괄 등록처럼 GUI 없는 서버에서 엑셀/CSV/JSONL 입력으로 이슈를 만듭니다.
+
+사용법:
+    python -m batch_cli bugs.xlsx --backend rest --concurrency 4 --checkpoint bugs.ckpt.jsonl
+
+- 진행 상황은 stdout에 JSON Lines로 출력 (로그는 stderr)
+    {"event": "headers", "unknown": ["메모"], "missing": [...], "duplicates": []}  (헤더 문제가 있을 때만)
+    {"event": "start", "total": 120, "skipped": 20, ...}
+    {"event": "row", "row": 2, "status": "created", "issue": "P2-123", "elapsed": 1.2}
+    {"event": "done", "created": 99, "failed": 1, "skipped": 20}
+- 체크포인트 파일에는 성공한 행의 내용 해시를 기록하므로, 다시 실행하면 이미 만든 행은 건너뜁니다.
+- 생성 전에 모든 행을 허용 값(DropdownOptions, 옵션 파일, 캐시된 JIRA 필드 허용 값)과 비교해
+  오류가 있는 행은 "invalid"로 보고하고 건너뜁니다 (--dry-run으로 검증만 가능).
+- 백엔드 모듈(selenium 또는 requests)은 선택한 것만 import 합니다.
+
+종료 코드: 0 (모두 성공), 1 (실패한 행 있음), 2 (입력/인자 오류, 백엔드를 만들 수 없음)
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import as_completed
+from typing import Dict, Optional, Set
+
+from batch_rows import inspect_headers, iter_issue_records
+from batch_validation import ERROR, FieldDomain, build_domains, validate_rows
+from issue_scheduler import BACKENDS, BATCH, IssueScheduler
+from jira_rest import load_cached_field_options
+from log_pipeline import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+class BackendUnavailableError(RuntimeError):
+    """선택한 백엔드를 만들 수 없음 (selenium/requests 미설치, 브라우저 시작 실패 등)"""
+
+
+def row_key(input_data: Dict[str, str]) -> str:
+    """
+    체크포인트용 행 내용 해시 (행 순서가 바뀌어도 같은 내용이면 같은 키)
+
+    설명 자동 생성 전 입력 값으로 계산하므로, 실행 사이에 templates/*.md나
+    rule_packs/*.json이 바뀌어도 이미 만든 행을 다시 만들지 않습니다.
+    """
+    encoded = json.dumps(input_data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class Checkpoint:
+    """성공한 행을 JSON Lines로 추가 기록하는 체크포인트"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.done: Set[str] = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 중간에 끊긴 마지막 줄
+                    if record.get('status') == 'created':
+                        self.done.add(record.get('key', ''))
+
+    def record(self, entry: Dict[str, object]):
+        if not self.path:
+            return
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class ProgressWriter:
+    """JSON Lines 진행 상황 출력 (여러 스레드에서 호출)"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        line = json.dumps(dict(event=event, **fields), ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+
+
+def load_validation_domains() -> Dict[str, FieldDomain]:
+    """사전 검증용 허용 값 (DropdownOptions, 옵션 파일, 캐시된 JIRA 필드 허용 값)"""
+    from utils import OptionsManager
+
+    return build_domains(OptionsManager(), load_cached_field_options())
+
+
+def run_batch(input_path: str, backend_name: str = 'browser', concurrency: int = 1,
+              checkpoint_path: Optional[str] = None, dry_run: bool = False,
+              progress: Optional[ProgressWriter] = None,
+              domains: Optional[Dict[str, FieldDomain]] = None, validate: bool = True) -> Dict[str, int]:
+    """
+    일괄 생성 실행
+
+    validate가 True면 생성 전에 모든 행을 검증하고, 오류가 있는 행은
+    status='invalid'로 보고한 뒤 실행에서 제외합니다 (실패 개수에 포함).
+
+    Returns:
+        {'total', 'created', 'failed', 'skipped'} 개수
+
+    Raises:
+        ValueError: 지원하지 않는 입력 형식이거나 필수 열(Summary)이 없는 경우
+        BackendUnavailableError: 백엔드를 만들 수 없는 경우 (의존성 누락 등)
+    """
+    progress = progress or ProgressWriter()
+
+    # 헤더 문제는 행을 읽기 전에 알림 (필수 열이 없으면 실행하지 않음)
+    mapping = inspect_headers(input_path)
+    if mapping.problems():
+        progress.emit('headers', unknown=mapping.unknown, missing=mapping.missing,
+                      duplicates=mapping.duplicates)
+        for message in mapping.problems():
+            logger.warning(f"{input_path}: {message}")
+    if mapping.missing_required:
+        raise ValueError(f"{input_path}: 필수 열이 없습니다 ({', '.join(mapping.missing_required)})")
+
+    checkpoint = Checkpoint(checkpoint_path)
+
+    pending = []
+    skipped = 0
+    for row_number, input_data, issue_data in iter_issue_records(input_path):
+        key = row_key(input_data)
+        if key in checkpoint.done:
+            skipped += 1
+            continue
+        pending.append((row_number, key, issue_data))
+
+    # 사전 검증: 브라우저/REST 작업 전에 잘못된 값을 가진 행을 걸러냄
+    invalid = []
+    if validate and pending:
+        report = validate_rows(((row_number, issue_data) for row_number, _, issue_data in pending),
+                               domains if domains is not None else load_validation_domains())
+        for issue in report.warnings:
+            logger.warning(f"행 {issue.row}: {issue.field} '{issue.value}' - {issue.message}")
+        error_rows = report.error_rows
+        if error_rows:
+            by_row = report.by_row()
+            invalid = [(row_number, issue_data, by_row[row_number])
+                       for row_number, _, issue_data in pending if row_number in error_rows]
+            pending = [item for item in pending if item[0] not in error_rows]
+
+    counts = {'total': len(pending) + len(invalid) + skipped, 'created': 0, 'failed': len(invalid),
+              'skipped': skipped}
+    progress.emit('start', input=input_path, backend=backend_name, total=counts['total'],
+                  pending=len(pending), skipped=skipped, invalid=len(invalid), dry_run=dry_run)
+    for row_number, issue_data, issues in invalid:
+        progress.emit('row', row=row_number, status='invalid', summary=issue_data.get('summary', ''),
+                      errors=[{'field': issue.field, 'value': issue.value, 'message': issue.message}
+                              for issue in issues if issue.severity == ERROR])
+    if dry_run or not pending:
+        progress.emit('done', **counts)
+        return counts
+
+    # 백엔드는 동시 실행 한도를 알고 실패를 바로 보고하기 위해 여기(호출 스레드)에서 만듦
+    factory = BACKENDS[backend_name]
+    try:
+        backend = factory(concurrency)
+    except Exception as e:
+        raise BackendUnavailableError(f"'{backend_name}' 백엔드를 사용할 수 없습니다: {e}") from e
+    workers = max(1, min(concurrency, getattr(backend, 'max_concurrency', concurrency), len(pending)))
+    if workers < concurrency:
+        logger.info(f"'{backend_name}' 백엔드는 동시 실행 {workers}개로 제한됩니다")
+
+    def create(backend, row_number: int, key: str, issue_data: Dict[str, str]):
+        start = time.perf_counter()
+        try:
+            issue_key = backend.create_issue(issue_data)
+        except Exception as e:
+            logger.error(f"이슈 생성 실패 (행 {row_number}): {e}")
+            return row_number, key, issue_data, None, str(e), time.perf_counter() - start
+        return row_number, key, issue_data, issue_key, None, time.perf_counter() - start
+
+    # 일괄 행은 공유 스케줄러의 batch 레인으로 실행
+    scheduler = IssueScheduler(lambda: backend, workers=workers, name='batch')
+    try:
+        futures = [scheduler.submit(lambda backend, item=item: create(backend, *item), BATCH)
+                   for item in pending]
+        for future in as_completed(futures):
+            row_number, key, issue_data, issue_key, error, elapsed = future.result()
+            summary = issue_data.get('summary', '')
+            if error is None:
+                counts['created'] += 1
+                checkpoint.record({'row': row_number, 'key': key, 'status': 'created',
+                                   'issue': issue_key, 'summary': summary})
+                progress.emit('row', row=row_number, status='created', issue=issue_key,
+                              summary=summary, elapsed=round(elapsed, 3))
+            else:
+                counts['failed'] += 1
+                progress.emit('row', row=row_number, status='failed', error=error,
+                              summary=summary, elapsed=round(elapsed, 3))
+    finally:
+        scheduler.shutdown(cancel_pending=True)
+
+    progress.emit('done', **counts)
+    return counts
+
+
+def main(argv=None) -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(prog='python -m batch_cli', description='엑셀/CSV/JSONL 일괄 이슈 생성 (GUI 없음)')
+    parser.add_argument('input', help='입력 파일 (.xlsx, .csv, .jsonl)')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='browser', help='이슈 생성 방식 (기본: browser)')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 실행 수 (browser는 항상 1)')
+    parser.add_argument('--checkpoint', help='체크포인트 파일 (성공한 행은 다시 실행 시 건너뜀)')
+    parser.add_argument('--dry-run', action='store_true', help='입력 읽기와 검증만 하고 생성하지 않음')
+    parser.add_argument('--no-validate', action='store_true', help='생성 전 행 검증을 건너뜀')
+    parser.add_argument('--refresh-metadata', action='store_true',
+                        help='검증 전에 JIRA REST로 필드 허용 값 캐시를 갱신')
+    parser.add_argument('--log-level', default='INFO', help='stderr 로그 레벨')
+    parser.add_argument('--log-file', help='JSON Lines 로그 파일 (크기 기준 회전, 기본: 기록 안 함)')
+    args = parser.parse_args(argv)
+
+    # 로그는 stderr(텍스트)와 --log-file(JSON Lines)로, 쓰기는 별도 스레드에서
+    setup_logging(getattr(logging, args.log_level.upper(), logging.INFO), log_file=args.log_file, stream=sys.stderr)
+    if args.concurrency < 1:
+        parser.error('--concurrency는 1 이상이어야 합니다')
+    if not os.path.exists(args.input):
+        parser.error(f'입력 파일이 없습니다: {args.input}')
+
+    progress = ProgressWriter()
+    if args.refresh_metadata:
+        from jira_rest import JiraRestClient, JiraRestError
+
+        client = JiraRestClient()
+        try:
+            client.refresh_field_options()
+        except (ImportError, OSError, JiraRestError) as e:
+            logger.warning(f"필드 허용 값 캐시 갱신 실패 (기존 캐시로 검증): {e}")
+        finally:
+            client.close()
+    try:
+        counts = run_batch(args.input, args.backend, args.concurrency, args.checkpoint, args.dry_run, progress,
+                           validate=not args.no_validate)
+    except (OSError, ValueError, BackendUnavailableError) as e:
+        progress.emit('error', error=str(e))
+        return 2
+    return 1 if counts['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
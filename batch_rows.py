@@ -0,0 +1,307 @@
+"""
+일괄 실행 입력 행 모듈 (PyQt5 없이 사용)
+엑셀/CSV/JSONL 입력을 한 행씩 읽어 JIRA 이슈 데이터로 변환합니다.
+GUI의 엑셀 일괄 실행과 batch_cli가 같은 변환 규칙을 사용합니다.
+"""
+import csv
+import functools
+import json
+import os
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from description_templates import get_template_library
+from text_rules import get_text_replacer
+
+# 입력 헤더 -> 이슈 필드
+ISSUE_COLUMNS = {
+    'Summary': 'summary',
+    'Team': 'team',
+    'Linked Issues': 'linkedIssues',
+    'Issue': 'issue',
+    'Parent': 'parent',
+    'Reviewer': 'reviewer',
+    'Branch': 'branch',
+    'Build': 'build',
+    'Fix Version': 'fixversion',
+    'Component': 'component',
+    'Label': 'label',
+    'Priority': 'priority',
+    'Severity': 'severity',
+    'Prevalence': 'prevalence',
+    'Repro Rate': 'repro_rate',
+    'Steps': 'steps',
+    'Description': 'description',
+}
+# 설명이 비어 있을 때 사용할 템플릿 이름 열
+TEMPLATE_COLUMN = 'Template'
+
+# 이슈 필드 -> 추가로 인식할 헤더 (한글/복수형 등, 대소문자와 공백/_/- 는 구분하지 않음)
+HEADER_ALIASES = {
+    'summary': ['요약', '제목'],
+    'team': ['팀'],
+    'linkedIssues': ['Linked Issue', 'Link Type', '연결 유형', '링크'],
+    'issue': ['Issue Key', '연결 이슈', '이슈'],
+    'parent': ['Parent Issue', '상위 이슈', '상위'],
+    'reviewer': ['리뷰어', '검토자'],
+    'branch': ['Branches', '브랜치'],
+    'build': ['Builds', '빌드'],
+    'fixversion': ['Fix Versions', 'Fix Version/s', '수정 버전'],
+    'component': ['Components', 'Component/s', '컴포넌트'],
+    'label': ['Labels', '레이블', '라벨'],
+    'priority': ['우선순위'],
+    'severity': ['심각도'],
+    'prevalence': ['발생 범위', '영향 범위'],
+    'repro_rate': ['Reproduction Rate', '재현율', '재현 빈도'],
+    'steps': ['Steps to Reproduce', '재현 단계', '재현 방법'],
+    'description': ['설명', '내용'],
+    TEMPLATE_COLUMN: ['템플릿'],
+}
+# 알고 있지만 이슈 데이터로 쓰지 않는 열 (엑셀 추출 파일의 생성시간 등)
+IGNORED_COLUMNS = ['생성시간', 'Created']
+# 없으면 일괄 실행을 시작하지 않는 필드
+REQUIRED_FIELDS = ('summary',)
+
+ISSUE_FIELDS = tuple(ISSUE_COLUMNS.values())
+
+
+def normalize_header(header: Any) -> str:
+    """헤더 비교용 키 (대소문자, 공백/_/- 무시)"""
+    return re.sub(r'[\s_\-]+', '', str(header)).casefold()
+
+
+def _build_header_lookup() -> Dict[str, Optional[str]]:
+    lookup: Dict[str, Optional[str]] = {normalize_header(header): None for header in IGNORED_COLUMNS}
+    for header, field in ISSUE_COLUMNS.items():
+        lookup[normalize_header(header)] = field
+    lookup[normalize_header(TEMPLATE_COLUMN)] = TEMPLATE_COLUMN
+    for field, aliases in HEADER_ALIASES.items():
+        for alias in aliases:
+            lookup.setdefault(normalize_header(alias), field)
+    return lookup
+
+
+# 정규화한 헤더 -> 이슈 필드 (None: 무시하는 열)
+_HEADER_LOOKUP = _build_header_lookup()
+
+
+class HeaderMapping:
+    """
+    헤더 행을 한 번 컴파일한 열 번호 -> 필드 매핑
+
+    행마다 헤더 dict를 만들지 않고 필요한 열만 바로 읽습니다.
+    """
+
+    __slots__ = ('columns', 'template_index', 'unknown', 'missing', 'duplicates')
+
+    def __init__(self, headers: Sequence[Any]):
+        positions: Dict[str, int] = {}
+        self.unknown: List[str] = []
+        self.duplicates: List[str] = []
+        for index, header in enumerate(headers):
+            if header is None or str(header).strip() == '':
+                continue
+            key = normalize_header(header)
+            if key not in _HEADER_LOOKUP:
+                self.unknown.append(str(header))
+                continue
+            field = _HEADER_LOOKUP[key]
+            if field is None:
+                continue
+            if field in positions:
+                self.duplicates.append(str(header))  # 같은 필드가 여러 열이면 마지막 열 사용
+            positions[field] = index
+
+        self.template_index: Optional[int] = positions.pop(TEMPLATE_COLUMN, None)
+        self.columns: Tuple[Tuple[int, str], ...] = tuple(sorted(
+            ((index, field) for field, index in positions.items()), key=lambda item: item[0]
+        ))
+        self.missing: List[str] = [field for field in ISSUE_FIELDS if field not in positions]
+
+    @property
+    def missing_required(self) -> List[str]:
+        return [field for field in REQUIRED_FIELDS if field in self.missing]
+
+    def problems(self) -> List[str]:
+        """사용자에게 알릴 헤더 문제 (없으면 빈 목록)"""
+        messages = []
+        if self.missing_required:
+            messages.append(f"필수 열 없음: {', '.join(self.missing_required)}")
+        if self.unknown:
+            messages.append(f"알 수 없는 열 (무시): {', '.join(self.unknown)}")
+        if self.duplicates:
+            messages.append(f"중복 열 (마지막 열 사용): {', '.join(self.duplicates)}")
+        return messages
+
+    def fields(self, row_data: Sequence[Any]) -> Dict[str, str]:
+        """입력 열 값만 읽은 이슈 데이터 (설명 자동 생성 전)"""
+        issue_data = dict.fromkeys(ISSUE_FIELDS, '')
+        size = len(row_data)
+        for index, field in self.columns:
+            if index < size:
+                value = row_data[index]
+                if value is not None:
+                    issue_data[field] = value if isinstance(value, str) else str(value)
+        return issue_data
+
+    def template_name(self, row_data: Sequence[Any]) -> str:
+        """Template 열 값 (열이 없으면 빈 문자열)"""
+        if self.template_index is not None and self.template_index < len(row_data):
+            return str(row_data[self.template_index] or '')
+        return ''
+
+    def fill_description(self, fields: Dict[str, str], row_data: Sequence[Any]) -> Dict[str, str]:
+        """설명이 비어 있으면 요약으로 템플릿 생성 (Template 열이 없으면 기본값 템플릿, fields는 그대로 둠)"""
+        issue_data = dict(fields)
+        if not issue_data['description'].strip() and issue_data['summary'].strip():
+            summary = issue_data['summary']
+            issue_data['description'] = get_template_library().render(
+                self.template_name(row_data),
+                main_text=summary,
+                expected_text=get_text_replacer().apply(summary),
+                build_text=issue_data['build'],
+            )
+        return issue_data
+
+    def parse(self, row_data: Sequence[Any]) -> Dict[str, str]:
+        """입력 행 데이터를 JIRA 이슈 데이터로 변환"""
+        return self.fill_description(self.fields(row_data), row_data)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_headers(headers: Tuple[Any, ...]) -> HeaderMapping:
+    return HeaderMapping(headers)
+
+
+def compile_headers(headers: Sequence[Any]) -> HeaderMapping:
+    """헤더 행 컴파일 (같은 헤더는 재사용, JSONL처럼 레코드마다 헤더가 달라도 캐시됨)"""
+    return _compile_headers(tuple(headers))
+
+
+def parse_issue_row(headers: Sequence[Any], row_data: Sequence[Any]) -> Dict[str, str]:
+    """입력 행 데이터를 JIRA 이슈 데이터로 변환"""
+    return compile_headers(headers).parse(row_data)
+
+
+# (엑셀 기준 행 번호, 헤더, 행 데이터)
+RowRecord = Tuple[int, Sequence[Any], Sequence[Any]]
+
+
+def _iter_xlsx(path: str) -> Iterator[RowRecord]:
+    import openpyxl
+
+    # read_only: 시트 전체를 셀 객체로 올리지 않고 XML을 순서대로 읽음
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        headers = next(rows, None)
+        if headers is None:
+            return
+        for row_number, row in enumerate(rows, 2):
+            yield row_number, headers, row
+    finally:
+        wb.close()
+
+
+def _iter_csv(path: str) -> Iterator[RowRecord]:
+    # utf-8-sig: 엑셀에서 저장한 CSV의 BOM 제거
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        for row_number, row in enumerate(reader, 2):
+            yield row_number, headers, row
+
+
+def _iter_jsonl(path: str) -> Iterator[RowRecord]:
+    # 레코드마다 자기 키를 헤더로 사용 (전체 키 목록을 미리 모으지 않음)
+    row_number = 1
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{line_number}: JSON 객체가 아닙니다")
+            row_number += 1
+            yield row_number, tuple(record), tuple(record.values())
+
+
+# 확장자 -> 행 읽기 함수 (파일을 한 번에 읽지 않고 행을 하나씩 내보냄)
+ROW_SOURCES: Dict[str, Callable[[str], Iterator[RowRecord]]] = {
+    '.xlsx': _iter_xlsx,
+    '.csv': _iter_csv,
+    '.jsonl': _iter_jsonl,
+}
+
+
+def register_row_source(extension: str, reader: Callable[[str], Iterator[RowRecord]]):
+    """입력 형식 추가 (예: '.tsv'). reader(path)는 (행 번호, 헤더, 행 데이터)를 순회"""
+    ROW_SOURCES[extension.lower()] = reader
+
+
+def iter_rows(path: str) -> Iterator[RowRecord]:
+    """
+    입력 파일의 (행 번호, 헤더, 행 데이터) 순회 (헤더는 1행)
+
+    Raises:
+        ValueError: 지원하지 않는 확장자
+    """
+    ext = os.path.splitext(path)[1].lower()
+    reader = ROW_SOURCES.get(ext)
+    if reader is None:
+        raise ValueError(f"지원하지 않는 입력 형식입니다: {path} ({', '.join(ROW_SOURCES)})")
+    return reader(path)
+
+
+def is_blank_row(row_data: Sequence[Any]) -> bool:
+    """모든 셀이 비어 있는 행인지"""
+    return all(value is None or str(value).strip() == '' for value in row_data)
+
+
+def count_rows(path: str) -> int:
+    """빈 행을 제외한 데이터 행 수 (행을 이슈 데이터로 변환하지 않음)"""
+    return sum(1 for _, _, row_data in iter_rows(path) if not is_blank_row(row_data))
+
+
+def inspect_headers(path: str) -> HeaderMapping:
+    """
+    첫 행 기준 헤더 매핑 (실행 전에 알 수 없는/없는 열을 알리기 위해 사용)
+
+    데이터 행이 없으면 빈 헤더로 컴파일합니다.
+    """
+    rows = iter_rows(path)
+    try:
+        for _, headers, _ in rows:
+            return compile_headers(headers)
+    finally:
+        rows.close()
+    return compile_headers(())
+
+
+def iter_issue_records(path: str) -> Iterator[Tuple[int, Dict[str, str], Dict[str, str]]]:
+    """
+    (엑셀 기준 행 번호, 입력 값, 이슈 데이터) 순회 (빈 행은 건너뜀)
+
+    입력 값은 설명 자동 생성 전 열 값(+ Template 열)이라, 템플릿/규칙 팩 파일이
+    바뀌어도 같은 행이면 같습니다 (체크포인트 키 등에 사용).
+    """
+    headers, mapping = None, None
+    for row_number, row_headers, row_data in iter_rows(path):
+        if is_blank_row(row_data):
+            continue
+        # 헤더가 같은 객체면 다시 컴파일하지 않음 (xlsx/CSV는 파일 전체에서 하나)
+        if row_headers is not headers:
+            headers, mapping = row_headers, compile_headers(row_headers)
+        fields = mapping.fields(row_data)
+        input_data = dict(fields)
+        if mapping.template_index is not None:
+            input_data[TEMPLATE_COLUMN] = mapping.template_name(row_data)
+        yield row_number, input_data, mapping.fill_description(fields, row_data)
+
+
+def iter_issue_rows(path: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """(엑셀 기준 행 번호, 이슈 데이터) 순회 (빈 행은 건너뜀)"""
+    for row_number, _, issue_data in iter_issue_records(path):
+        yield row_number, issue_data
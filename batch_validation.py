@@ -0,0 +1,215 @@
+"""
+일괄 실행 사전 검증 모듈 (PyQt5 없이 사용)
+브라우저/REST 작업을 시작하기 전에 모든 행을 드롭다운 값 목록
+(DropdownOptions, 옵션 파일, 캐시된 JIRA 필드 허용 값)과 비교해 행별 오류 보고서를 만듭니다.
+
+- 오류(error): 생성해도 실패하거나 잘못된 값이 들어가는 행 (실행에서 제외)
+- 경고(warning): 처음 보는 값처럼 확인이 필요하지만 실행은 가능한 행
+"""
+import difflib
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from batch_rows import HeaderMapping, compile_headers, is_blank_row, iter_rows
+from config import DropdownOptions, OPTIONS_FILES
+from jira_rest import LINK_TYPES, MULTI_VALUE_FIELDS
+
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*-\d+$')
+
+# 브라우저에서 포함 검색으로 선택하는 필드 (값 일부만 써도 선택됨, 예: 'Major' -> '2 - Major')
+PARTIAL_MATCH_FIELDS = {'priority', 'severity', 'prevalence', 'repro_rate'}
+
+ERROR = 'error'
+WARNING = 'warning'
+
+
+class ValidationIssue(NamedTuple):
+    """행 하나의 검증 결과 항목"""
+    row: int
+    field: str
+    value: str
+    message: str
+    severity: str = ERROR
+
+
+class FieldDomain:
+    """필드 허용 값 목록"""
+
+    __slots__ = ('field', 'values', 'strict', 'source', '_lookup', '_suggestions')
+
+    def __init__(self, field: str, values: Iterable[str], strict: bool, source: str):
+        self.field = field
+        self.values = [value for value in values if value]
+        self.strict = strict  # False면 목록에 없어도 경고만 (옵션 파일처럼 사용 이력인 경우)
+        self.source = source
+        self._lookup = {value.casefold(): value for value in self.values}
+        self._suggestions: Dict[str, List[str]] = {}  # 같은 오타가 여러 행에 반복되는 경우가 많음
+
+    def _accepts(self, token: str) -> bool:
+        key = token.casefold()
+        if key in self._lookup:
+            return True
+        if self.field in PARTIAL_MATCH_FIELDS:
+            return any(key in value for value in self._lookup)
+        return False
+
+    def suggest(self, token: str) -> List[str]:
+        """비슷한 허용 값 (최대 3개)"""
+        key = token.casefold()
+        if key not in self._suggestions:
+            matches = difflib.get_close_matches(key, list(self._lookup), n=3, cutoff=0.6)
+            self._suggestions[key] = [self._lookup[match] for match in matches]
+        return self._suggestions[key]
+
+    def unknown_tokens(self, value: str) -> List[str]:
+        """허용 값 목록에 없는 값 (여러 값 필드는 공백으로 나눠 확인)"""
+        if self._accepts(value):
+            return []
+        tokens = value.split() if self.field in MULTI_VALUE_FIELDS else [value]
+        return [token for token in tokens if not self._accepts(token)]
+
+
+def build_domains(options_manager=None,
+                  field_options: Optional[Dict[str, List[str]]] = None) -> Dict[str, FieldDomain]:
+    """
+    필드별 허용 값 목록 구성
+
+    Args:
+        options_manager: 옵션 파일(branch/build/fixversion/component) 사용 이력 (None이면 사용 안 함)
+        field_options: 캐시된 JIRA 필드 허용 값 (jira_rest.load_cached_field_options), 있으면 우선
+    """
+    domains = {
+        'priority': FieldDomain('priority', DropdownOptions.PRIORITY_OPTIONS, True, 'DropdownOptions'),
+        'severity': FieldDomain('severity', DropdownOptions.SEVERITY_OPTIONS, True, 'DropdownOptions'),
+        'prevalence': FieldDomain('prevalence', DropdownOptions.PREVALENCE_OPTIONS, True, 'DropdownOptions'),
+        'repro_rate': FieldDomain('repro_rate', DropdownOptions.REPRO_RATE_OPTIONS, True, 'DropdownOptions'),
+        'linkedIssues': FieldDomain('linkedIssues', LINK_TYPES, False, 'LINK_TYPES'),
+    }
+    if options_manager is not None:
+        for field_name, options_file in OPTIONS_FILES.items():
+            values = options_manager.load_options(field_name, options_file)
+            if values:
+                domains[field_name] = FieldDomain(field_name, values, False, options_file)
+    for field_name, values in (field_options or {}).items():
+        if values:
+            domains[field_name] = FieldDomain(field_name, values, True, 'JIRA')
+    return domains
+
+
+def validate_issue(row_number: int, issue_data: Dict[str, str],
+                   domains: Dict[str, FieldDomain]) -> List[ValidationIssue]:
+    """이슈 데이터 한 행 검증"""
+    issues = []
+
+    def value(name: str) -> str:
+        return str(issue_data.get(name, '') or '').strip()
+
+    if not value('summary'):
+        issues.append(ValidationIssue(row_number, 'summary', '', "요약이 비어 있습니다"))
+    if value('linkedIssues') and not value('issue'):
+        issues.append(ValidationIssue(row_number, 'issue', '', "Linked Issues가 있지만 연결할 Issue가 없습니다"))
+    for field_name in ('issue', 'parent'):
+        if value(field_name) and not ISSUE_KEY_PATTERN.match(value(field_name)):
+            issues.append(ValidationIssue(row_number, field_name, value(field_name),
+                                          "이슈 키 형식이 아닙니다 (예: P2-12345)", WARNING))
+
+    for field_name, domain in domains.items():
+        field_value = value(field_name)
+        if not field_value:
+            continue
+        for token in domain.unknown_tokens(field_value):
+            message = f"{domain.source}에 없는 값"
+            suggestions = domain.suggest(token)
+            if suggestions:
+                message += f" (추천: {', '.join(suggestions)})"
+            issues.append(ValidationIssue(row_number, field_name, token, message,
+                                          ERROR if domain.strict else WARNING))
+    return issues
+
+
+class ValidationReport:
+    """행별 검증 결과"""
+
+    def __init__(self, issues: List[ValidationIssue], rows_checked: int):
+        self.issues = issues
+        self.rows_checked = rows_checked
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == WARNING]
+
+    @property
+    def error_rows(self) -> Set[int]:
+        """오류가 있어 실행에서 제외할 행 번호"""
+        return {issue.row for issue in self.issues if issue.severity == ERROR}
+
+    def by_row(self) -> Dict[int, List[ValidationIssue]]:
+        rows: Dict[int, List[ValidationIssue]] = {}
+        for issue in self.issues:
+            rows.setdefault(issue.row, []).append(issue)
+        return rows
+
+    def format(self, limit: int = 20, include_warnings: bool = True) -> str:
+        """사용자에게 보여줄 보고서 (행 번호순, 최대 limit줄)"""
+        lines = []
+        for issue in sorted(self.issues, key=lambda item: (item.row, item.severity != ERROR)):
+            if issue.severity != ERROR and not include_warnings:
+                continue
+            mark = '❌' if issue.severity == ERROR else '⚠'
+            shown = f" '{issue.value}'" if issue.value else ''
+            lines.append(f"{mark} 행 {issue.row}: {issue.field}{shown} - {issue.message}")
+        if len(lines) > limit:
+            lines = lines[:limit] + [f"... 외 {len(lines) - limit}건"]
+        return '\n'.join(lines)
+
+
+def validate_rows(rows: Iterable[Tuple[int, Dict[str, str]]],
+                  domains: Dict[str, FieldDomain]) -> ValidationReport:
+    """(행 번호, 이슈 데이터) 전체 검증"""
+    issues: List[ValidationIssue] = []
+    count = 0
+    for row_number, issue_data in rows:
+        count += 1
+        issues.extend(validate_issue(row_number, issue_data, domains))
+    return ValidationReport(issues, count)
+
+
+class BatchPlan(NamedTuple):
+    """일괄 실행 전 입력 파일 확인 결과"""
+    headers: HeaderMapping  # 첫 행 기준 헤더 매핑
+    rows: int  # 빈 행을 제외한 데이터 행 수
+    report: ValidationReport  # 필수 열이 없으면 검증하지 않은 빈 보고서
+
+
+def prepare_batch(path: str, domains: Dict[str, FieldDomain]) -> BatchPlan:
+    """
+    입력 파일을 한 번만 읽어 헤더 확인, 행 수 계산, 사전 검증을 함께 수행
+
+    검증은 설명을 보지 않으므로 템플릿을 렌더링하지 않고 입력 열 값(HeaderMapping.fields)만 씁니다.
+    큰 시트는 읽는 데 시간이 걸리므로 GUI는 작업 스레드에서 호출합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 입력 형식
+    """
+    first: Optional[HeaderMapping] = None
+    count = 0
+    issues: List[ValidationIssue] = []
+    headers, mapping = None, None
+    for row_number, row_headers, row_data in iter_rows(path):
+        if first is None:
+            first = compile_headers(row_headers)
+        if is_blank_row(row_data):
+            continue
+        count += 1
+        if first.missing_required:
+            continue  # 실행하지 않으므로 행 수만 셈
+        if row_headers is not headers:
+            headers, mapping = row_headers, compile_headers(row_headers)
+        issues.extend(validate_issue(row_number, mapping.fields(row_data), domains))
+    if first is None:
+        first = compile_headers(())
+    return BatchPlan(first, count, ValidationReport(issues, 0 if first.missing_required else count))
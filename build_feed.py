@@ -0,0 +1,180 @@
+"""
+빌드명 피드 가져오기 모듈
+빌드 매니페스트 파일(또는 폴더 안의 파일들)에 새로 추가된 줄만 읽어
+build 옵션 목록에 백그라운드로 반영합니다.
+
+- 파일별로 읽은 위치(바이트 오프셋)를 BUILD_FEED_STATE_FILE에 저장하므로
+  재시작해도 이미 가져온(또는 정리된) 빌드를 다시 넣지 않습니다.
+  위치는 옵션에 반영한 뒤에만 저장하므로 반영이 실패하면 다음 확인 때 다시 읽습니다.
+- 파일이 교체(회전)되거나 새로 작성되면 처음부터 다시 읽습니다.
+  (inode가 바뀌었거나, 크기가 줄었거나, 이미 읽은 앞부분 내용이 달라진 경우)
+- 아직 줄바꿈이 없는 마지막 줄은 다음 확인 때 읽습니다.
+
+사용법:
+    JIRAAUTO_BUILD_FEED=\\\\server\\builds\\manifest.txt 로 경로 지정
+"""
+import hashlib
+import os
+import re
+import threading
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import (
+    BUILD_FEED_PATH, BUILD_FEED_INTERVAL, BUILD_FEED_NAME_PATTERN, BUILD_FEED_STATE_FILE, OPTIONS_FILES
+)
+from utils import OptionsManager, get_settings_store
+
+logger = logging.getLogger(__name__)
+
+# 새로 작성 여부 비교에 쓰는 파일 앞부분 크기
+HEAD_BYTES = 256
+
+
+class BuildFeedImporter:
+    """빌드 매니페스트를 tail 하여 build 옵션에 동기화"""
+
+    def __init__(self, options_manager: OptionsManager, path: str = BUILD_FEED_PATH,
+                 field_name: str = 'build', options_file: Optional[str] = None,
+                 interval: float = BUILD_FEED_INTERVAL, name_pattern: Optional[str] = BUILD_FEED_NAME_PATTERN,
+                 state_file: str = BUILD_FEED_STATE_FILE):
+        self.options_manager = options_manager
+        self.path = path
+        self.field_name = field_name
+        self.options_file = options_file or OPTIONS_FILES[field_name]
+        self.interval = interval
+        self.name_pattern = re.compile(name_pattern) if name_pattern else None
+        self._state_store = get_settings_store(state_file)
+        # 파일별 {'offset': 읽은 위치, 'inode': st_ino, 'head': 앞부분 해시}
+        self._offsets: Dict[str, Dict[str, Any]] = {
+            key: state if isinstance(state, dict) else {'offset': state}  # 이전 형식(오프셋만)
+            for key, state in (self._state_store.get() or {}).items()
+        }
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[List[str]], None]):
+        """새 빌드가 추가되면 호출 (백그라운드 스레드에서 호출됨)"""
+        self._listeners.append(callback)
+
+    def _manifest_files(self) -> List[str]:
+        if os.path.isdir(self.path):
+            with os.scandir(self.path) as entries:
+                return sorted(entry.path for entry in entries
+                              if entry.is_file() and not entry.name.startswith('.'))
+        if os.path.isfile(self.path):
+            return [self.path]
+        return []
+
+    def _extract_name(self, line: str) -> Optional[str]:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            return None
+        if self.name_pattern is None:
+            return line
+        match = self.name_pattern.search(line)
+        if match is None:
+            return None
+        return match.group(1) if match.groups() else match.group(0)
+
+    @staticmethod
+    def _head_digest(f, length: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+    def _read_new_lines(self, path: str) -> Tuple[List[str], Optional[Dict[str, Any]]]:
+        """
+        지난번 위치 이후의 완성된 줄만 읽음 (위치는 갱신하지 않음)
+
+        Returns:
+            (줄 목록, 반영 후 저장할 파일 상태 또는 변경 없으면 None)
+        """
+        key = os.path.abspath(path)
+        state = self._offsets.get(key, {})
+        offset = state.get('offset', 0)
+
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            # 네트워크 드라이브 등 inode를 주지 않는 환경(0)에서는 앞부분 비교로만 판단
+            rewritten = size < offset or (stat.st_ino and state.get('inode') not in (None, stat.st_ino))
+            if not rewritten and offset and 'head' in state:
+                rewritten = self._head_digest(f, min(offset, HEAD_BYTES)) != state['head']
+            if rewritten:
+                logger.info(f"빌드 매니페스트가 교체/새로 작성됨, 처음부터 읽음: {path}")
+                offset = 0
+            if size == offset:
+                return [], None
+
+            f.seek(offset)
+            chunk = f.read(size - offset)
+            end = chunk.rfind(b'\n')
+            if end < 0:
+                return [], None
+            new_offset = offset + end + 1
+            head = self._head_digest(f, min(new_offset, HEAD_BYTES))
+
+        lines = chunk[:end].decode('utf-8', errors='replace').splitlines()
+        return lines, {'offset': new_offset, 'inode': stat.st_ino, 'head': head}
+
+    def poll(self) -> List[str]:
+        """
+        매니페스트를 한 번 확인해 새 빌드명을 옵션에 추가
+
+        Returns:
+            새로 추가된 빌드명 목록
+        """
+        with self._lock:
+            names = []
+            pending: Dict[str, Dict[str, Any]] = {}
+            for path in self._manifest_files():
+                try:
+                    lines, state = self._read_new_lines(path)
+                except OSError as e:
+                    logger.warning(f"빌드 매니페스트 읽기 실패 {path}: {e}")
+                    continue
+                if state is not None:
+                    pending[os.path.abspath(path)] = state
+                names.extend(name for name in map(self._extract_name, lines) if name)
+
+            # 옵션 반영이 실패(예외)하면 위치를 저장하지 않아 다음 확인 때 다시 읽음
+            added = self.options_manager.import_options(self.field_name, self.options_file, names) if names else []
+            if pending:
+                self._offsets.update(pending)
+                self._state_store.set(self._offsets)
+
+        if added:
+            logger.info(f"빌드 피드에서 {len(added)}개 빌드 추가: {added[-1]}")
+            for callback in self._listeners:
+                try:
+                    callback(added)
+                except Exception as e:
+                    logger.warning(f"빌드 피드 알림 실패: {e}")
+        return added
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"빌드 피드 확인 실패: {e}")
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """백그라운드 확인 시작"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='build-feed', daemon=True)
+        self._thread.start()
+        logger.info(f"빌드 피드 감시 시작: {self.path} ({self.interval}초 간격)")
+
+    def stop(self):
+        """백그라운드 확인 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        self._state_store.flush()
@@ -1,6 +1,7 @@
 """
 설정 상수 및 기본값들을 관리하는 모듈
 """
+import functools
 import os
 from typing import Dict, List
 
@@ -8,6 +9,8 @@ from typing import Dict, List
 DIR_PRESET = 'preset'
 DIR_CHROME_TEMP = r"C:\ChromeTEMP"
 DIR_RESULT = 'result'
+DIR_TEMPLATES = 'templates'  # 설명 템플릿 (파일명 = 생성 옵션 이름)
+DEFAULT_TEMPLATE_NAME = '기본값'
 
 # Chrome 실행 파일 경로 (여러 경로 시도)
 CHROME_POSSIBLE_PATHS = [
@@ -16,8 +19,9 @@ CHROME_POSSIBLE_PATHS = [
     r'C:\Users\{username}\AppData\Local\Google\Chrome\Application\chrome.exe'
 ]
 
+@functools.lru_cache(maxsize=None)
 def get_chrome_executable_path():
-    """Chrome 실행 파일 경로를 찾아서 반환"""
+    """Chrome 실행 파일 경로를 찾아서 반환 (처음 호출할 때 한 번만 파일 시스템 확인)"""
     import os
     import getpass
     
@@ -38,7 +42,12 @@ def get_chrome_executable_path():
     # 기본값 반환 (첫 번째 경로)
     return paths_to_try[0]
 
-CHROME_EXECUTABLE_PATH = get_chrome_executable_path()
+
+def __getattr__(name):
+    # CHROME_EXECUTABLE_PATH는 처음 사용할 때 찾음 (import 시 파일 시스템 확인 방지)
+    if name == 'CHROME_EXECUTABLE_PATH':
+        return get_chrome_executable_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Chrome 디버깅 설정
 CHROME_DEBUG_PORT = 9222
@@ -51,9 +60,51 @@ SETTINGS_FILE = f'{DIR_PRESET}/settings.json'
 EXCEL_EXPORT_FILE = f'{DIR_RESULT}/bug_reports.xlsx'
 APP_SETTINGS_FILE = f'{DIR_PRESET}/app_settings.json'
 
+# 로그 파일: JSON Lines, LOG_MAX_BYTES를 넘으면 .1, .2 ... 로 회전 (log_pipeline)
+LOG_FILE = 'jira_auto.jsonl'
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# 프리셋 저장 방식: 'directory' (버전별 JSON 파일) 또는 'sqlite' (단일 DB 파일)
+PRESET_STORE = os.environ.get('JIRAAUTO_PRESET_STORE', 'directory')
+PRESET_DB_FILE = f'{DIR_PRESET}/presets.db'
+
+# 프리셋 버전 델타 저장: N번째 버전마다 전체 스냅샷, 나머지는 이전 버전 대비 변경분만 저장
+PRESET_SNAPSHOT_INTERVAL = 10
+# 메모리에 유지할 복원된 프리셋 버전 수 (LRU)
+PRESET_CACHE_SIZE = 64
+
 # JIRA 설정
 JIRA_BASE_URL = "https://jira.krafton.com/secure/Dashboard.jspa"
 
+# JIRA REST API 설정 (batch_cli --backend rest)
+class JiraRestConfig:
+    """JIRA REST API 이슈 생성 설정"""
+    BASE_URL = os.environ.get('JIRAAUTO_JIRA_URL', 'https://jira.krafton.com')
+    TOKEN_ENV = 'JIRAAUTO_JIRA_TOKEN'  # 개인 액세스 토큰(Bearer)을 읽을 환경 변수 이름
+    PROJECT_KEY = os.environ.get('JIRAAUTO_JIRA_PROJECT', 'P2')
+    ISSUE_TYPE = 'Bug'
+    TIMEOUT = 30  # 요청 타임아웃 (초)
+    ASSIGN_TO_ME = True  # 브라우저 방식의 'Assign to me'와 동일
+    
+    # 사이트별 커스텀 필드: 이슈 필드 -> (필드 ID, 값 형식)
+    # 값 형식: 'text' | 'option' | 'options' | 'labels' | 'user'
+    # JIRAAUTO_JIRA_FIELDS 환경 변수(JSON)로 덮어쓸 수 있으며, 매핑이 없는 필드는 건너뜁니다.
+    CUSTOM_FIELDS: Dict[str, List[str]] = {}
+    
+    # 재시도: 429/5xx/연결 오류는 지수 백오프 + 지터로 재시도 (429는 Retry-After 이상 대기)
+    MAX_ATTEMPTS = 4  # 첫 시도 포함
+    RETRY_BASE_DELAY = 1.0  # 초
+    RETRY_MAX_DELAY = 60.0  # 초
+    
+    # 동시 실행 한도 (AIMD): INITIAL에서 시작해 --concurrency까지 늘리고, 지연/429/5xx 시 절반으로
+    INITIAL_CONCURRENCY = 2
+    LATENCY_TARGET = 5.0  # 이보다 느린 응답은 부하 신호로 봄 (초)
+    
+    # 필드별 허용 값 캐시 (createmeta 조회 결과, 일괄 실행 사전 검증에 사용)
+    FIELD_OPTIONS_FILE = f'{DIR_PRESET}/jira_field_options.json'
+    FIELD_OPTIONS_MAX_AGE = 7 * 24 * 3600  # 이보다 오래된 캐시는 사용하지 않음 (초)
+
 # XPath 상수들
 class JiraXPaths:
     """JIRA 웹페이지의 XPath들을 관리하는 클래스"""
@@ -120,6 +171,21 @@ OPTIONS_FILES = {
     'fixversion': 'fixversion_options.json',
     'component': 'component_options.json'
 }
+# 필드별로 유지할 최대 옵션 수 (초과 시 가장 오래 쓰지 않은 항목부터 제거)
+OPTIONS_MAX_COUNT = 200
+# 옵션 순위: 사용 횟수 x 최근성 가중치 (반감기 일수)
+OPTIONS_RECENCY_HALF_LIFE_DAYS = 14
+# 필드별 오래된 옵션 정리 기준 (마지막 사용 후 일수, 최대 개수)
+OPTIONS_PRUNE_RULES = {
+    'build': {'max_age_days': 60, 'max_count': 100},
+}
+
+# 빌드명 피드: 빌드 매니페스트 파일(또는 폴더)에 추가되는 줄을 build 옵션으로 가져옴 (비어 있으면 사용 안 함)
+BUILD_FEED_PATH = os.environ.get('JIRAAUTO_BUILD_FEED', '')
+BUILD_FEED_INTERVAL = 30  # 확인 주기 (초)
+# 줄에서 빌드명을 뽑는 정규식 (첫 번째 그룹 또는 전체 일치, None이면 줄 전체)
+BUILD_FEED_NAME_PATTERN = None
+BUILD_FEED_STATE_FILE = f'{DIR_PRESET}/build_feed_state.json'  # 파일별 읽은 위치 (다른 설정 파일과 같은 폴더)
 
 # AI 설정
 class AIConfig:
@@ -135,12 +201,37 @@ class AIConfig:
         "llama3.1:8b"      # 고성능 모델 (~4.7GB, RAM ~10GB)
     ]
     
-    # AI 생성에 사용할 preset 예시 개수
-    MAX_EXAMPLE_PRESETS = 5
+    # AI 생성에 사용할 preset 예시 개수 (유사도 상위 N개)
+    MAX_EXAMPLE_PRESETS = 2
+    
+    # 프롬프트에 넣을 예시 전체의 토큰 예산 (num_ctx 2048 기준)
+    EXAMPLE_TOKEN_BUDGET = 400
+    
+    # 예시로 사용할 최소 유사도 (0~1, 문자 n-gram TF-IDF 코사인)
+    EXAMPLE_MIN_SIMILARITY = 0.1
     
-    # AI 생성 타임아웃 (초)
+    # AI 생성 타임아웃 (초) - 각 백엔드의 요청 타임아웃 기본값
     GENERATION_TIMEOUT = 60
     
+    # LLM 백엔드 ('ollama' | 'openai' | 'stub')
+    BACKEND = os.environ.get('JIRAAUTO_LLM_BACKEND', 'ollama')
+    
+    # Ollama 서버 주소
+    OLLAMA_HOST = os.environ.get('OLLAMA_HOST', 'http://127.0.0.1:11434')
+    
+    # OpenAI 호환 서버 (llama.cpp server, vLLM 등 공용 GPU 추론 서버)
+    OPENAI_BASE_URL = os.environ.get('JIRAAUTO_LLM_BASE_URL', 'http://127.0.0.1:8080/v1')
+    OPENAI_API_KEY_ENV = 'JIRAAUTO_LLM_API_KEY'  # API 키를 읽을 환경 변수 이름
+    
+    # 백엔드별 동시 요청 한도 (연결 풀 크기)
+    MAX_CONCURRENT_REQUESTS = 2
+    
+    # 취소 확인 간격 (초) - 첫 토큰 전(프롬프트 처리 중)에도 이 간격 안에 취소 반영
+    CANCEL_POLL_INTERVAL = 0.1
+    
+    # 마지막 AI 응답을 저장할 디버깅 파일 (None이면 저장하지 않음)
+    LAST_RESPONSE_FILE = 'last_ai_response.txt'
+    
     # AI 생성 기본 옵션
     TEMPERATURE = 0.7  # 창의성 조절 (0~1)
     TOP_P = 0.9
@@ -153,6 +244,9 @@ class Timeouts:
     MEDIUM_WAIT = 1.5
     CHROME_START_WAIT = 2
     DROPDOWN_RETRY = 3
+    DROPDOWN_RETRY_BASE_DELAY = 0.2  # 드롭다운 재시도 대기 (지수 백오프 + 지터)
+    DROPDOWN_RETRY_MAX_DELAY = 2.0
+    ROW_ATTEMPTS = 2  # 일괄 실행에서 브라우저 오류가 난 행을 새 탭에서 다시 시도하는 횟수 (첫 시도 포함)
 
 # 스타일시트
 DARK_THEME_STYLE = """
@@ -244,3 +338,6 @@ TEXT_REPLACEMENT_RULES = [
     ('불가한 현상', '가능해야 합니다.'),
     ('\n', '')  # 줄바꿈 제거
 ]
+
+# 사용자 규칙 팩 폴더 ({"원문": "대체문"} JSON 파일들, 기본 규칙에 덧붙임)
+TEXT_RULE_PACK_DIR = 'rule_packs'
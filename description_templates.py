@@ -0,0 +1,157 @@
+"""
+설명(Description) 템플릿 모듈
+templates 폴더의 마크다운 파일(파일명 = 생성 옵션 이름)을 읽어 렌더 함수로 한 번만 컴파일하고,
+파일이 바뀌면 다음 사용 시 다시 읽습니다.
+
+템플릿 문법: {{main_text}}, {{expected_text}}, {{build_text}} 자리표시자
+(Jira 마크업의 {color:...} 같은 한 겹 중괄호는 그대로 출력됩니다)
+파일 끝의 줄바꿈 하나는 제거합니다.
+"""
+import os
+import re
+import threading
+import time
+import logging
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from config import DIR_TEMPLATES, DEFAULT_TEMPLATE_NAME, DropdownOptions
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_EXTENSIONS = ('.md', '.txt')
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+# 템플릿 폴더가 없을 때(단일 exe 배포 등) 사용하는 기본 템플릿
+BUILTIN_DEFAULT_TEMPLATE = """**Observed(관찰 결과):**
+* {{main_text}}을 확인합니다.
+
+**Video(영상):**
+* 영상을 첨부 중입니다.
+
+**Expected (기대 결과):**
+* {{expected_text}}
+
+**Note(참고):**
+* 작성 중입니다."""
+
+RenderFunc = Callable[[Mapping[str, str]], str]
+
+
+def compile_template(text: str) -> RenderFunc:
+    """
+    템플릿 문자열을 렌더 함수로 컴파일
+
+    문자열을 고정 조각과 자리표시자로 한 번만 나눠 두고, 렌더할 때는 join만 합니다.
+    없는 자리표시자는 빈 문자열로 채웁니다.
+    """
+    parts = PLACEHOLDER_PATTERN.split(text)
+    literals = parts[0::2]
+    fields = parts[1::2]
+    if not fields:
+        return lambda context: text
+
+    def render(context: Mapping[str, str]) -> str:
+        get = context.get
+        pieces = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            pieces.append(str(get(field, '')))
+            pieces.append(literal)
+        return ''.join(pieces)
+
+    return render
+
+
+class TemplateLibrary:
+    """템플릿 폴더의 컴파일된 템플릿 모음 (변경 시 자동 재로드)"""
+
+    def __init__(self, template_dir: str = DIR_TEMPLATES, check_interval: float = 1.0):
+        self.template_dir = template_dir
+        self.check_interval = check_interval
+        self._templates: Dict[str, RenderFunc] = {}
+        self._stamps: Dict[str, Tuple[float, int]] = {}  # 파일 경로 -> (mtime, 크기)
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self.generation = 0  # 다시 읽을 때마다 증가
+
+    def _scan(self) -> Dict[str, Tuple[float, int]]:
+        if not os.path.isdir(self.template_dir):
+            return {}
+        with os.scandir(self.template_dir) as entries:
+            return {
+                entry.path: (entry.stat().st_mtime, entry.stat().st_size)
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(TEMPLATE_EXTENSIONS)
+            }
+
+    def _load(self, stamps: Dict[str, Tuple[float, int]]):
+        templates = {}
+        for path in sorted(stamps):
+            name = os.path.splitext(os.path.basename(path))[0]
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except OSError as e:
+                logger.warning(f"템플릿 '{path}' 로드 실패: {e}")
+                continue
+            if text.endswith('\n'):
+                text = text[:-1]
+            templates[name] = compile_template(text)
+        templates.setdefault(DEFAULT_TEMPLATE_NAME, compile_template(BUILTIN_DEFAULT_TEMPLATE))
+        self._templates = templates
+        self._stamps = stamps
+        self.generation += 1
+        logger.info(f"설명 템플릿 {len(templates)}개 로드: {self.template_dir}")
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        템플릿 파일이 바뀌었으면 다시 읽음 (check_interval 안에서는 확인 생략)
+
+        Returns:
+            다시 읽었으면 True
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not force and self._templates and now - self._last_check < self.check_interval:
+                return False
+            self._last_check = now
+            stamps = self._scan()
+            if self._templates and stamps == self._stamps:
+                return False
+            self._load(stamps)
+            return True
+
+    def names(self) -> List[str]:
+        """템플릿 이름 목록 (기본값, GENERATE_OPTIONS 순서, 나머지 이름순)"""
+        self.refresh()
+        order = {DEFAULT_TEMPLATE_NAME: -1}
+        order.update((name, i) for i, name in enumerate(DropdownOptions.GENERATE_OPTIONS)
+                     if name != DEFAULT_TEMPLATE_NAME)
+        return sorted(self._templates, key=lambda name: (order.get(name, len(order)), name))
+
+    def get(self, name: str) -> RenderFunc:
+        """이름에 해당하는 렌더 함수 (없으면 기본 템플릿)"""
+        self.refresh()
+        templates = self._templates
+        return templates.get(name) or templates[DEFAULT_TEMPLATE_NAME]
+
+    def render(self, name: str, **context: str) -> str:
+        """템플릿 하나 렌더링"""
+        return self.get(name)(context)
+
+    def render_many(self, name: str, contexts: Iterable[Mapping[str, str]]) -> List[str]:
+        """같은 템플릿으로 여러 행 렌더링 (재로드 확인은 한 번만)"""
+        render = self.get(name)
+        return [render(context) for context in contexts]
+
+
+_library: Optional[TemplateLibrary] = None
+_library_lock = threading.Lock()
+
+
+def get_template_library() -> TemplateLibrary:
+    """공유 TemplateLibrary (GUI와 엑셀 일괄 실행이 같은 컴파일 결과 사용)"""
+    global _library
+    with _library_lock:
+        if _library is None:
+            _library = TemplateLibrary()
+        return _library
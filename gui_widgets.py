@@ -2,16 +2,18 @@
 GUI 위젯들과 레이아웃을 관리하는 모듈
 """
 import os
-from typing import Dict, Any, Callable
+import difflib
+from typing import Dict, Any, Callable, List, Tuple, Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QTextEdit, QComboBox, QPushButton, QCheckBox, QMenuBar, QAction,
-    QDialog, QDialogButtonBox
+    QDialog, QDialogButtonBox, QCompleter
 )
-from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtCore import Qt, QUrl, QAbstractListModel, QModelIndex, QStringListModel
 from PyQt5.QtGui import QDesktopServices, QIcon
 
 from config import DropdownOptions, FIELD_NAMES, COMBO_FIELD_NAMES, OPTIONS_FILES
+from description_templates import get_template_library
 
 
 class ComboFieldWithButtons:
@@ -59,9 +61,33 @@ class ComboFieldWithButtons:
         parent_layout.addLayout(self.layout)
         return self.widget
     
+    @property
+    def options_file(self) -> str:
+        return OPTIONS_FILES.get(self.field_name, f'{self.field_name}_options.json')
+    
     def set_options_manager(self, options_manager):
         """옵션 매니저 설정"""
         self.options_manager = options_manager
+        self._setup_completer()
+    
+    def _setup_completer(self):
+        """입력 중 자동완성 (접두어 일치 먼저, 사용 빈도/최근성 순)"""
+        self._completion_model = QStringListModel(self.widget)
+        completer = QCompleter(self._completion_model, self.widget)
+        # 후보는 옵션 인덱스가 이미 골랐으므로 QCompleter가 다시 거르지 않도록 함
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.setMaxVisibleItems(15)
+        self.widget.setCompleter(completer)
+        self.widget.lineEdit().textEdited.connect(self._on_text_edited)
+    
+    def _on_text_edited(self, text: str):
+        """입력할 때마다 자동완성 후보 갱신"""
+        if not self.options_manager or not text.strip():
+            return
+        matches = self.options_manager.complete_options(self.field_name, self.options_file, text)
+        self._completion_model.setStringList(matches)
+        if matches:
+            self.widget.completer().complete()
     
     def add_option(self):
         """현재 텍스트를 옵션으로 추가"""
@@ -70,13 +96,17 @@ class ComboFieldWithButtons:
             
         current_text = self.widget.currentText().strip()
         if current_text:
-            options_file = OPTIONS_FILES.get(self.field_name, f'{self.field_name}_options.json')
-            success = self.options_manager.add_option(self.field_name, options_file, current_text)
+            success = self.options_manager.add_option(self.field_name, self.options_file, current_text)
             if success:
-                # 콤보박스 새로고침
-                self.refresh_options()
+                # 전체를 다시 채우지 않고 새 항목만 맨 앞에 삽입
+                index = self.widget.findText(current_text, Qt.MatchExactly)
+                if index >= 0:
+                    self.widget.removeItem(index)
+                self.widget.insertItem(0, current_text)
+                while self.widget.count() > self.options_manager.max_options:
+                    self.widget.removeItem(self.widget.count() - 1)
                 # 추가된 항목을 선택
-                self.widget.setCurrentText(current_text)
+                self.widget.setCurrentIndex(0)
     
     def remove_option(self):
         """현재 선택된 옵션 삭제"""
@@ -85,19 +115,19 @@ class ComboFieldWithButtons:
             
         current_text = self.widget.currentText().strip()
         if current_text:
-            options_file = OPTIONS_FILES.get(self.field_name, f'{self.field_name}_options.json')
-            success = self.options_manager.remove_option(self.field_name, options_file, current_text)
+            success = self.options_manager.remove_option(self.field_name, self.options_file, current_text)
             if success:
-                # 콤보박스 새로고침
-                self.refresh_options()
+                index = self.widget.findText(current_text, Qt.MatchExactly)
+                if index >= 0:
+                    self.widget.removeItem(index)
+                self.widget.setCurrentText(current_text)
     
     def refresh_options(self):
-        """옵션 목록 새로고침"""
+        """옵션 목록 새로고침 (메모리에 있는 목록 사용)"""
         if not self.options_manager:
             return
             
-        options_file = OPTIONS_FILES.get(self.field_name, f'{self.field_name}_options.json')
-        options = self.options_manager.load_options(self.field_name, options_file)
+        options = self.options_manager.load_options(self.field_name, self.options_file)
         
         current_text = self.widget.currentText()
         self.widget.clear()
@@ -228,6 +258,111 @@ class ComboFieldWidget:
         return self.widget
 
 
+class PresetListModel(QAbstractListModel):
+    """
+    프리셋 콤보박스용 목록 모델
+
+    - set_items()는 기존 목록과 비교해 바뀐 행만 삽입/삭제 (선택 항목 유지, 위젯 재생성 없음)
+    - 행은 FETCH_BATCH 단위로 필요할 때 로드 (canFetchMore/fetchMore)
+    - 각 행의 키(prefix, name, 파일명)는 Qt.UserRole로 조회
+    """
+
+    FETCH_BATCH = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Tuple[str, str]] = []  # (키, 표시 문자열)
+        self._loaded = 0  # 뷰에 노출된 행 수
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        key, label = self._items[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return label
+        if role == Qt.UserRole:
+            return key
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._items)
+
+    def fetchMore(self, parent=QModelIndex()):
+        self._fetch_to(self._loaded + self.FETCH_BATCH)
+
+    def _fetch_to(self, count: int):
+        """count개 행까지 노출"""
+        count = min(count, len(self._items))
+        if count > self._loaded:
+            self.beginInsertRows(QModelIndex(), self._loaded, count - 1)
+            self._loaded = count
+            self.endInsertRows()
+
+    def keys(self) -> List[str]:
+        """전체 키 목록 (아직 로드되지 않은 행 포함)"""
+        return [key for key, _ in self._items]
+
+    def index_of(self, key: str) -> int:
+        """키의 행 번호 (필요하면 해당 행까지 로드, 없으면 -1)"""
+        for row, (item_key, _) in enumerate(self._items):
+            if item_key == key:
+                self._fetch_to(row + 1)
+                return row
+        return -1
+
+    def set_items(self, items: List[Tuple[str, str]]):
+        """
+        목록 교체 - 바뀐 구간만 행 삽입/삭제 신호를 보냄
+
+        Args:
+            items: (키, 표시 문자열) 목록
+        """
+        old_keys = self.keys()
+        new_keys = [key for key, _ in items]
+        if old_keys != new_keys:
+            matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+            # 뒤에서부터 적용해야 앞쪽 행 번호가 바뀌지 않음
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag in ('replace', 'delete'):
+                    self._remove_rows(i1, i2)
+                if tag in ('replace', 'insert'):
+                    self._insert_rows(i1, items[j1:j2])
+
+        # 키는 같고 표시 문자열만 바뀐 행
+        for row, item in enumerate(items):
+            if self._items[row] != item:
+                self._items[row] = item
+                if row < self._loaded:
+                    index = self.index(row)
+                    self.dataChanged.emit(index, index)
+
+        # 콤보박스가 현재 항목을 보여줄 수 있도록 첫 묶음은 항상 로드
+        self._fetch_to(self.FETCH_BATCH)
+
+    def _remove_rows(self, start: int, end: int):
+        visible_end = min(end, self._loaded)
+        if start < visible_end:
+            self.beginRemoveRows(QModelIndex(), start, visible_end - 1)
+            del self._items[start:end]
+            self._loaded -= visible_end - start
+            self.endRemoveRows()
+        else:
+            del self._items[start:end]
+
+    def _insert_rows(self, start: int, items: List[Tuple[str, str]]):
+        if start < self._loaded:
+            self.beginInsertRows(QModelIndex(), start, start + len(items) - 1)
+            self._items[start:start] = items
+            self._loaded += len(items)
+            self.endInsertRows()
+        else:
+            # 아직 로드되지 않은 구간 - fetchMore 때 노출
+            self._items[start:start] = items
+
+
 class PresetWidget:
     """프리셋 위젯을 관리하는 클래스"""
     
@@ -237,6 +372,7 @@ class PresetWidget:
         self.version_combo = None  # 새로 추가: 버전별 선택
         self.preset_line = None
         self.sort_combo = None
+        self.search_line = None
         self.buttons = {}
         
     def create_preset_section(self, parent_layout: QVBoxLayout) -> Dict[str, QWidget]:
@@ -253,7 +389,12 @@ class PresetWidget:
         self.sort_combo.addItems(['최신순', '이름순'])
         self.sort_combo.setFixedWidth(80)
         sort_layout.addWidget(self.sort_combo)
-        sort_layout.addStretch()
+        
+        # 프리셋 검색 (파일명/요약, 오타 허용)
+        self.search_line = QLineEdit()
+        self.search_line.setPlaceholderText('🔍 프리셋 검색 (이름/요약)')
+        self.search_line.setClearButtonEnabled(True)
+        sort_layout.addWidget(self.search_line)
         
         parent_layout.addLayout(sort_layout)
         
@@ -266,6 +407,7 @@ class PresetWidget:
         preset_layout.addWidget(prefix_label)
         
         self.prefix_combo = QComboBox()
+        self.prefix_combo.setModel(PresetListModel(self.prefix_combo))
         self.prefix_combo.setFixedWidth(120)
         preset_layout.addWidget(self.prefix_combo)
         
@@ -275,6 +417,7 @@ class PresetWidget:
         preset_layout.addWidget(name_label)
         
         self.name_combo = QComboBox()
+        self.name_combo.setModel(PresetListModel(self.name_combo))
         self.name_combo.setFixedWidth(150)
         preset_layout.addWidget(self.name_combo)
         
@@ -284,6 +427,7 @@ class PresetWidget:
         preset_layout.addWidget(version_label)
         
         self.version_combo = QComboBox()
+        self.version_combo.setModel(PresetListModel(self.version_combo))
         self.version_combo.setFixedWidth(80)
         preset_layout.addWidget(self.version_combo)
         
@@ -311,6 +455,7 @@ class PresetWidget:
             'version_combo': self.version_combo,
             'preset_line': self.preset_line,
             'sort_combo': self.sort_combo,
+            'search_line': self.search_line,
             'buttons': self.buttons
         }
     
@@ -369,7 +514,8 @@ class ActionButtonsWidget:
         generate_layout = QHBoxLayout()
         
         self.generate_combo = QComboBox()
-        self.generate_combo.addItems(DropdownOptions.GENERATE_OPTIONS)
+        # 생성 옵션 = templates 폴더의 템플릿 파일 이름
+        self.generate_combo.addItems(get_template_library().names())
         generate_layout.addWidget(self.generate_combo)
         
         generate_btn = QPushButton('Auto Generate')
@@ -499,7 +645,7 @@ class ExcelBatchWidget:
         
         # 설명
         info_label = QLabel(
-            "엑셀 파일(bug_reports.xlsx)의 각 행을 읽어서 순차적으로 JIRA 이슈를 생성합니다.\n"
+            "엑셀 파일(bug_reports.xlsx) 또는 CSV/JSONL 파일의 각 행을 읽어서 순차적으로 JIRA 이슈를 생성합니다.\n"
             "각 이슈는 최종 확인을 위해 생성 전까지만 진행되며, 수동으로 제출해야 합니다."
         )
         info_label.setWordWrap(True)
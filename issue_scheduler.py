@@ -0,0 +1,243 @@
+"""
+이슈 생성 스케줄러 모듈 (PyQt5 없이 사용)
+브라우저(Selenium)/REST 백엔드 하나를 공유하고, 이슈 생성 작업을 우선순위 순으로 실행합니다.
+
+- INTERACTIVE: 입력 폼의 Execute 같은 단건 생성 (대기 중인 일괄 행보다 먼저 실행)
+- BATCH: 엑셀/CLI 일괄 생성 행
+
+일괄 실행 중에 Execute를 눌러도 별도 드라이버 세션으로 Chrome 디버그 포트를
+다투지 않고, 같은 세션에서 다음 차례로 실행됩니다.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from config import JiraRestConfig, Timeouts
+from rate_control import AdaptiveLimiter, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# 작업 우선순위 (작을수록 먼저)
+INTERACTIVE = 0
+BATCH = 1
+LANE_NAMES = {INTERACTIVE: 'interactive', BATCH: 'batch'}
+
+
+class BrowserBackend:
+    """기존 Selenium 자동화 (Chrome 한 개를 공유하므로 한 번에 한 행씩)"""
+
+    max_concurrency = 1
+
+    def __init__(self):
+        from jira_automation import JiraAutomation
+
+        self.automation = JiraAutomation()
+        self.automation.start_driver()
+        self._lock = threading.Lock()
+        self._first = True
+        self._form_tab_open = False  # 현재 탭이 이번 시도에서 폼을 채우는 탭인지
+        # 페이지 로딩 지연 같은 일시적 브라우저 오류는 새 탭에서 다시 시도
+        self.retry_policy = RetryPolicy(Timeouts.ROW_ATTEMPTS, base_delay=Timeouts.MEDIUM_WAIT,
+                                        max_delay=Timeouts.IMPLICIT_WAIT)
+
+    def create_issue(self, issue_data: Dict[str, str]) -> Optional[str]:
+        with self._lock:
+            attempts = itertools.count()
+
+            def attempt():
+                if next(attempts):
+                    self._discard_failed_tab()
+                return self._create_in_new_tab(issue_data)
+
+            return self.retry_policy.call(
+                attempt,
+                is_retryable=self._is_retryable,
+                description=f"이슈 작성 ({issue_data.get('summary', '')[:30]})",
+            )
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        from selenium.common.exceptions import WebDriverException
+
+        return isinstance(error, WebDriverException)
+
+    def _discard_failed_tab(self):
+        # 사용자가 탭을 보고 직접 제출하므로, 반쯤 채운 폼이 남으면 중복/불완전 이슈가 생길 수 있음
+        # 실패한 시도가 폼을 채우던 탭만 닫고 다음 시도는 새 탭에서 진행 (이전 이슈 탭은 유지)
+        if self._form_tab_open:
+            self.automation.close_current_tab()
+            self._form_tab_open = False
+
+    def _create_in_new_tab(self, issue_data: Dict[str, str]) -> Optional[str]:
+        # 첫 이슈가 아니면 새 탭에서 진행 (생성한 탭은 확인/제출을 위해 남겨 둠)
+        self._form_tab_open = False
+        if not self._first:
+            self.automation.create_new_tab()
+            time.sleep(1)
+        self._first = False
+        self._form_tab_open = True
+        self.automation.create_issue(issue_data, pause_for_review=False)
+        time.sleep(1.5)
+        return None  # 브라우저 방식은 이슈 키를 알 수 없음
+
+    def close(self):
+        # 드라이버는 종료하지 않음 (브라우저에서 결과 확인 가능)
+        pass
+
+
+class RestBackend:
+    """JIRA REST API (동시 요청 수는 응답 지연/429에 맞춰 AIMD로 조절)"""
+
+    max_concurrency = 16
+
+    def __init__(self, concurrency: int = 1):
+        from jira_rest import JiraRestClient
+
+        self.limiter = AdaptiveLimiter(
+            initial=min(JiraRestConfig.INITIAL_CONCURRENCY, concurrency), maximum=concurrency,
+            latency_target=JiraRestConfig.LATENCY_TARGET,
+        )
+        self.client = JiraRestClient(max_connections=concurrency, limiter=self.limiter)
+
+    def create_issue(self, issue_data: Dict[str, str]) -> Optional[str]:
+        return self.client.create_issue(issue_data)
+
+    def close(self):
+        logger.info(f"REST 동시 요청 한도 최종값: {self.limiter.limit}")
+        self.client.close()
+
+
+# 백엔드 이름 -> 생성 함수(동시 실행 수)
+BACKENDS: Dict[str, Callable[[int], Any]] = {
+    'browser': lambda concurrency: BrowserBackend(),
+    'rest': lambda concurrency: RestBackend(concurrency),
+}
+
+
+class IssueScheduler:
+    """
+    공유 백엔드에서 이슈 생성 작업을 우선순위 순으로 실행하는 스케줄러
+
+    같은 우선순위 안에서는 들어온 순서대로 실행합니다. backend_factory는 첫 작업을
+    실행할 때 작업 스레드에서 호출되므로, GUI처럼 백엔드 클래스를 넘기면 selenium 등은
+    그때 import 됩니다. (CLI는 한도 확인/오류 보고를 위해 미리 만든 백엔드를 반환하는 함수를 넘김)
+    """
+
+    def __init__(self, backend_factory: Callable[[], Any], workers: int = 1, name: str = 'issue-scheduler'):
+        self._backend_factory = backend_factory
+        self._backend = None
+        self._backend_lock = threading.Lock()
+        self.workers = max(1, workers)
+        self.name = name
+        self._queue: List[tuple] = []  # (우선순위, 순번, Future, 작업)
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._shutdown = False
+
+    # ------------------------------------------------------------------
+    # 작업 추가/취소
+    # ------------------------------------------------------------------
+    def submit(self, fn: Callable[[Any], Any], priority: int = BATCH) -> Future:
+        """
+        작업 추가
+
+        Args:
+            fn: fn(backend) 형태의 작업
+            priority: INTERACTIVE 또는 BATCH
+
+        Returns:
+            작업 결과 Future
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("스케줄러가 종료되었습니다")
+            heapq.heappush(self._queue, (priority, next(self._counter), future, fn))
+            self._start_workers()
+            self._condition.notify()
+        return future
+
+    def create_issue(self, issue_data: Dict[str, str], priority: int = BATCH) -> Future:
+        """이슈 생성 작업 추가 (결과: 이슈 키, 브라우저 방식은 None)"""
+        return self.submit(lambda backend: backend.create_issue(issue_data), priority)
+
+    def cancel(self, priority: Optional[int] = None) -> int:
+        """대기 중인 작업 취소 (priority가 None이면 전체). 취소한 개수 반환"""
+        with self._condition:
+            kept, cancelled = [], 0
+            for item in self._queue:
+                if priority is None or item[0] == priority:
+                    item[2].cancel()
+                    cancelled += 1
+                else:
+                    kept.append(item)
+            heapq.heapify(kept)
+            self._queue = kept
+        if cancelled:
+            logger.info(f"대기 중인 {LANE_NAMES.get(priority, '전체')} 작업 {cancelled}개 취소")
+        return cancelled
+
+    def pending_count(self, priority: Optional[int] = None) -> int:
+        """대기 중인 작업 수"""
+        with self._condition:
+            return sum(1 for item in self._queue if priority is None or item[0] == priority)
+
+    # ------------------------------------------------------------------
+    # 작업 스레드
+    # ------------------------------------------------------------------
+    def _start_workers(self):
+        # _condition 안에서 호출
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f'{self.name}-{len(self._threads)}', daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _get_backend(self):
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    self._backend = self._backend_factory()
+        return self._backend
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return  # 종료
+                priority, _, future, fn = heapq.heappop(self._queue)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(self._get_backend())
+            except Exception as e:
+                logger.debug("%s 작업 실패: %s", LANE_NAMES.get(priority, priority), e)
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        스케줄러 종료 (cancel_pending이 False면 대기 중인 작업을 모두 실행한 뒤 종료)
+
+        wait가 True면 작업 스레드가 끝난 뒤 백엔드 close()를 호출합니다.
+        """
+        if cancel_pending:
+            self.cancel()
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if not wait:
+            return
+        for thread in threads:
+            thread.join()
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
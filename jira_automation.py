@@ -17,12 +17,12 @@ from selenium.webdriver.support import expected_conditions as EC
 import chromedriver_autoinstaller
 
 from config import (
-    CHROME_DEBUG_ADDRESS, CHROME_EXECUTABLE_PATH, DIR_CHROME_TEMP, 
+    CHROME_DEBUG_ADDRESS, DIR_CHROME_TEMP, get_chrome_executable_path,
     CHROME_DEBUG_PORT, JIRA_BASE_URL, JiraXPaths, Timeouts
 )
+from rate_control import RetryPolicy
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정은 실행 진입점(setup_logging)에서 (import 시 루트 로거를 건드리지 않음)
 logger = logging.getLogger(__name__)
 
 
@@ -36,10 +36,10 @@ class ChromeDriverManager:
             path = chromedriver_autoinstaller.install(True)
             if not path or not os.path.exists(path):
                 raise FileNotFoundError("ChromeDriver installation failed or not found.")
-            logger.info(f"✅ ChromeDriver installed at: {path}")
+            logger.info("✅ ChromeDriver installed at: %s", path)
             return path
         except Exception as e:
-            logger.error(f"❌ ChromeDriver 자동 설치 실패: {e}")
+            logger.error("❌ ChromeDriver 자동 설치 실패: %s", e)
             logger.error("크롬과 ChromeDriver가 올바르게 설치되어 있는지 확인하세요.")
             raise
 
@@ -58,22 +58,23 @@ class ChromeDriverManager:
         import os
         
         # Chrome 실행 파일 존재 확인
-        if not os.path.exists(CHROME_EXECUTABLE_PATH):
-            error_msg = (f"Chrome 실행 파일을 찾을 수 없습니다: {CHROME_EXECUTABLE_PATH}\n"
+        chrome_path = get_chrome_executable_path()
+        if not os.path.exists(chrome_path):
+            error_msg = (f"Chrome 실행 파일을 찾을 수 없습니다: {chrome_path}\n"
                         "Chrome이 설치되어 있는지 확인하세요.")
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         cmd = [
-            CHROME_EXECUTABLE_PATH,
+            chrome_path,
             f'--remote-debugging-port={CHROME_DEBUG_PORT}',
             f'--user-data-dir={DIR_CHROME_TEMP}'
         ]
         try:
             subprocess.Popen(cmd)
-            logger.info(f"Chrome 실행 성공: {CHROME_EXECUTABLE_PATH}")
+            logger.info("Chrome 실행 성공: %s", chrome_path)
         except Exception as e:
-            error_msg = f"Chrome 실행 실패: {e}\n경로: {CHROME_EXECUTABLE_PATH}"
+            error_msg = f"Chrome 실행 실패: {e}\n경로: {chrome_path}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
         
@@ -86,6 +87,8 @@ class JiraAutomation:
     def __init__(self):
         self.driver: Optional[webdriver.Chrome] = None
         self.chrome_manager = ChromeDriverManager()
+        self.dropdown_retry = RetryPolicy(Timeouts.DROPDOWN_RETRY, Timeouts.DROPDOWN_RETRY_BASE_DELAY,
+                                          Timeouts.DROPDOWN_RETRY_MAX_DELAY)
     
     def start_driver(self) -> webdriver.Chrome:
         """Chrome 드라이버를 시작하고 반환"""
@@ -103,7 +106,7 @@ class JiraAutomation:
             return driver
             
         except Exception as e:
-            logger.error(f"Chrome 드라이버 시작 실패: {e}")
+            logger.error("Chrome 드라이버 시작 실패: %s", e)
             raise
     
     def _connect_to_existing_chrome(self) -> webdriver.Chrome:
@@ -138,14 +141,14 @@ class JiraAutomation:
             self._fill_issue_form(issue_data)
             #이슈 생성 시간 측정
             end_time = time.time()
-            logger.info(f"이슈 생성 소요 시간: {end_time - start_time}초")
+            logger.info("이슈 생성 소요 시간: %.1f초", end_time - start_time)
             
             # 사용자 확인을 위해 일시정지 (옵션)
             if pause_for_review:
                 os.system("pause")
             
         except Exception as e:
-            logger.error(f"이슈 생성 중 오류 발생: {e}")
+            logger.error("이슈 생성 중 오류 발생: %s", e)
             raise
     
     def _navigate_to_jira(self):
@@ -266,10 +269,10 @@ class JiraAutomation:
             element.send_keys(value)
             time.sleep(Timeouts.MEDIUM_WAIT)
             element.send_keys(Keys.RETURN)
-            logger.info(f"✅ {value} (send_keys 방식 성공)")
+            logger.debug("✅ %s (send_keys 방식 성공)", value)
             found = True
         except Exception as e:
-            logger.warning(f"❌ {value} (send_keys 방식 실패, 드롭다운 클릭 방식 시도)")
+            logger.debug("❌ %s (send_keys 방식 실패, 드롭다운 클릭 방식 시도)", value)
         
         # 2. send_keys 실패 시 드롭다운 클릭 방식 반복 시도
         if not found:
@@ -282,7 +285,7 @@ class JiraAutomation:
                     # 이미 선택된 항목인지 확인 (대소문자 무시)
                     current_text = dropdown_element.text.strip().lower()
                     if current_text == value.lower():
-                        logger.info(f"✅ {value} (이미 선택됨)")
+                        logger.debug("✅ %s (이미 선택됨)", value)
                         found = True
                         break
                     
@@ -328,28 +331,29 @@ class JiraAutomation:
                         # JavaScript로 클릭 시도
                         self.driver.execute_script("arguments[0].click();", item_option)
                         found = True
-                        logger.info(f"✅ {value} (Dropdown - JS Click)")
+                        logger.debug("✅ %s (Dropdown - JS Click)", value)
                         break
                     except:
                         try:
                             # 일반 클릭 시도
                             item_option.click()
                             found = True
-                            logger.info(f"✅ {value} (Dropdown - Click)")
+                            logger.debug("✅ %s (Dropdown - Click)", value)
                             break
                         except:
                             # RETURN 키로 시도
                             dropdown_element.send_keys(Keys.RETURN)
                             found = True
-                            logger.info(f"✅ {value} (Dropdown - RETURN)")
+                            logger.debug("✅ %s (Dropdown - RETURN)", value)
                             break
                         
                 except Exception as e:
-                    logger.debug(f"시도 {attempt + 1}/{Timeouts.DROPDOWN_RETRY} 실패: {e}")
-                    time.sleep(0.3)
+                    logger.debug("시도 %d/%d 실패: %s", attempt + 1, Timeouts.DROPDOWN_RETRY, e)
+                    # 고정 간격 대신 지수 백오프 + 지터 (느린 페이지에는 점점 더 기다림)
+                    time.sleep(self.dropdown_retry.delay(attempt))
             
         if not found:
-            logger.warning(f"❌ {value} (드롭다운 항목을 선택할 수 없음)")
+            logger.warning("❌ %s (드롭다운 항목을 선택할 수 없음)", value)
             # 마지막으로 send_keys 방식 재시도
             try:
                 element = self.driver.find_element(By.XPATH, dropdown_xpath)
@@ -358,9 +362,9 @@ class JiraAutomation:
                 element.send_keys(value)
                 time.sleep(Timeouts.MEDIUM_WAIT)
                 element.send_keys(Keys.RETURN)
-                logger.info(f"✅ {value} (send_keys 방식 재시도 성공)")
+                logger.info("✅ %s (send_keys 방식 재시도 성공)", value)
             except Exception as e:
-                logger.error(f"❌ {value} (드롭다운 항목 선택 최종 실패: {e})")
+                logger.error("❌ %s (드롭다운 항목 선택 최종 실패: %s)", value, e)
     
     def close(self):
         """드라이버 종료"""
@@ -380,7 +384,7 @@ class JiraAutomation:
                 else:
                     self.driver = None
             except Exception as e:
-                logger.error(f"탭 닫기 실패: {e}")
+                logger.error("탭 닫기 실패: %s", e)
     
     def create_new_tab(self):
         """새 탭을 생성하고 전환"""
@@ -392,7 +396,7 @@ class JiraAutomation:
                 new_tab = self.driver.window_handles[-1]
                 self.driver.switch_to.window(new_tab)
             except Exception as e:
-                logger.error(f"새 탭 생성 실패: {e}")
+                logger.error("새 탭 생성 실패: %s", e)
                 raise
 
 
@@ -429,6 +433,9 @@ def create_issue(summary: str, linkedIssues: str, issue: str, parent: str,
 
 
 if __name__ == "__main__":
+    from log_pipeline import setup_logging
+
+    setup_logging()
     # 예제 사용법
     example_data = {
         'summary': "App crashes when clicking the login button",
@@ -0,0 +1,338 @@
+"""
+JIRA REST API 이슈 생성 모듈
+브라우저 없이 /rest/api/2/issue 로 이슈를 만듭니다 (batch_cli --backend rest).
+
+브라우저 방식과 같은 이슈 데이터(dict)를 받으며, 사이트마다 다른 커스텀 필드
+(team, branch, build, severity 등)는 JiraRestConfig.CUSTOM_FIELDS 매핑을 따릅니다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import JiraRestConfig
+from rate_control import CONGESTED, NEUTRAL, AdaptiveLimiter, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# 'Linked Issues' 값(브라우저 드롭다운 문구) -> (링크 유형 이름, 방향)
+LINK_TYPES = {
+    'relates to': ('Relates', 'outward'),
+    'blocks': ('Blocks', 'outward'),
+    'is blocked by': ('Blocks', 'inward'),
+    'duplicates': ('Duplicate', 'outward'),
+    'is duplicated by': ('Duplicate', 'inward'),
+    'clones': ('Cloners', 'outward'),
+    'is cloned by': ('Cloners', 'inward'),
+}
+
+# 브라우저 방식에서 공백으로 여러 값을 입력하는 필드
+MULTI_VALUE_FIELDS = {'branch', 'build', 'fixversion', 'component', 'label'}
+
+
+# 잠시 후 다시 요청하면 성공할 수 있는 응답 코드
+RETRYABLE_STATUS = {429, 502, 503, 504}
+# 이슈 생성(POST)은 서버가 요청을 처리하지 않았다고 확실한 경우만 재시도 (중복 생성 방지)
+RETRYABLE_STATUS_NON_IDEMPOTENT = {429, 503}
+
+
+class JiraRestError(RuntimeError):
+    """JIRA REST API 오류 응답"""
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"JIRA REST 오류 ({status_code}): {message}")
+        self.status_code = status_code
+        self.retry_after = retry_after  # Retry-After 헤더 (초)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) -> 대기 초"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    from email.utils import parsedate_to_datetime  # HTTP 날짜 형식은 드물어서 필요할 때 import
+
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+# 요청을 보내기 전(연결 단계)에 실패했음을 나타내는 requests/urllib3 예외 이름
+_NOT_SENT_ERRORS = {'ConnectTimeout', 'ConnectTimeoutError', 'NewConnectionError'}
+
+
+def _request_not_sent(error: BaseException) -> bool:
+    """
+    연결을 맺지 못해 요청이 서버에 전달되지 않은 실패인지
+
+    requests.ConnectionError는 본문 전송 뒤 연결이 끊긴 경우(RemoteDisconnected 등)에도 발생하므로
+    감싼 원인(args[0] -> MaxRetryError.reason, __cause__)까지 따라가 연결 단계 실패만 찾습니다.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if any(cls.__name__ in _NOT_SENT_ERRORS for cls in type(current).__mro__):
+            return True
+        reason = getattr(current, 'reason', None)
+        wrapped = current.args[0] if current.args else None
+        current = next((candidate for candidate in (reason, wrapped, current.__cause__)
+                        if isinstance(candidate, BaseException)), None)
+    return False
+
+
+def is_transient(error: Exception, idempotent: bool = True) -> bool:
+    """다시 시도할 만한 실패인지 (429/5xx, 연결 실패)"""
+    if isinstance(error, JiraRestError):
+        return error.status_code in (RETRYABLE_STATUS if idempotent else RETRYABLE_STATUS_NON_IDEMPOTENT)
+    if isinstance(error, OSError):  # requests 예외(ConnectionError, Timeout)도 OSError
+        # POST는 연결 자체가 안 된 경우만 (전송 후 끊김/응답 대기 중 타임아웃은 이미 처리되었을 수 있음)
+        return idempotent or _request_not_sent(error)
+    return False
+
+
+def congestion_signal(error: Exception) -> str:
+    """동시 실행 한도 조절용 신호 (입력 오류 같은 4xx는 부하와 무관)"""
+    if isinstance(error, JiraRestError):
+        return CONGESTED if error.status_code in RETRYABLE_STATUS or error.status_code >= 500 else NEUTRAL
+    return CONGESTED if isinstance(error, OSError) else NEUTRAL
+
+
+def load_custom_fields() -> Dict[str, List[str]]:
+    """커스텀 필드 매핑 (JIRAAUTO_JIRA_FIELDS 환경 변수가 있으면 덮어씀)"""
+    fields = dict(JiraRestConfig.CUSTOM_FIELDS)
+    override = os.environ.get('JIRAAUTO_JIRA_FIELDS', '')
+    if override:
+        try:
+            fields.update(json.loads(override))
+        except json.JSONDecodeError as e:
+            logger.warning(f"JIRAAUTO_JIRA_FIELDS 파싱 실패: {e}")
+    return fields
+
+
+def load_cached_field_options(path: Optional[str] = None,
+                              max_age: Optional[float] = None) -> Dict[str, List[str]]:
+    """
+    캐시된 필드별 허용 값 (없거나 오래되었으면 빈 dict)
+
+    캐시는 batch_cli --refresh-metadata (JiraRestClient.refresh_field_options)로 만듭니다.
+    """
+    path = path or JiraRestConfig.FIELD_OPTIONS_FILE
+    max_age = JiraRestConfig.FIELD_OPTIONS_MAX_AGE if max_age is None else max_age
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"필드 허용 값 캐시를 읽지 못했습니다: {path} ({e})")
+        return {}
+    age = time.time() - cache.get('fetched_at', 0)
+    if age > max_age:
+        logger.info(f"필드 허용 값 캐시가 오래되어 사용하지 않습니다: {path} ({age / 86400:.1f}일 전)")
+        return {}
+    return cache.get('fields', {})
+
+
+def _split(value: str, field_name: str) -> List[str]:
+    return value.split() if field_name in MULTI_VALUE_FIELDS else [value]
+
+
+def _custom_value(kind: str, value: str, field_name: str) -> Any:
+    if kind == 'option':
+        return {'value': value}
+    if kind == 'options':
+        return [{'value': v} for v in _split(value, field_name)]
+    if kind == 'labels':
+        return _split(value, field_name)
+    if kind == 'user':
+        return {'name': value}
+    return value
+
+
+class JiraRestClient:
+    """JIRA REST API 클라이언트 (여러 스레드에서 공유 가능)"""
+
+    def __init__(self, base_url: Optional[str] = None, token: Optional[str] = None,
+                 project_key: Optional[str] = None, timeout: Optional[float] = None,
+                 max_connections: int = 4, custom_fields: Optional[Dict[str, List[str]]] = None,
+                 retry_policy: Optional[RetryPolicy] = None, limiter: Optional[AdaptiveLimiter] = None):
+        self.base_url = (base_url or JiraRestConfig.BASE_URL).rstrip('/')
+        self.token = token if token is not None else os.environ.get(JiraRestConfig.TOKEN_ENV, '')
+        self.project_key = project_key or JiraRestConfig.PROJECT_KEY
+        self.timeout = timeout or JiraRestConfig.TIMEOUT
+        self.max_connections = max_connections
+        self.custom_fields = load_custom_fields() if custom_fields is None else custom_fields
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._myself: Optional[str] = None
+        self._warned_fields = set()
+        self.retry_policy = retry_policy or RetryPolicy(
+            JiraRestConfig.MAX_ATTEMPTS, JiraRestConfig.RETRY_BASE_DELAY, JiraRestConfig.RETRY_MAX_DELAY
+        )
+        self.limiter = limiter  # 여러 스레드에서 공유할 때 동시 요청 수 조절 (None이면 제한 없음)
+
+    def _get_session(self):
+        """동시 실행 수만큼 연결을 유지하는 requests.Session을 지연 생성"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers['Accept'] = 'application/json'
+                    if self.token:
+                        session.headers['Authorization'] = f'Bearer {self.token}'
+                    self._session = session
+        return self._session
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        """요청 (일시적 실패는 백오프 후 재시도, POST는 중복 생성이 없는 경우만)"""
+        return self.retry_policy.call(
+            lambda: self._send(method, path, **kwargs),
+            is_retryable=lambda e: is_transient(e, idempotent=method != 'POST'),
+            retry_after=lambda e: getattr(e, 'retry_after', None),
+            description=f"{method} {path}",
+        )
+
+    def _send(self, method: str, path: str, **kwargs) -> Any:
+        if self.limiter is None:
+            return self._send_once(method, path, **kwargs)
+        with self.limiter.slot(congestion_signal):
+            return self._send_once(method, path, **kwargs)
+
+    def _send_once(self, method: str, path: str, **kwargs) -> Any:
+        response = self._get_session().request(method, f'{self.base_url}{path}', timeout=self.timeout, **kwargs)
+        if response.status_code >= 400:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if response.status_code == 429 and self.limiter is not None:
+                # 계정 단위 제한: 다른 스레드의 새 요청도 함께 멈춤
+                self.limiter.pause(retry_after if retry_after is not None else self.retry_policy.base_delay)
+            raise JiraRestError(response.status_code, self._error_message(response), retry_after)
+        return response.json() if response.content else None
+
+    @staticmethod
+    def _error_message(response) -> str:
+        try:
+            body = response.json()
+        except ValueError:
+            return response.text[:300]
+        messages = list(body.get('errorMessages', []))
+        messages.extend(f"{field}: {message}" for field, message in body.get('errors', {}).items())
+        return '; '.join(messages) or response.text[:300]
+
+    def myself(self) -> str:
+        """토큰 사용자 이름 (최초 1회 조회)"""
+        if self._myself is None:
+            self._myself = self._request('GET', '/rest/api/2/myself').get('name', '')
+        return self._myself
+
+    def build_payload(self, issue_data: Dict[str, str]) -> Dict[str, Any]:
+        """이슈 데이터 -> /rest/api/2/issue 요청 본문"""
+        def value(name: str) -> str:
+            return str(issue_data.get(name, '') or '').strip()
+
+        fields: Dict[str, Any] = {
+            'project': {'key': self.project_key},
+            'issuetype': {'name': JiraRestConfig.ISSUE_TYPE},
+            'summary': value('summary'),
+        }
+        if value('description'):
+            fields['description'] = value('description')
+        if value('priority'):
+            fields['priority'] = {'name': value('priority')}
+        if value('component'):
+            fields['components'] = [{'name': v} for v in value('component').split()]
+        if value('fixversion'):
+            fields['fixVersions'] = [{'name': v} for v in value('fixversion').split()]
+        if value('label'):
+            fields['labels'] = value('label').split()
+        if JiraRestConfig.ASSIGN_TO_ME:
+            fields['assignee'] = {'name': self.myself()}
+
+        for field_name in ('team', 'reviewer', 'branch', 'build', 'severity', 'prevalence',
+                           'repro_rate', 'steps', 'parent'):
+            if not value(field_name):
+                continue
+            mapping = self.custom_fields.get(field_name)
+            if not mapping:
+                if field_name not in self._warned_fields:
+                    self._warned_fields.add(field_name)
+                    logger.warning(f"'{field_name}' 커스텀 필드 매핑이 없어 건너뜁니다 (JIRAAUTO_JIRA_FIELDS)")
+                continue
+            field_id, kind = mapping
+            fields[field_id] = _custom_value(kind, value(field_name), field_name)
+
+        payload: Dict[str, Any] = {'fields': fields}
+        if value('linkedIssues') and value('issue'):
+            link_name, direction = LINK_TYPES.get(value('linkedIssues').lower(), (value('linkedIssues'), 'outward'))
+            target = 'outwardIssue' if direction == 'outward' else 'inwardIssue'
+            payload['update'] = {'issuelinks': [
+                {'add': {'type': {'name': link_name}, target: {'key': value('issue')}}}
+            ]}
+        return payload
+
+    def fetch_field_options(self) -> Dict[str, List[str]]:
+        """이슈 생성 화면의 필드별 허용 값 (createmeta, 이슈 필드 이름 기준)"""
+        result = self._request('GET', '/rest/api/2/issue/createmeta', params={
+            'projectKeys': self.project_key,
+            'issuetypeNames': JiraRestConfig.ISSUE_TYPE,
+            'expand': 'projects.issuetypes.fields',
+        })
+        projects = result.get('projects') or [{}]
+        issue_types = projects[0].get('issuetypes') or [{}]
+        meta_fields = issue_types[0].get('fields', {})
+
+        field_ids = {'priority': 'priority', 'component': 'components', 'fixversion': 'fixVersions'}
+        for field_name, mapping in self.custom_fields.items():
+            field_ids.setdefault(field_name, mapping[0])
+
+        options: Dict[str, List[str]] = {}
+        for field_name, field_id in field_ids.items():
+            allowed = meta_fields.get(field_id, {}).get('allowedValues')
+            if allowed:
+                options[field_name] = [item.get('name') or item.get('value') for item in allowed
+                                       if item.get('name') or item.get('value')]
+        return options
+
+    def refresh_field_options(self, path: Optional[str] = None) -> Dict[str, List[str]]:
+        """필드별 허용 값을 조회해 캐시 파일에 저장"""
+        path = path or JiraRestConfig.FIELD_OPTIONS_FILE
+        options = self.fetch_field_options()
+        from utils import FileManager  # utils는 프리셋/템플릿 모듈을 함께 불러오므로 사용할 때 import
+
+        cache = {'fetched_at': time.time(), 'project': self.project_key, 'fields': options}
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        FileManager.save_json(cache, path)
+        logger.info(f"필드 허용 값 캐시 저장: {path} ({', '.join(options) or '없음'})")
+        return options
+
+    def create_issue(self, issue_data: Dict[str, str]) -> str:
+        """
+        이슈 생성
+
+        Returns:
+            생성된 이슈 키 (예: P2-12345)
+
+        Raises:
+            JiraRestError: JIRA가 오류 응답을 반환한 경우
+        """
+        result = self._request('POST', '/rest/api/2/issue', json=self.build_payload(issue_data))
+        key = result.get('key', '')
+        logger.info(f"이슈 생성 완료 (REST): {key} {issue_data.get('summary', '')}")
+        return key
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
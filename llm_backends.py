@@ -0,0 +1,417 @@
+"""
+LLM 백엔드 모듈
+AI 어시스턴트가 사용할 추론 서버 연동을 교체 가능하도록 분리합니다.
+
+- OllamaBackend: 로컬 Ollama (ollama 파이썬 패키지)
+- OpenAICompatibleBackend: OpenAI 호환 서버 (llama.cpp server, vLLM 등) - 연결 풀 사용
+- StubBackend: 네트워크 없이 고정 응답을 반환 (테스트용)
+"""
+import importlib.util
+import json
+import logging
+import os
+import socket
+import threading
+from typing import Dict, Any, Optional, List, Iterator, Callable
+
+from config import AIConfig
+
+logger = logging.getLogger(__name__)
+
+# ollama 클라이언트는 import 비용이 커서 실제로 필요할 때 로드 (앱 시작 시간 단축)
+OLLAMA_AVAILABLE = importlib.util.find_spec('ollama') is not None
+
+_ollama_module = None
+_ollama_lock = threading.Lock()
+
+
+def _get_ollama():
+    """ollama 모듈을 지연 로드하여 반환"""
+    global _ollama_module
+    if _ollama_module is None:
+        with _ollama_lock:
+            if _ollama_module is None:
+                import ollama
+                _ollama_module = ollama
+    return _ollama_module
+
+
+class BackendBusyError(RuntimeError):
+    """동시 요청 한도에 걸려 타임아웃 안에 요청 슬롯을 얻지 못한 경우"""
+
+
+class LLMBackend:
+    """LLM 백엔드 기본 클래스"""
+
+    name = 'base'
+
+    def __init__(self, timeout: Optional[float] = None, max_concurrency: Optional[int] = None):
+        """
+        Args:
+            timeout: 요청 타임아웃 (초, 기본값: AIConfig.GENERATION_TIMEOUT)
+            max_concurrency: 동시 요청 한도 (기본값: AIConfig.MAX_CONCURRENT_REQUESTS)
+        """
+        self.timeout = timeout if timeout is not None else AIConfig.GENERATION_TIMEOUT
+        self.max_concurrency = max_concurrency or AIConfig.MAX_CONCURRENT_REQUESTS
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    def is_available(self) -> bool:
+        """백엔드를 사용할 수 있는 환경인지 (패키지 설치 여부 등)"""
+        return True
+
+    def warm_up(self):
+        """클라이언트를 미리 준비 (백그라운드 초기화용)"""
+
+    def list_models(self) -> List[str]:
+        """
+        서버에서 사용 가능한 모델 목록
+
+        Raises:
+            ConnectionError: 서버에 연결할 수 없는 경우
+        """
+        raise NotImplementedError
+
+    def stream_generate(self, model: str, prompt: str, options: Dict[str, Any]) -> Iterator[str]:
+        """
+        텍스트를 청크 단위로 생성하는 제너레이터
+
+        제너레이터를 close()하면 HTTP 스트림이 닫혀 서버 측 생성도 중단되어야 합니다.
+        """
+        raise NotImplementedError
+
+    def generate(self, model: str, prompt: str, options: Dict[str, Any],
+                 cancel_event: Optional[threading.Event] = None,
+                 on_chunk: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """
+        동시 요청 한도 안에서 텍스트를 생성
+
+        Args:
+            model: 모델 이름
+            prompt: 프롬프트
+            options: 생성 옵션 (Ollama 옵션 이름 기준: temperature, top_p, top_k, num_predict, num_ctx)
+            cancel_event: 설정되면 스트림을 닫고 None 반환
+            on_chunk: 청크마다 호출, True를 반환하면 생성을 조기 종료
+
+        Returns:
+            생성된 전체 텍스트 또는 None (취소 시)
+
+        Raises:
+            BackendBusyError: 타임아웃 안에 요청 슬롯을 얻지 못한 경우
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            raise BackendBusyError(f"{self.name} 백엔드 동시 요청 한도({self.max_concurrency}) 초과")
+
+        if cancel_event is None:
+            try:
+                return self._consume(model, prompt, options, None, on_chunk)
+            finally:
+                self._slots.release()
+        return self._generate_cancellable(model, prompt, options, cancel_event, on_chunk)
+
+    def _consume(self, model: str, prompt: str, options: Dict[str, Any],
+                 cancel_event: Optional[threading.Event],
+                 on_chunk: Optional[Callable[[str], bool]]) -> Optional[str]:
+        """스트림을 끝까지(또는 취소/조기 종료까지) 읽어 전체 텍스트 반환"""
+        parts = []
+        stream = self.stream_generate(model, prompt, options)
+        try:
+            for text in stream:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                parts.append(text)
+                if on_chunk is not None and on_chunk(text):
+                    break
+        finally:
+            # 제너레이터를 닫으면 HTTP 스트림이 닫히고 서버 측 생성도 중단됨
+            stream.close()
+
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        return ''.join(parts).strip()
+
+    def _generate_cancellable(self, model: str, prompt: str, options: Dict[str, Any],
+                              cancel_event: threading.Event,
+                              on_chunk: Optional[Callable[[str], bool]]) -> Optional[str]:
+        """
+        작업 스레드에서 생성하고, 호출 스레드는 cancel_event를 감시
+
+        청크 사이에서만 취소를 확인하면 첫 토큰 전(프롬프트 처리 중)의 취소가
+        반영되지 않으므로, 취소되면 abort_stream으로 스트림을 끊고 바로 반환합니다.
+        요청 슬롯은 서버 요청이 실제로 끝나는 작업 스레드 종료 시에 반환합니다.
+        (끊지 못하는 백엔드에서 남은 요청이 있는데 다음 요청이 한도를 넘어 들어가지 않도록)
+        """
+        result: Dict[str, Any] = {}
+        done = threading.Event()
+
+        def run():
+            try:
+                result['text'] = self._consume(model, prompt, options, cancel_event, on_chunk)
+            except BaseException as e:
+                result['error'] = e
+            finally:
+                self._slots.release()
+                done.set()
+
+        worker = threading.Thread(target=run, name=f'{self.name}-generate', daemon=True)
+        worker.start()
+        while not done.wait(AIConfig.CANCEL_POLL_INTERVAL):
+            if cancel_event.is_set():
+                self.abort_stream(worker)
+                return None
+
+        if 'error' in result:
+            raise result['error']
+        return result['text']
+
+    def abort_stream(self, worker: threading.Thread):
+        """
+        worker 스레드가 읽고 있는 스트림을 다른 스레드에서 끊음 (가능한 백엔드만)
+
+        끊지 못해도 worker는 다음 청크에서 취소를 확인하고 스트림을 닫습니다.
+        (Ollama 클라이언트는 첫 청크 전의 요청을 끊을 수단이 없어 이 경우에 해당)
+        """
+
+
+class OllamaBackend(LLMBackend):
+    """로컬 Ollama 백엔드"""
+
+    name = 'ollama'
+
+    def __init__(self, host: Optional[str] = None, timeout: Optional[float] = None,
+                 max_concurrency: Optional[int] = None):
+        super().__init__(timeout, max_concurrency)
+        self.host = host or AIConfig.OLLAMA_HOST
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        return OLLAMA_AVAILABLE
+
+    def _get_client(self):
+        """ollama.Client를 지연 생성 (연결 재사용)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    ollama = _get_ollama()
+                    self._client = ollama.Client(host=self.host, timeout=self.timeout)
+        return self._client
+
+    def warm_up(self):
+        if self.is_available():
+            self._get_client()
+
+    def list_models(self) -> List[str]:
+        models = self._get_client().list()
+        model_list = models.get('models', [])
+
+        # 모델 이름 추출 (ollama 패키지 버전에 따라 다름)
+        model_names = []
+        for model in model_list:
+            if hasattr(model, 'model'):
+                model_names.append(model.model)
+            elif isinstance(model, dict) and 'model' in model:
+                model_names.append(model['model'])
+            elif isinstance(model, dict) and 'name' in model:
+                model_names.append(model['name'])
+        return model_names
+
+    def stream_generate(self, model: str, prompt: str, options: Dict[str, Any]) -> Iterator[str]:
+        stream = self._get_client().generate(model=model, prompt=prompt, stream=True, options=options)
+        try:
+            for chunk in stream:
+                yield chunk.get('response', '')
+                if chunk.get('done'):
+                    break
+        finally:
+            stream.close()
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """OpenAI 호환 API 서버 백엔드 (llama.cpp server, vLLM 등)"""
+
+    name = 'openai'
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 timeout: Optional[float] = None, max_concurrency: Optional[int] = None):
+        super().__init__(timeout, max_concurrency)
+        self.base_url = (base_url or AIConfig.OPENAI_BASE_URL).rstrip('/')
+        self.api_key = api_key if api_key is not None else os.environ.get(AIConfig.OPENAI_API_KEY_ENV, '')
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._active_responses: Dict[int, Any] = {}  # 스트림을 읽는 스레드 ident -> 응답 (abort_stream용)
+
+    def is_available(self) -> bool:
+        return importlib.util.find_spec('requests') is not None
+
+    def _get_session(self):
+        """동시 요청 한도만큼 연결을 유지하는 requests.Session을 지연 생성"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    if self.api_key:
+                        session.headers['Authorization'] = f'Bearer {self.api_key}'
+                    self._session = session
+        return self._session
+
+    def warm_up(self):
+        if self.is_available():
+            self._get_session()
+
+    def _request_timeout(self) -> tuple:
+        """(연결, 읽기) 타임아웃 - 연결은 짧게, 읽기는 청크 사이 대기 시간 기준"""
+        return (min(5.0, self.timeout), self.timeout)
+
+    def list_models(self) -> List[str]:
+        import requests
+
+        try:
+            response = self._get_session().get(f'{self.base_url}/models', timeout=self._request_timeout())
+            response.raise_for_status()
+        except requests.ConnectionError as e:
+            raise ConnectionError(f"{self.base_url}에 연결할 수 없습니다: {e}") from e
+        return [model.get('id', '') for model in response.json().get('data', []) if model.get('id')]
+
+    def stream_generate(self, model: str, prompt: str, options: Dict[str, Any]) -> Iterator[str]:
+        payload = {
+            'model': model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'stream': True,
+            'temperature': options.get('temperature', AIConfig.TEMPERATURE),
+            'top_p': options.get('top_p', AIConfig.TOP_P),
+        }
+        if 'num_predict' in options:
+            payload['max_tokens'] = options['num_predict']
+        if 'top_k' in options:
+            payload['top_k'] = options['top_k']  # llama.cpp/vLLM 확장 파라미터
+
+        response = self._get_session().post(
+            f'{self.base_url}/chat/completions', json=payload,
+            stream=True, timeout=self._request_timeout()
+        )
+        self._active_responses[threading.get_ident()] = response
+        completed = False
+        try:
+            response.raise_for_status()
+            lines = response.iter_lines(decode_unicode=True)
+            for line in lines:
+                # Server-Sent Events: "data: {...}" / "data: [DONE]"
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[5:].strip()
+                if data == '[DONE]':
+                    break
+                try:
+                    event = json.loads(data)
+                except json.JSONDecodeError:
+                    logger.debug("SSE 이벤트 파싱 실패: %.100s", data)
+                    continue
+                for choice in event.get('choices', []):
+                    text = (choice.get('delta') or {}).get('content') or choice.get('text') or ''
+                    if text:
+                        yield text
+            # 정상 종료: 남은 본문을 끝까지 읽으면 연결이 풀로 돌아가 다음 요청이 재사용
+            for _ in lines:
+                pass
+            completed = True
+        finally:
+            self._active_responses.pop(threading.get_ident(), None)
+            if completed:
+                response.raw.release_conn()
+            else:
+                # 취소/조기 종료/오류: 연결을 닫아 서버가 생성을 중단하도록 함 (풀로 반환하지 않음)
+                response.close()
+
+    def abort_stream(self, worker: threading.Thread):
+        response = self._active_responses.get(worker.ident)
+        if response is None:
+            return  # 아직 응답 헤더를 기다리는 중
+        # close()만으로는 다른 스레드의 소켓 읽기가 깨어나지 않을 수 있어 shutdown으로 끊음
+        connection = getattr(response.raw, 'connection', None) or getattr(response.raw, '_connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class StubBackend(LLMBackend):
+    """고정 응답을 청크로 나눠 반환하는 테스트용 백엔드"""
+
+    name = 'stub'
+
+    def __init__(self, response: str = '', models: Optional[List[str]] = None,
+                 chunk_size: int = 16, delay: float = 0.0,
+                 timeout: Optional[float] = None, max_concurrency: Optional[int] = None):
+        super().__init__(timeout, max_concurrency)
+        self.response = response
+        self.models = models if models is not None else [AIConfig.DEFAULT_MODEL]
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.prompts: List[str] = []  # 받은 프롬프트 기록 (검증용)
+        self._abort_events: Dict[int, threading.Event] = {}  # 스트림을 읽는 스레드 ident -> 중단 신호
+
+    def list_models(self) -> List[str]:
+        return list(self.models)
+
+    def stream_generate(self, model: str, prompt: str, options: Dict[str, Any]) -> Iterator[str]:
+        self.prompts.append(prompt)
+        ident = threading.get_ident()
+        abort = self._abort_events[ident] = threading.Event()
+        try:
+            for i in range(0, len(self.response), self.chunk_size):
+                if self.delay and abort.wait(self.delay):
+                    return  # 연결이 끊긴 것처럼 스트림 종료
+                yield self.response[i:i + self.chunk_size]
+        finally:
+            self._abort_events.pop(ident, None)
+
+    def abort_stream(self, worker: threading.Thread):
+        abort = self._abort_events.get(worker.ident)
+        if abort is not None:
+            abort.set()
+
+
+BACKEND_CLASSES = {
+    OllamaBackend.name: OllamaBackend,
+    OpenAICompatibleBackend.name: OpenAICompatibleBackend,
+    StubBackend.name: StubBackend,
+}
+
+_default_backend: Optional[LLMBackend] = None
+_default_backend_lock = threading.Lock()
+
+
+def create_backend(name: Optional[str] = None, **kwargs) -> LLMBackend:
+    """
+    이름으로 백엔드 생성
+
+    Args:
+        name: 'ollama' | 'openai' | 'stub' (기본값: AIConfig.BACKEND)
+        **kwargs: 백엔드 생성자 인자
+
+    Returns:
+        LLMBackend 인스턴스
+    """
+    name = name or AIConfig.BACKEND
+    backend_class = BACKEND_CLASSES.get(name)
+    if backend_class is None:
+        raise ValueError(f"알 수 없는 LLM 백엔드: {name} (사용 가능: {list(BACKEND_CLASSES)})")
+    return backend_class(**kwargs)
+
+
+def get_default_backend() -> LLMBackend:
+    """설정된 기본 백엔드 싱글톤 (연결 풀/동시 요청 한도를 앱 전체에서 공유)"""
+    global _default_backend
+    if _default_backend is None:
+        with _default_backend_lock:
+            if _default_backend is None:
+                _default_backend = create_backend()
+    return _default_backend
@@ -0,0 +1,131 @@
+"""
+비동기 로그 파이프라인 모듈 (PyQt5 없이 사용)
+긴 일괄 실행 중에도 로그 기록이 자동화/GUI 스레드를 붙잡지 않도록,
+호출 스레드는 레코드를 큐에 넣기만 하고 파일/콘솔 쓰기는 별도 스레드(QueueListener)가 합니다.
+
+- 파일: JSON Lines (한 줄에 레코드 하나), 크기 기준 회전 (jira_auto.jsonl, .1, .2 ...)
+- 콘솔: 기존과 같은 텍스트 형식
+- 메시지는 logger.info("%s 선택", value)처럼 % 인자로 넘기면 레벨에서 걸러질 때 문자열을 만들지 않음
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime
+from typing import Optional, TextIO
+
+from config import LOG_BACKUP_COUNT, LOG_FILE, LOG_MAX_BYTES
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.Handler] = None
+_lock = threading.Lock()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """레코드 하나를 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐에 넣기 전 메시지 인자만 합침 (포맷/시간 문자열/JSON 변환은 리스너 스레드에서)
+
+    기본 QueueHandler.prepare는 호출 스레드에서 전체 포맷을 수행하고
+    예외 정보를 메시지에 붙이므로, JSON 필드로 나눌 수 있도록 따로 보관합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()  # 인자가 나중에 바뀌어도 기록 시점 값 유지
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = logging.Formatter().formatException(record.exc_info)  # traceback 객체는 넘기지 않음
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+
+def setup_logging(level: int = logging.INFO, log_file: Optional[str] = LOG_FILE,
+                  stream: Optional[TextIO] = sys.stderr, max_bytes: int = LOG_MAX_BYTES,
+                  backup_count: int = LOG_BACKUP_COUNT) -> logging.handlers.QueueListener:
+    """
+    루트 로거를 비동기 큐 파이프라인으로 설정 (다시 호출하면 기존 설정을 교체)
+
+    Args:
+        level: 루트 로그 레벨
+        log_file: JSON Lines 로그 파일 (None이면 파일 기록 안 함)
+        stream: 텍스트 로그를 쓸 콘솔 스트림 (None이면 콘솔 출력 안 함)
+        max_bytes: 이 크기를 넘으면 파일 회전 (0이면 회전 안 함)
+        backup_count: 보관할 이전 파일 수
+
+    Returns:
+        시작된 QueueListener
+    """
+    global _listener, _queue_handler
+
+    handlers = []
+    if log_file:
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+    if stream is not None:
+        console_handler = logging.StreamHandler(stream)
+        console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        handlers.append(console_handler)
+
+    with _lock:
+        _stop_locked()
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = _RecordQueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+        return _listener
+
+
+def _stop_locked():
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()  # 큐에 남은 레코드를 모두 기록한 뒤 종료
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
+
+
+def stop_logging():
+    """남은 로그를 모두 기록하고 리스너 종료 (프로그램 종료 시 자동 호출)"""
+    with _lock:
+        _stop_locked()
+
+
+# logging 모듈의 종료 처리(핸들러 close)보다 먼저 실행되도록 import 시 등록
+atexit.register(stop_logging)
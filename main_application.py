@@ -4,28 +4,34 @@
 import sys
 import threading
 import time
+from concurrent.futures import CancelledError
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 import logging
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QDialog, QVBoxLayout, QHBoxLayout, 
-    QLabel, QPushButton, QMessageBox, QProgressDialog
+    QLabel, QPushButton, QMessageBox, QProgressDialog, QCompleter
 )
-from PyQt5.QtCore import Qt, QSettings, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QSettings, QThread, QTimer, QFileSystemWatcher, QStringListModel, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from config import (
     DARK_THEME_STYLE, DIR_PRESET, BUILD_NAME_FILE, FIX_VERSION_FILE, 
-    SETTINGS_FILE, ensure_directories, AIConfig, EXCEL_EXPORT_FILE, APP_SETTINGS_FILE, DIR_RESULT
+    SETTINGS_FILE, ensure_directories, AIConfig, EXCEL_EXPORT_FILE, APP_SETTINGS_FILE, DIR_RESULT,
+    BUILD_FEED_PATH
 )
 from utils import (
     FileManager, TextProcessor, PresetManager, ValidationHelper,
-    OptionsManager, setup_logging
+    OptionsManager, setup_logging, get_settings_store, flush_settings_stores
 )
 from gui_widgets import create_main_form, SettingsDialog
-from jira_automation import create_issue, JiraAutomation
-from ai_assistant import get_ai_assistant, AIAssistant
+from description_templates import get_template_library
+from batch_rows import compile_headers, iter_rows, is_blank_row, count_rows
+from batch_validation import BatchPlan, build_domains, prepare_batch
+from jira_rest import load_cached_field_options
+from issue_scheduler import INTERACTIVE, BATCH, IssueScheduler, BrowserBackend
+# jira_automation(selenium/requests)과 ai_assistant(ollama)는 처음 사용할 때 import (창을 먼저 띄움)
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +40,34 @@ class AIGenerationThread(QThread):
     """AI 생성을 백그라운드에서 실행하는 스레드"""
     finished = pyqtSignal(dict)  # 생성 완료 시 결과 전달
     error = pyqtSignal(str)  # 에러 발생 시 메시지 전달
+    model_missing = pyqtSignal(list)  # 요청한 모델이 없을 때 설치된 모델 목록 전달
     
-    def __init__(self, summary: str, preset_dir: str):
+    def __init__(self, summary: str, preset_dir: str, check_model: bool = True):
         super().__init__()
         self.summary = summary
         self.preset_dir = preset_dir
+        self.check_model = check_model
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """생성 취소 요청 (스트림을 닫고 스스로 종료하도록 신호만 보냄)"""
+        self._cancel_event.set()
+    
+    def is_cancelled(self) -> bool:
+        """취소 요청 여부"""
+        return self._cancel_event.is_set()
     
     def run(self):
         """스레드 실행"""
         try:
+            from ai_assistant import AIAssistant, get_ai_assistant
+            
+            # 모델 존재 여부 확인 (ollama import와 서버 조회가 있어 GUI 스레드에서 하지 않음)
+            if self.check_model and not AIAssistant.check_model_exists(AIConfig.DEFAULT_MODEL):
+                if not self.is_cancelled():
+                    self.model_missing.emit(AIAssistant.get_available_models())
+                return
+            
             # AI 어시스턴트 가져오기
             ai_assistant = get_ai_assistant(
                 preset_dir=self.preset_dir,
@@ -50,7 +75,11 @@ class AIGenerationThread(QThread):
             )
             
             # AI로 버그 세부정보 생성
-            result = ai_assistant.generate_bug_details(self.summary)
+            result = ai_assistant.generate_bug_details(self.summary, cancel_event=self._cancel_event)
+            
+            # 취소된 경우 결과를 전달하지 않음
+            if self.is_cancelled():
+                return
             
             if result:
                 self.finished.emit(result)
@@ -58,10 +87,31 @@ class AIGenerationThread(QThread):
                 self.error.emit("AI가 유효한 응답을 생성하지 못했습니다.")
                 
         except Exception as e:
+            if self.is_cancelled():
+                return
             logger.error(f"AI 생성 중 오류: {e}", exc_info=True)
             self.error.emit(f"AI 생성 실패: {str(e)}")
 
 
+class BatchPrepareThread(QThread):
+    """일괄 실행 전 입력 파일 확인(헤더/행 수/사전 검증)을 백그라운드에서 실행하는 스레드"""
+    finished = pyqtSignal(str, object)  # 완료 (파일 경로, BatchPlan)
+    error = pyqtSignal(str)  # 에러 발생 시 메시지 전달
+    
+    def __init__(self, excel_path: str, domains: Dict[str, Any]):
+        super().__init__()
+        self.excel_path = excel_path
+        self.domains = domains
+    
+    def run(self):
+        """스레드 실행 (파일을 한 번만 읽음)"""
+        try:
+            self.finished.emit(self.excel_path, prepare_batch(self.excel_path, self.domains))
+        except Exception as e:
+            logger.error(f"엑셀 일괄 실행 준비 실패: {e}", exc_info=True)
+            self.error.emit(str(e))
+
+
 class ExcelBatchThread(QThread):
     """엑셀 일괄 실행을 백그라운드에서 실행하는 스레드"""
     progress_update = pyqtSignal(int, str)  # 진행 상황 업데이트 (값, 메시지)
@@ -69,72 +119,68 @@ class ExcelBatchThread(QThread):
     error_occurred = pyqtSignal(int, str)  # 에러 발생 (행 번호, 에러 메시지)
     finished = pyqtSignal(int, list)  # 완료 (성공 개수, 실패 목록)
     
-    def __init__(self, excel_path: str):
+    def __init__(self, excel_path: str, scheduler: IssueScheduler, total: Optional[int] = None,
+                 skip_rows: Optional[Set[int]] = None):
         super().__init__()
         self.excel_path = excel_path
+        self.scheduler = scheduler  # Execute(단건)와 공유하는 브라우저 스케줄러
+        self.total = total  # 데이터 행 수 (없으면 실행 시 셈)
+        self.skip_rows = skip_rows or set()  # 사전 검증에서 오류가 난 행 번호
         self.is_cancelled = False
+        self._headers = None
+        self._header_mapping = None
     
     def cancel(self):
         """실행 취소"""
         self.is_cancelled = True
+        self.scheduler.cancel(BATCH)
         logger.info("사용자가 일괄 실행 취소를 요청했습니다.")
     
     def run(self):
         """스레드 실행"""
         try:
-            import openpyxl
-            
-            # 엑셀 파일 읽기
-            wb = openpyxl.load_workbook(self.excel_path)
-            ws = wb.active
-            
-            # 헤더 확인
-            headers = [cell.value for cell in ws[1]]
-            
-            # JIRA Automation 인스턴스 생성
-            jira_automation = JiraAutomation()
-            jira_automation.start_driver()
+            total = self.total if self.total is not None else count_rows(self.excel_path) - len(self.skip_rows)
             
-            # 각 행을 순차적으로 처리
+            # 각 행을 순차적으로 처리 (엑셀/CSV/JSONL 행을 하나씩 읽음)
+            # 행은 하나씩 batch 레인에 넣으므로, 그 사이 Execute(interactive)가 먼저 실행됨
             success_count = 0
             failed_rows = []
             
-            for row_idx in range(2, ws.max_row + 1):
+            index = 0
+            for row_idx, headers, row_data in iter_rows(self.excel_path):
+                if is_blank_row(row_data) or row_idx in self.skip_rows:
+                    continue
+                index += 1
+                
                 # 취소 확인
                 if self.is_cancelled:
                     logger.info("일괄 실행이 취소되었습니다.")
                     break
                 
                 try:
-                    # 행 데이터 읽기
-                    row_data = [cell.value for cell in ws[row_idx]]
+                    # 행 데이터 변환
                     issue_data = self._parse_excel_row(headers, row_data)
                     
                     # 진행 상황 업데이트
                     summary_preview = issue_data.get('summary', '')[:50]
                     progress_text = (
-                        f"이슈 생성 중... ({row_idx - 1}/{ws.max_row - 1})\n"
+                        f"이슈 생성 중... ({index}/{total})\n"
                         f"제목: {summary_preview}{'...' if len(issue_data.get('summary', '')) > 50 else ''}"
                     )
-                    self.progress_update.emit(row_idx - 2, progress_text)
-                    
-                    # 새 탭 생성 (첫 번째 이슈가 아닐 경우)
-                    if row_idx > 2:
-                        jira_automation.create_new_tab()
-                        time.sleep(1)
+                    self.progress_update.emit(index - 1, progress_text)
                     
-                    # 이슈 생성
-                    jira_automation.create_issue(issue_data, pause_for_review=False)
+                    # 이슈 생성 (첫 이슈가 아니면 새 탭에서 진행, 생성 후 짧은 대기 포함)
+                    self.scheduler.create_issue(issue_data, BATCH).result()
                     
-                    logger.info(f"이슈 생성 완료 ({row_idx - 1}/{ws.max_row - 1}): {issue_data.get('summary', '')}")
+                    logger.info(f"이슈 생성 완료 ({index}/{total}): {issue_data.get('summary', '')}")
                     success_count += 1
                     
                     # 이슈 생성 완료 시그널
-                    self.issue_created.emit(row_idx - 1, ws.max_row - 1, issue_data.get('summary', ''))
-                    
-                    # 다음 이슈로 진행하기 전 짧은 대기
-                    time.sleep(1.5)
+                    self.issue_created.emit(index, total, issue_data.get('summary', ''))
                     
+                except CancelledError:
+                    logger.info("일괄 실행이 취소되었습니다.")
+                    break
                 except Exception as e:
                     logger.error(f"이슈 생성 실패 (행 {row_idx}): {e}", exc_info=True)
                     failed_rows.append((row_idx, str(e)))
@@ -145,49 +191,23 @@ class ExcelBatchThread(QThread):
             # 완료 시그널
             self.finished.emit(success_count, failed_rows)
             
-            # 드라이버는 종료하지 않음 (사용자가 브라우저에서 확인 가능)
-            # jira_automation.close()
-            
         except Exception as e:
             logger.error(f"엑셀 일괄 실행 스레드 오류: {e}", exc_info=True)
             self.finished.emit(0, [(0, str(e))])
     
     def _parse_excel_row(self, headers: list, row_data: list) -> dict:
-        """엑셀 행 데이터를 JIRA 이슈 데이터로 변환"""
-        # 헤더와 데이터를 매핑
-        data_dict = {}
-        for i, header in enumerate(headers):
-            if i < len(row_data):
-                value = row_data[i]
-                data_dict[header] = value if value is not None else ''
-        
-        # JIRA 필드명으로 변환
-        issue_data = {
-            'summary': str(data_dict.get('Summary', '')),
-            'team': str(data_dict.get('Team', '')),
-            'linkedIssues': str(data_dict.get('Linked Issues', '')),
-            'issue': str(data_dict.get('Issue', '')),
-            'parent': str(data_dict.get('Parent', '')),
-            'reviewer': str(data_dict.get('Reviewer', '')),
-            'branch': str(data_dict.get('Branch', '')),
-            'build': str(data_dict.get('Build', '')),
-            'fixversion': str(data_dict.get('Fix Version', '')),
-            'component': str(data_dict.get('Component', '')),
-            'label': str(data_dict.get('Label', '')),
-            'priority': str(data_dict.get('Priority', '')),
-            'severity': str(data_dict.get('Severity', '')),
-            'prevalence': str(data_dict.get('Prevalence', '')),
-            'repro_rate': str(data_dict.get('Repro Rate', '')),
-            'steps': str(data_dict.get('Steps', '')),
-            'description': str(data_dict.get('Description', ''))
-        }
-        
-        return issue_data
+        """엑셀 행 데이터를 JIRA 이슈 데이터로 변환 (batch_cli와 같은 규칙, 헤더는 한 번만 컴파일)"""
+        if headers is not self._headers:
+            self._headers, self._header_mapping = headers, compile_headers(headers)
+        return self._header_mapping.parse(row_data)
 
 
 class BugReportApp(QWidget):
     """버그 리포트 메인 애플리케이션 클래스"""
     
+    preset_loaded = pyqtSignal(str, object)  # 백그라운드 프리셋 로드 완료 (파일명, 데이터)
+    build_options_imported = pyqtSignal(list)  # 빌드 피드에서 새 빌드 추가됨
+    
     def __init__(self):
         super().__init__()
         
@@ -203,12 +223,25 @@ class BugReportApp(QWidget):
         
         # UI 요소들을 저장할 딕셔너리
         self.widgets = {}
+        self._preset_generation = -1  # 콤보박스에 반영된 프리셋 카탈로그 세대
+        self._updating_presets = False  # 프리셋 콤보박스 모델 갱신 중 여부
+        self._pending_apply = None  # 로드가 끝나면 적용할 프리셋 파일명
         
         # AI 관련
         self.ai_thread = None
         self.ai_progress_dialog = None
+        self._retired_ai_threads = []  # 취소/결과 전달 후 run()이 끝날 때까지 유지하는 참조 (GC 방지)
+        
+        # 빌드명 피드 (설정된 경우에만)
+        self.build_feed = None
+        
+        # 이슈 생성 스케줄러: Execute와 엑셀 일괄 실행이 Chrome 세션 하나를 공유
+        # (Execute는 대기 중인 일괄 행보다 먼저 실행, 드라이버는 첫 작업 때 연결)
+        self.issue_scheduler = IssueScheduler(BrowserBackend, workers=1, name='browser')
         
         # 엑셀 일괄 실행 관련
+        self.batch_prepare_thread = None
+        self._excel_execute_text = ''  # 확인 중 표시 전 일괄 실행 버튼 글자
         self.excel_batch_thread = None
         self.excel_progress_dialog = None
         
@@ -220,6 +253,133 @@ class BugReportApp(QWidget):
         
         # 설정 로드
         self.load_settings()
+        
+        # 프리셋 디렉토리 감시 (외부에서 추가/삭제된 프리셋을 증분 반영)
+        self._start_preset_watcher()
+        
+        # 프리셋 검색 인덱스는 창이 표시된 뒤 백그라운드에서 구축
+        QTimer.singleShot(0, self._start_preset_search_index)
+        
+        # 빌드 매니페스트에서 새 빌드명을 백그라운드로 가져옴
+        QTimer.singleShot(0, self._start_build_feed)
+        
+        # 창이 표시된 뒤 AI 서브시스템을 백그라운드에서 준비 (ollama import, preset 인덱싱)
+        QTimer.singleShot(0, self._start_ai_warm_up)
+    
+    def _start_preset_watcher(self):
+        """프리셋 디렉토리 변경 감시 시작"""
+        # 저장이 몰릴 때 여러 번 스캔하지 않도록 짧게 모아서 처리
+        self._preset_refresh_timer = QTimer(self)
+        self._preset_refresh_timer.setSingleShot(True)
+        self._preset_refresh_timer.setInterval(300)
+        self._preset_refresh_timer.timeout.connect(self._on_preset_dir_changed)
+        
+        self.preset_watcher = QFileSystemWatcher([DIR_PRESET], self)
+        self.preset_watcher.directoryChanged.connect(lambda _: self._preset_refresh_timer.start())
+    
+    def _on_preset_dir_changed(self):
+        """프리셋 디렉토리가 바뀌었을 때 카탈로그만 증분 갱신"""
+        self.preset_manager.refresh()
+        # 앱 내부 저장/삭제로 이미 반영된 변경도 콤보박스에는 아직 안 보였을 수 있음
+        if self._preset_generation != self.preset_manager.catalog.generation:
+            self.refresh_presets()
+    
+    def _start_build_feed(self):
+        """빌드명 피드 감시 시작 (BUILD_FEED_PATH가 설정된 경우)"""
+        if not BUILD_FEED_PATH:
+            return
+        from build_feed import BuildFeedImporter
+        self.build_feed = BuildFeedImporter(self.options_manager)
+        # 피드 스레드에서 신호를 보내면 GUI 스레드에서 콤보박스 갱신
+        self.build_feed.add_listener(self.build_options_imported.emit)
+        self.build_options_imported.connect(self._on_build_options_imported)
+        self.build_feed.start()
+    
+    def _on_build_options_imported(self, added: list):
+        """빌드 피드로 추가된 빌드를 콤보박스에 반영"""
+        combo_field_widget = self.combo_field_widgets.get('build')
+        if combo_field_widget:
+            combo_field_widget.refresh_options()
+    
+    def _start_preset_search_index(self):
+        """프리셋 검색 인덱스를 백그라운드 스레드에서 구축"""
+        def build():
+            try:
+                self.preset_manager.build_search_index()
+            except Exception as e:
+                logger.warning(f"프리셋 검색 인덱스 구축 실패: {e}")
+        
+        threading.Thread(target=build, name='preset-search-index', daemon=True).start()
+    
+    def _setup_preset_search(self):
+        """프리셋 검색창에 관련도순 결과 팝업 연결"""
+        self._preset_search_results = {}  # 표시 문자열 -> 파일명
+        self._preset_search_model = QStringListModel(self)
+        
+        completer = QCompleter(self._preset_search_model, self)
+        # 결과는 인덱스가 이미 순위를 매겼으므로 QCompleter가 다시 거르지 않도록 함
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.setMaxVisibleItems(15)
+        completer.activated[str].connect(self._on_preset_search_selected)
+        self.preset_search_completer = completer
+        
+        search_line = self.widgets['preset_search']
+        search_line.setCompleter(completer)
+        search_line.textEdited.connect(self._on_preset_search_edited)
+        search_line.returnPressed.connect(self._on_preset_search_return)
+    
+    def _on_preset_search_edited(self, text: str):
+        """검색어가 바뀔 때마다 결과 목록 갱신"""
+        self._preset_search_results = {}
+        for filename, summary in self.preset_manager.search_presets(text, limit=20):
+            label = filename[:-5]
+            if summary:
+                label = f"{label}  ·  {summary[:50]}"
+            self._preset_search_results[label] = filename
+        
+        self._preset_search_model.setStringList(list(self._preset_search_results))
+        if self._preset_search_results:
+            self.preset_search_completer.complete()
+    
+    def _on_preset_search_return(self):
+        """Enter: 첫 번째 결과 선택"""
+        if self._preset_search_results:
+            self._on_preset_search_selected(next(iter(self._preset_search_results)))
+    
+    def _on_preset_search_selected(self, label: str):
+        """검색 결과를 선택하면 카테고리/이름/버전 콤보박스를 해당 프리셋으로 이동"""
+        filename = self._preset_search_results.get(label)
+        if filename and self.select_preset_file(filename):
+            self.widgets['preset_line'].setText(filename[:-5])
+        # 팝업이 선택 문자열을 넣은 뒤에 비움
+        QTimer.singleShot(0, self.widgets['preset_search'].clear)
+    
+    def select_preset_file(self, filename: str) -> bool:
+        """프리셋 파일명으로 카테고리/이름/버전 선택"""
+        if self._preset_generation != self.preset_manager.catalog.generation:
+            self.refresh_presets()
+        
+        for prefix, names in self._structure.items():
+            for name, versions in names.items():
+                if not any(version_filename == filename for _, version_filename in versions):
+                    continue
+                # 상위 콤보박스 선택이 바뀌면 신호로 하위 목록이 갱신됨
+                self.widgets['preset_prefix'].setCurrentIndex(self.widgets['preset_prefix'].model().index_of(prefix))
+                self.widgets['preset_name'].setCurrentIndex(self.widgets['preset_name'].model().index_of(name))
+                self.widgets['preset_version'].setCurrentIndex(self.widgets['preset_version'].model().index_of(filename))
+                return True
+        return False
+    
+    def _start_ai_warm_up(self):
+        """AI 어시스턴트를 백그라운드 스레드에서 미리 초기화"""
+        def warm_up():
+            try:
+                from ai_assistant import warm_up_ai_assistant
+                warm_up_ai_assistant(preset_dir=DIR_PRESET, model_name=AIConfig.DEFAULT_MODEL)
+            except Exception as e:
+                logger.warning(f"AI 어시스턴트 사전 초기화 실패: {e}")
+        
+        threading.Thread(target=warm_up, name='ai-warm-up', daemon=True).start()
     
     def init_ui(self):
         """UI를 초기화"""
@@ -259,6 +419,7 @@ class BugReportApp(QWidget):
             'preset_version': form_data['preset_widgets']['version_combo'],
             'preset_line': form_data['preset_widgets']['preset_line'],
             'preset_sort': form_data['preset_widgets']['sort_combo'],
+            'preset_search': form_data['preset_widgets']['search_line'],
             'generate_combo': form_data['action_widgets']['generate_combo'],
         })
         
@@ -336,7 +497,7 @@ class BugReportApp(QWidget):
     def _connect_events(self):
         """이벤트들을 연결"""
         # 프리셋 버튼들
-        self.preset_buttons['refresh'].clicked.connect(self.refresh_presets)
+        self.preset_buttons['refresh'].clicked.connect(lambda: self.refresh_presets(rescan=True))
         self.preset_buttons['apply'].clicked.connect(self.apply_preset)
         self.preset_buttons['delete'].clicked.connect(self.delete_preset)
         self.preset_buttons['save_preset'].clicked.connect(self.save_preset)
@@ -344,7 +505,12 @@ class BugReportApp(QWidget):
         # 프리셋 콤보박스 변경
         self.widgets['preset_prefix'].currentIndexChanged.connect(lambda: self._on_prefix_changed())
         self.widgets['preset_name'].currentIndexChanged.connect(lambda: self._on_name_changed())
-        self.widgets['preset_sort'].currentIndexChanged.connect(self.refresh_presets)
+        self.widgets['preset_sort'].currentIndexChanged.connect(lambda: self.refresh_presets())
+        # 선택/강조된 버전을 미리 읽어 두어 적용이 즉시 끝나도록 함
+        self.widgets['preset_version'].currentIndexChanged.connect(self._prefetch_preset_row)
+        self.widgets['preset_version'].highlighted[int].connect(self._prefetch_preset_row)
+        self.preset_loaded.connect(self._on_preset_loaded)
+        self._setup_preset_search()
         
         # 콤보 필드 버튼들 연결
         for field_name, combo_field_widget in self.combo_field_widgets.items():
@@ -387,11 +553,35 @@ class BugReportApp(QWidget):
         )
         
         self.widgets['description'].setText(description)
+        self._refresh_template_names()
+    
+    def _refresh_template_names(self):
+        """템플릿 파일이 추가/삭제되었으면 생성 옵션 콤보박스 갱신"""
+        combo = self.widgets['generate_combo']
+        names = get_template_library().names()
+        if names == [combo.itemText(i) for i in range(combo.count())]:
+            return
+        current = combo.currentText()
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(names)
+        combo.setCurrentText(current)
+        combo.blockSignals(False)
     
     def generate_with_ai(self):
         """AI로 버그 세부정보를 생성"""
+        from ai_assistant import AIAssistant
+        
         # AI 사용 가능 여부 확인
-        if not AIAssistant.is_ollama_available():
+        if not AIAssistant.is_backend_available():
+            if AIConfig.BACKEND != 'ollama':
+                QMessageBox.warning(
+                    self,
+                    "AI 기능 사용 불가",
+                    f"LLM 백엔드({AIConfig.BACKEND})를 사용할 수 없습니다.\n\n"
+                    "requests 패키지 설치 여부와 추론 서버 설정(JIRAAUTO_LLM_BASE_URL)을 확인하세요."
+                )
+                return
             QMessageBox.warning(
                 self, 
                 "AI 기능 사용 불가",
@@ -410,62 +600,10 @@ class BugReportApp(QWidget):
             QMessageBox.warning(self, "입력 필요", "먼저 Summary 필드에 버그 제목을 입력해주세요.")
             return
         
-        # 모델 존재 여부 확인
-        try:
-            model_exists = AIAssistant.check_model_exists(AIConfig.DEFAULT_MODEL)
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Ollama 연결 실패",
-                f"Ollama 서비스에 연결할 수 없습니다.\n\n"
-                f"오류: {str(e)}\n\n"
-                f"해결 방법:\n"
-                f"1. Ollama 데스크톱 애플리케이션을 다운로드하세요:\n"
-                f"   https://ollama.com/download\n\n"
-                f"2. 설치 후 Ollama를 실행하세요.\n\n"
-                f"3. 터미널에서 다음 명령어로 모델을 다운로드하세요:\n"
-                f"   ollama pull {AIConfig.DEFAULT_MODEL}\n\n"
-                f"자세한 내용은 'OLLAMA_설치가이드.md' 파일을 참고하세요."
-            )
-            return
-        
-        if not model_exists:
-            # 설치된 모델 목록 가져오기
-            available_models = AIAssistant.get_available_models()
-            
-            if not available_models:
-                # 모델이 하나도 없는 경우
-                QMessageBox.warning(
-                    self,
-                    "모델 다운로드 필요",
-                    f"Ollama가 실행 중이지만 설치된 모델이 없습니다.\n\n"
-                    f"터미널에서 다음 명령어로 모델을 다운로드하세요:\n\n"
-                    f"ollama pull {AIConfig.DEFAULT_MODEL}\n\n"
-                    f"추천 모델:\n"
-                    f"• gemma2:2b (가벼움, ~1.6GB)\n"
-                    f"• llama3.2:3b (균형, ~2GB)\n"
-                    f"• qwen2.5:3b (한국어 좋음, ~2GB)\n\n"
-                    f"자세한 내용은 'OLLAMA_설치가이드.md' 파일을 참고하세요."
-                )
-                return
-            else:
-                # 다른 모델은 있지만 요청한 모델이 없는 경우
-                models_text = "\n".join([f"• {m}" for m in available_models])
-                reply = QMessageBox.question(
-                    self,
-                    "모델 미설치",
-                    f"요청한 모델({AIConfig.DEFAULT_MODEL})이 설치되지 않았습니다.\n\n"
-                    f"현재 설치된 모델:\n{models_text}\n\n"
-                    f"설치하려면 터미널에서 다음 명령어를 실행하세요:\n"
-                    f"ollama pull {AIConfig.DEFAULT_MODEL}\n\n"
-                    f"그래도 계속하시겠습니까? (첫 번째 설치된 모델 사용)",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                
-                if reply == QMessageBox.No:
-                    return
-        
+        self._start_ai_generation(summary_text, check_model=True)
+    
+    def _start_ai_generation(self, summary_text: str, check_model: bool):
+        """진행 다이얼로그를 띄우고 AI 생성 스레드 시작 (모델 확인도 스레드에서)"""
         # 진행 다이얼로그 표시
         self.ai_progress_dialog = QProgressDialog(
             "AI가 버그 세부정보를 생성 중입니다...\n잠시만 기다려주세요.",
@@ -480,15 +618,76 @@ class BugReportApp(QWidget):
         self.ai_progress_dialog.show()
         
         # AI 생성 스레드 시작
-        self.ai_thread = AIGenerationThread(summary_text, DIR_PRESET)
+        self.ai_thread = AIGenerationThread(summary_text, DIR_PRESET, check_model=check_model)
         self.ai_thread.finished.connect(self._on_ai_generation_finished)
         self.ai_thread.error.connect(self._on_ai_generation_error)
+        self.ai_thread.model_missing.connect(self._on_ai_model_missing)
         self.ai_thread.start()
         
         logger.info(f"AI 생성 시작: {summary_text[:50]}...")
     
+    def _retire_ai_thread(self) -> Optional[AIGenerationThread]:
+        """
+        현재 AI 스레드를 해제하고 반환
+        
+        결과 시그널 직후에는 run()이 아직 끝나지 않았을 수 있으므로, 마지막 참조가 사라져
+        실행 중인 QThread가 파괴되지 않도록 종료될 때까지 목록에 보관합니다.
+        """
+        thread, self.ai_thread = self.ai_thread, None
+        self._retired_ai_threads = [t for t in self._retired_ai_threads if t.isRunning()]
+        if thread is not None:
+            self._retired_ai_threads.append(thread)
+        return thread
+    
+    def _on_ai_model_missing(self, available_models: list):
+        """요청한 모델이 서버에 없을 때 호출 (안내 후 설치된 모델로 계속할지 선택)"""
+        thread = self._retire_ai_thread()
+        summary_text = thread.summary if thread else ''
+        
+        if self.ai_progress_dialog:
+            self.ai_progress_dialog.close()
+            self.ai_progress_dialog = None
+        
+        if not available_models:
+            # 모델이 하나도 없거나 서버에 연결할 수 없는 경우
+            QMessageBox.warning(
+                self,
+                "모델 다운로드 필요",
+                f"설치된 모델이 없거나 Ollama 서비스에 연결할 수 없습니다.\n\n"
+                f"1. Ollama 데스크톱 애플리케이션이 실행 중인지 확인하세요:\n"
+                f"   https://ollama.com/download\n\n"
+                f"2. 터미널에서 다음 명령어로 모델을 다운로드하세요:\n\n"
+                f"ollama pull {AIConfig.DEFAULT_MODEL}\n\n"
+                f"추천 모델:\n"
+                f"• gemma2:2b (가벼움, ~1.6GB)\n"
+                f"• llama3.2:3b (균형, ~2GB)\n"
+                f"• qwen2.5:3b (한국어 좋음, ~2GB)\n\n"
+                f"자세한 내용은 'OLLAMA_설치가이드.md' 파일을 참고하세요."
+            )
+            return
+        
+        # 다른 모델은 있지만 요청한 모델이 없는 경우
+        models_text = "\n".join([f"• {m}" for m in available_models])
+        reply = QMessageBox.question(
+            self,
+            "모델 미설치",
+            f"요청한 모델({AIConfig.DEFAULT_MODEL})이 설치되지 않았습니다.\n\n"
+            f"현재 설치된 모델:\n{models_text}\n\n"
+            f"설치하려면 터미널에서 다음 명령어를 실행하세요:\n"
+            f"ollama pull {AIConfig.DEFAULT_MODEL}\n\n"
+            f"그래도 계속하시겠습니까? (첫 번째 설치된 모델 사용)",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes and summary_text:
+            self._start_ai_generation(summary_text, check_model=False)
+    
     def _on_ai_generation_finished(self, result: Dict[str, str]):
         """AI 생성 완료 시 호출"""
+        # 다이얼로그를 닫을 때 발생하는 canceled 시그널이 취소로 처리되지 않도록 먼저 해제
+        self._retire_ai_thread()
+        
         if self.ai_progress_dialog:
             self.ai_progress_dialog.close()
             self.ai_progress_dialog = None
@@ -517,6 +716,8 @@ class BugReportApp(QWidget):
     
     def _on_ai_generation_error(self, error_message: str):
         """AI 생성 실패 시 호출"""
+        self._retire_ai_thread()
+        
         if self.ai_progress_dialog:
             self.ai_progress_dialog.close()
             self.ai_progress_dialog = None
@@ -536,8 +737,12 @@ class BugReportApp(QWidget):
     def _on_ai_generation_canceled(self):
         """AI 생성 취소 시 호출"""
         if self.ai_thread and self.ai_thread.isRunning():
-            self.ai_thread.terminate()
-            self.ai_thread.wait()
+            # terminate() 대신 협조적 취소: 스레드가 스트림을 닫으면 서버 측 생성도 중단됨
+            self.ai_thread.cancel()
+            self.ai_thread.finished.disconnect()
+            self.ai_thread.error.disconnect()
+            self.ai_thread.model_missing.disconnect()
+        self._retire_ai_thread()
         
         logger.info("AI 생성 취소됨")
         
@@ -561,11 +766,12 @@ class BugReportApp(QWidget):
         for field_name, widget in self.other_fields.items():
             settings[field_name] = widget.text()
         
-        self.file_manager.save_json(settings, filename)
+        # 메모리만 갱신하고 디스크 기록은 백그라운드에서 모아서 수행
+        get_settings_store(filename).set(settings)
     
     def load_settings(self, filename: str = SETTINGS_FILE):
         """설정을 로드"""
-        settings = self.file_manager.load_json(filename)
+        settings = get_settings_store(filename).get()
         if settings:
             self._apply_settings_to_widgets(settings)
     
@@ -598,6 +804,13 @@ class BugReportApp(QWidget):
         """JIRA 이슈를 실행"""
         # 현재 설정을 프리셋으로 저장
         self.save_preset()
+        # 입력값도 바로 저장 예약 (비정상 종료 시에도 마지막 입력이 남도록)
+        self.save_settings()
+        # 사용한 옵션의 순위 갱신 (자동완성/목록 순서)
+        for field_name, combo_field_widget in self.combo_field_widgets.items():
+            self.options_manager.record_use(
+                field_name, combo_field_widget.options_file, combo_field_widget.widget.currentText()
+            )
         
         # 이슈 데이터 준비
         issue_data = self._prepare_issue_data()
@@ -606,12 +819,20 @@ class BugReportApp(QWidget):
         if self.app_settings.get('excel_export_enabled', True):
             self._export_to_excel(issue_data)
         
-        # 스레드에서 실행
-        def thread_function():
-            create_issue(**issue_data)
-        
-        issue_thread = threading.Thread(target=thread_function)
-        issue_thread.start()
+        # 공유 스케줄러의 interactive 레인에서 실행 (엑셀 일괄 실행 중이면 다음 행보다 먼저)
+        if self.excel_batch_thread and self.excel_batch_thread.isRunning():
+            logger.info("엑셀 일괄 실행 중: 다음 행보다 먼저 이슈를 생성합니다")
+        future = self.issue_scheduler.create_issue(issue_data, INTERACTIVE)
+        future.add_done_callback(self._on_issue_finished)
+    
+    @staticmethod
+    def _on_issue_finished(future):
+        """Execute 이슈 생성 완료 (스케줄러 스레드에서 호출되므로 로그만 남김)"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            logger.error(f"이슈 생성 실패: {error}")
     
     def _prepare_issue_data(self) -> Dict[str, str]:
         """이슈 데이터를 준비"""
@@ -663,102 +884,109 @@ class BugReportApp(QWidget):
             'team': get_field_value('team')
         }
     
-    def refresh_presets(self):
-        """프리셋들을 새로고침 (새로운 3단계 구조)"""
-        self.widgets['preset_prefix'].clear()
-        self.widgets['preset_name'].clear()
-        self.widgets['preset_version'].clear()
+    def refresh_presets(self, rescan: bool = False):
+        """프리셋들을 새로고침 (새로운 3단계 구조)
         
-        # 정렬 옵션 확인
-        sort_by_date = self.widgets['preset_sort'].currentText() == '최신순'
+        콤보박스 모델은 바뀐 행만 갱신하므로 기존 선택이 유지됩니다.
         
-        # 프리셋을 prefix -> name -> versions 구조로 로드
-        structure = self.preset_manager.get_preset_names_and_versions()
+        Args:
+            rescan: True면 디렉토리를 다시 스캔 (기본은 메모리 카탈로그 사용)
+        """
+        if rescan:
+            self.preset_manager.refresh()
         
-        # Prefix 콤보박스 채우기
-        prefixes = list(structure.keys())
-        if not sort_by_date:
-            prefixes.sort()
+        # 정렬 옵션 확인
+        sort_by_date = self.widgets['preset_sort'].currentText() == '최신순'
         
-        self.widgets['preset_prefix'].addItems(prefixes)
+        # 프리셋을 prefix -> name -> versions 구조로 로드 (정렬된 상태)
+        structure = self.preset_manager.get_preset_names_and_versions(sort_by_date)
+        self._preset_generation = self.preset_manager.catalog.generation
         self._structure = structure  # 구조 저장
         
-        # 첫 번째 항목 선택
-        if prefixes:
-            self.widgets['preset_prefix'].setCurrentIndex(0)
-            self._on_prefix_changed()
+        # Prefix 콤보박스 갱신 후 하위 콤보박스도 선택을 유지한 채 갱신
+        self._set_preset_combo_items('preset_prefix', [(prefix, prefix) for prefix in structure], keep_selection=True)
+        self._on_prefix_changed(keep_selection=True)
+    
+    def _set_preset_combo_items(self, key: str, items: list, keep_selection: bool):
+        """프리셋 콤보박스 모델 갱신 (갱신 중 발생하는 선택 변경 신호는 무시)"""
+        combo = self.widgets[key]
+        self._updating_presets = True
+        try:
+            combo.model().set_items(items)
+            if combo.count() and (not keep_selection or combo.currentIndex() < 0):
+                combo.setCurrentIndex(0)
+        finally:
+            self._updating_presets = False
     
-    def _on_prefix_changed(self):
+    def _on_prefix_changed(self, keep_selection: bool = False):
         """Prefix가 변경되었을 때"""
-        current_prefix = self.widgets['preset_prefix'].currentText()
-        if not current_prefix or not hasattr(self, '_structure'):
+        if self._updating_presets or not hasattr(self, '_structure'):
             return
-            
-        self.widgets['preset_name'].clear()
-        self.widgets['preset_version'].clear()
-        
-        # 선택된 prefix의 name들을 로드
-        if current_prefix in self._structure:
-            names = list(self._structure[current_prefix].keys())
-            names.sort()
-            self.widgets['preset_name'].addItems(names)
-            
-            # 첫 번째 name 선택
-            if names:
-                self.widgets['preset_name'].setCurrentIndex(0)
-                self._on_name_changed()
+        
+        # 선택된 prefix의 name들을 로드 (첫 번째 name 선택)
+        current_prefix = self.widgets['preset_prefix'].currentData(Qt.UserRole)
+        names = sorted(self._structure.get(current_prefix, {}))
+        self._set_preset_combo_items('preset_name', [(name, name) for name in names], keep_selection)
+        self._on_name_changed(keep_selection)
     
-    def _on_name_changed(self):
+    def _on_name_changed(self, keep_selection: bool = False):
         """Name이 변경되었을 때"""
-        current_prefix = self.widgets['preset_prefix'].currentText()
-        current_name = self.widgets['preset_name'].currentText()
-        
-        if not current_prefix or not current_name or not hasattr(self, '_structure'):
+        if self._updating_presets or not hasattr(self, '_structure'):
             return
-            
-        self.widgets['preset_version'].clear()
         
-        # 선택된 name의 버전들을 로드
-        if current_prefix in self._structure and current_name in self._structure[current_prefix]:
-            versions = self._structure[current_prefix][current_name]
-            version_items = []
-            
-            for version_num, filename in versions:
-                if version_num == 0:
-                    version_items.append(f"원본 ({filename})")
-                else:
-                    version_items.append(f"v{version_num} ({filename})")
-            
-            self.widgets['preset_version'].addItems(version_items)
-            
-            # 첫 번째 버전(최신) 선택
-            if version_items:
-                self.widgets['preset_version'].setCurrentIndex(0)
+        # 선택된 name의 버전들을 로드 (첫 번째 버전(최신) 선택)
+        current_prefix = self.widgets['preset_prefix'].currentData(Qt.UserRole)
+        current_name = self.widgets['preset_name'].currentData(Qt.UserRole)
+        versions = self._structure.get(current_prefix, {}).get(current_name, [])
+        
+        version_items = []
+        for version_num, filename in versions:
+            if version_num == 0:
+                version_items.append((filename, f"원본 ({filename})"))
+            else:
+                version_items.append((filename, f"v{version_num} ({filename})"))
+        
+        self._set_preset_combo_items('preset_version', version_items, keep_selection)
+    
+    def _selected_preset_filename(self) -> Optional[str]:
+        """버전 콤보박스에서 선택된 프리셋 파일명"""
+        return self.widgets['preset_version'].currentData(Qt.UserRole)
+    
+    def _prefetch_preset_row(self, row: int):
+        """버전 콤보박스의 해당 행 프리셋을 백그라운드에서 미리 로드"""
+        if self._updating_presets or row < 0:
+            return
+        filename = self.widgets['preset_version'].itemData(row, Qt.UserRole)
+        if filename:
+            self.preset_manager.prefetch_preset(filename)
     
     def apply_preset(self):
-        """프리셋을 적용"""
-        current_prefix = self.widgets['preset_prefix'].currentText()
-        current_name = self.widgets['preset_name'].currentText()
-        version_text = self.widgets['preset_version'].currentText()
+        """프리셋을 적용 (캐시에 없으면 백그라운드에서 로드 후 적용)"""
+        selected_filename = self._selected_preset_filename()
+        if not selected_filename:
+            return
         
-        if not current_prefix or not current_name or not version_text:
+        self.widgets['preset_line'].setText(selected_filename[:-5])  # .json 제거
+        settings = self.preset_manager.peek_preset(selected_filename)
+        if settings is not None:
+            self._pending_apply = None
+            self._apply_settings_to_widgets(settings)
             return
-            
-        # 선택된 파일명 찾기
-        if hasattr(self, '_structure') and current_prefix in self._structure and current_name in self._structure[current_prefix]:
-            versions = self._structure[current_prefix][current_name]
-            selected_filename = None
-            
-            for version_num, filename in versions:
-                if version_text.endswith(f"({filename})"):
-                    selected_filename = filename
-                    break
-            
-            if selected_filename:
-                self.widgets['preset_line'].setText(selected_filename[:-5])  # .json 제거
-                settings = self.preset_manager.load_preset(selected_filename)
-                if settings:
-                    self._apply_settings_to_widgets(settings)
+        
+        # 마지막으로 요청한 프리셋만 적용 (빠르게 여러 번 눌러도 순서가 뒤섞이지 않음)
+        self._pending_apply = selected_filename
+        future = self.preset_manager.load_preset_async(selected_filename)
+        future.add_done_callback(
+            lambda f: self.preset_loaded.emit(selected_filename, None if f.cancelled() else f.result())
+        )
+    
+    def _on_preset_loaded(self, filename: str, settings):
+        """백그라운드 프리셋 로드 완료 (GUI 스레드에서 실행)"""
+        if filename != self._pending_apply:
+            return
+        self._pending_apply = None
+        if settings:
+            self._apply_settings_to_widgets(settings)
     
     def save_preset(self):
         """프리셋을 저장"""
@@ -806,23 +1034,7 @@ class BugReportApp(QWidget):
     
     def delete_preset(self):
         """프리셋을 삭제"""
-        current_prefix = self.widgets['preset_prefix'].currentText()
-        current_name = self.widgets['preset_name'].currentText()
-        version_text = self.widgets['preset_version'].currentText()
-        
-        if not current_prefix or not current_name or not version_text:
-            return
-
-        # 선택된 파일명 찾기
-        selected_filename = None
-        if hasattr(self, '_structure') and current_prefix in self._structure and current_name in self._structure[current_prefix]:
-            versions = self._structure[current_prefix][current_name]
-            
-            for version_num, filename in versions:
-                if version_text.endswith(f"({filename})"):
-                    selected_filename = filename
-                    break
-        
+        selected_filename = self._selected_preset_filename()
         if not selected_filename:
             return
 
@@ -881,7 +1093,7 @@ class BugReportApp(QWidget):
     
     def _load_app_settings(self) -> Dict[str, Any]:
         """앱 설정을 로드"""
-        settings = self.file_manager.load_json(APP_SETTINGS_FILE)
+        settings = get_settings_store(APP_SETTINGS_FILE).get()
         if settings is None:
             # 기본값
             return {'excel_export_enabled': True}
@@ -889,7 +1101,7 @@ class BugReportApp(QWidget):
     
     def _save_app_settings(self):
         """앱 설정을 저장"""
-        self.file_manager.save_json(self.app_settings, APP_SETTINGS_FILE)
+        get_settings_store(APP_SETTINGS_FILE).set(self.app_settings)
     
     def _export_to_excel(self, issue_data: Dict[str, str]):
         """이슈 데이터를 엑셀 파일로 추출"""
@@ -1028,33 +1240,114 @@ class BugReportApp(QWidget):
             QMessageBox.warning(self, "파일 없음", f"파일을 찾을 수 없습니다:\n{excel_path}")
             return
         
+        if os.path.splitext(excel_path)[1].lower() == '.xlsx':
+            try:
+                import openpyxl
+            except ImportError:
+                QMessageBox.critical(
+                    self,
+                    "패키지 누락",
+                    "openpyxl 패키지가 필요합니다.\n\n"
+                    "다음 명령어로 설치하세요:\n"
+                    "pip install openpyxl\n\n"
+                    "(CSV/JSONL 파일은 openpyxl 없이 실행할 수 있습니다)"
+                )
+                return
+        
+        if self.batch_prepare_thread is not None and self.batch_prepare_thread.isRunning():
+            return  # 이미 확인 중
+        
+        # 헤더 확인/행 수/사전 검증은 파일 전체를 읽으므로 작업 스레드에서
+        self._set_excel_batch_checking(True)
         try:
-            import openpyxl
-        except ImportError:
-            QMessageBox.critical(
-                self,
-                "패키지 누락",
-                "openpyxl 패키지가 필요합니다.\n\n"
-                "다음 명령어로 설치하세요:\n"
-                "pip install openpyxl"
+            thread = BatchPrepareThread(
+                excel_path, build_domains(self.options_manager, load_cached_field_options())
             )
-            return
-        
+            thread.finished.connect(self._on_excel_batch_prepared)
+            thread.error.connect(self._on_excel_batch_prepare_error)
+            thread.start()
+            self.batch_prepare_thread = thread
+        except Exception as e:
+            self._set_excel_batch_checking(False)
+            logger.error(f"엑셀 일괄 실행 준비 실패: {e}", exc_info=True)
+            QMessageBox.critical(self, "오류", f"엑셀 파일 처리 중 오류가 발생했습니다:\n\n{str(e)}")
+    
+    def _set_excel_batch_checking(self, checking: bool):
+        """입력 파일 확인 중에는 일괄 실행 버튼을 비활성화하고 버튼 글자로 진행 표시"""
+        execute_btn = self.excel_widgets['execute_btn']
+        if checking:
+            self._excel_execute_text = execute_btn.text()
+            execute_btn.setText("⏳ 확인 중...")
+        elif self._excel_execute_text:
+            execute_btn.setText(self._excel_execute_text)
+        execute_btn.setEnabled(not checking)
+    
+    def _on_excel_batch_prepare_error(self, message: str):
+        """입력 파일 확인 실패"""
+        try:
+            QMessageBox.critical(self, "오류", f"엑셀 파일 처리 중 오류가 발생했습니다:\n\n{message}")
+        finally:
+            self._set_excel_batch_checking(False)
+    
+    def _on_excel_batch_prepared(self, excel_path: str, plan: BatchPlan):
+        """입력 파일 확인 완료: 헤더/검증 결과를 보여주고 확인 후 실행"""
+        try:
+            self._start_prepared_excel_batch(excel_path, plan)
+        finally:
+            self._set_excel_batch_checking(False)
+    
+    def _start_prepared_excel_batch(self, excel_path: str, plan: BatchPlan):
+        """확인 결과 안내/사용자 확인 후 일괄 실행 스레드 시작"""
         try:
-            # 엑셀 파일 읽기 (데이터 개수 확인용)
-            wb = openpyxl.load_workbook(excel_path)
-            ws = wb.active
-            data_rows = ws.max_row - 1  # 헤더 제외
+            data_rows = plan.rows
             
             if data_rows <= 0:
                 QMessageBox.warning(self, "데이터 없음", "엑셀 파일에 데이터가 없습니다.")
                 return
             
+            # 헤더 확인 (알 수 없는 열/없는 필수 열을 실행 전에 알림)
+            header_mapping = plan.headers
+            if header_mapping.missing_required:
+                QMessageBox.warning(
+                    self, "헤더 오류",
+                    "필수 열이 없습니다: " + ", ".join(header_mapping.missing_required) + "\n\n"
+                    "첫 행에 Summary(또는 요약/제목) 열이 있어야 합니다."
+                )
+                return
+            header_notice = ''.join(f"⚠ {message}\n" for message in header_mapping.problems())
+            if header_notice:
+                header_notice += "\n"
+            
+            # 사전 검증 결과 (브라우저 작업 전에 허용 값에 없는 값을 가진 행)
+            report = plan.report
+            skip_rows = report.error_rows
+            if skip_rows:
+                if len(skip_rows) >= data_rows:
+                    QMessageBox.warning(
+                        self, "검증 실패",
+                        f"모든 행에 오류가 있어 실행할 수 없습니다.\n\n{report.format(include_warnings=False)}"
+                    )
+                    return
+                reply = QMessageBox.question(
+                    self,
+                    "검증 오류",
+                    f"{len(skip_rows)}개 행에 오류가 있습니다.\n\n{report.format()}\n\n"
+                    f"오류가 있는 행을 제외하고 계속하시겠습니까?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No
+                )
+                if reply != QMessageBox.Yes:
+                    return
+                data_rows -= len(skip_rows)
+            elif report.warnings:
+                header_notice += f"⚠ 확인 필요한 값 {len(report.warnings)}건\n{report.format(limit=5)}\n\n"
+            
             # 확인 대화상자
             reply = QMessageBox.question(
                 self,
                 "일괄 실행 확인",
                 f"총 {data_rows}개의 이슈를 순차적으로 생성합니다.\n\n"
+                f"{header_notice}"
                 f"• 각 이슈는 별도의 브라우저 탭에서 생성됩니다.\n"
                 f"• 자동으로 연속 실행되며, 완료 후 각 탭에서 확인/수정 가능합니다.\n"
                 f"• 프로그레스바의 '중단' 버튼으로 중지할 수 있습니다.\n\n"
@@ -1081,7 +1374,8 @@ class BugReportApp(QWidget):
             self.excel_progress_dialog.show()
             
             # 스레드 생성 및 시작
-            self.excel_batch_thread = ExcelBatchThread(excel_path)
+            self.excel_batch_thread = ExcelBatchThread(excel_path, self.issue_scheduler,
+                                                       total=data_rows, skip_rows=skip_rows)
             self.excel_batch_thread.progress_update.connect(self._on_excel_progress_update)
             self.excel_batch_thread.issue_created.connect(self._on_excel_issue_created)
             self.excel_batch_thread.error_occurred.connect(self._on_excel_error_occurred)
@@ -1170,6 +1464,20 @@ class BugReportApp(QWidget):
     def closeEvent(self, event):
         """창 닫기 이벤트 처리"""
         self.save_settings()
+        
+        # 실행 중인 AI 스레드 정리 (취소 후 스트림이 닫힐 때까지 잠시 대기)
+        ai_threads = list(self._retired_ai_threads)
+        if self.ai_thread:
+            ai_threads.append(self.ai_thread)
+        for thread in ai_threads:
+            thread.cancel()
+            thread.wait(2000)
+        
+        self.preset_manager.shutdown()
+        self.issue_scheduler.shutdown(wait=False, cancel_pending=True)
+        if self.build_feed:
+            self.build_feed.stop()
+        flush_settings_stores()
         event.accept()
 
 
@@ -0,0 +1,300 @@
+"""
+프리셋 카탈로그 모듈
+preset 디렉토리를 한 번만 스캔하고 prefix -> name -> versions 트리를 메모리에 유지합니다.
+이후 변경은 저장/삭제 알림 또는 파일 감시(refresh)로 증분 반영합니다.
+"""
+import os
+import logging
+import threading
+from typing import Dict, Optional, List, Tuple, NamedTuple, Callable, Set
+
+from config import SETTINGS_FILE, APP_SETTINGS_FILE, BUILD_FEED_STATE_FILE, JiraRestConfig
+
+logger = logging.getLogger(__name__)
+
+# preset 디렉토리에 함께 저장되지만 프리셋이 아닌 파일들
+NON_PRESET_FILES = {
+    os.path.basename(SETTINGS_FILE),
+    os.path.basename(APP_SETTINGS_FILE),
+    os.path.basename(JiraRestConfig.FIELD_OPTIONS_FILE),  # JIRA 필드 허용 값 캐시
+    os.path.basename(BUILD_FEED_STATE_FILE),  # 빌드 피드 읽은 위치
+}
+
+
+class PresetEntry(NamedTuple):
+    """프리셋 파일 하나의 메타데이터"""
+    filename: str
+    prefix: str
+    name: str
+    version: int
+    mtime: float
+
+
+def parse_preset_filename(filename: str) -> Tuple[str, str, int]:
+    """
+    프리셋 파일명을 (prefix, name, version)으로 분해
+
+    예: 'UI_인벤토리_3.json' -> ('UI', '인벤토리', 3), 'UI_인벤토리.json' -> ('UI', '인벤토리', 0)
+    """
+    file_base = filename[:-5] if filename.endswith('.json') else filename
+    parts = file_base.split('_')
+
+    if len(parts) >= 2:
+        prefix = parts[0]
+        # 버전이 있는지 확인 (마지막이 숫자인지)
+        if parts[-1].isdigit():
+            name = '_'.join(parts[1:-1])
+            version = int(parts[-1])
+        else:
+            name = '_'.join(parts[1:])
+            version = 0  # 원본 버전
+    else:
+        # prefix만 있는 경우
+        prefix = parts[0]
+        name = ""
+        version = 0
+
+    return prefix, name, version
+
+
+def _version_keys(filename: str) -> List[Tuple[str, int]]:
+    """
+    파일이 차지하는 (베이스명, 버전) 목록
+
+    'a_b_3.json'은 베이스 'a_b_3'의 원본이면서 베이스 'a_b'의 3번째 버전이기도 합니다.
+    """
+    file_base = filename[:-5]
+    keys = [(file_base, 0)]
+    head, sep, tail = file_base.rpartition('_')
+    if sep and tail.isdigit():
+        keys.append((head, int(tail)))
+    return keys
+
+
+def _versioned_filename(base_name: str, version: int) -> str:
+    """베이스명과 버전으로 파일명 생성 (0은 원본)"""
+    return f"{base_name}.json" if version == 0 else f"{base_name}_{version}.json"
+
+
+class PresetCatalog:
+    """메모리 내 프리셋 카탈로그"""
+
+    def __init__(self, preset_dir: str):
+        self.preset_dir = preset_dir
+        self._lock = threading.RLock()
+        self._entries: Dict[str, PresetEntry] = {}
+        self._tree: Dict[str, Dict[str, Dict[int, str]]] = {}  # prefix -> name -> {version: filename}
+        self._base_versions: Dict[str, Set[int]] = {}  # 베이스명 -> 사용 중인 버전
+        self._structure_cache: Dict[bool, Dict[str, Dict[str, list]]] = {}
+        self._scanned = False
+        self.generation = 0  # 내용이 바뀔 때마다 증가 (화면 갱신 필요 여부 판단용)
+        self._listeners: List[Callable[[Set[str], Set[str]], None]] = []
+
+    # ------------------------------------------------------------------
+    # 스캔 / 변경 반영
+    # ------------------------------------------------------------------
+    def _scan_directory(self) -> Dict[str, float]:
+        """os.scandir 한 번으로 (파일명 -> 수정 시각) 수집"""
+        found = {}
+        try:
+            with os.scandir(self.preset_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith('.json') and name not in NON_PRESET_FILES and entry.is_file():
+                        found[name] = entry.stat().st_mtime
+        except FileNotFoundError:
+            logger.warning(f"프리셋 디렉토리 없음: {self.preset_dir}")
+        except OSError as e:
+            logger.error(f"프리셋 디렉토리 스캔 실패: {e}")
+        return found
+
+    def ensure_scanned(self):
+        """최초 접근 시 한 번만 전체 스캔"""
+        if not self._scanned:
+            self.refresh()
+
+    def refresh(self) -> Tuple[Set[str], Set[str]]:
+        """
+        디렉토리를 다시 스캔하여 바뀐 부분만 반영
+
+        Returns:
+            (추가/수정된 파일명 집합, 삭제된 파일명 집합)
+        """
+        found = self._scan_directory()
+        with self._lock:
+            initial = not self._scanned
+            removed = {f for f in self._entries if f not in found}
+            changed = {f for f, mtime in found.items()
+                       if f not in self._entries or self._entries[f].mtime != mtime}
+
+            for filename in removed:
+                self._remove_entry(filename)
+            for filename in changed:
+                self._add_entry(filename, found[filename])
+
+            if initial:
+                logger.info(f"프리셋 카탈로그 스캔 완료: {len(self._entries)}개")
+            self._scanned = True
+
+        # 최초 스캔은 변경이 아니므로 리스너에 알리지 않음
+        if not initial and (changed or removed):
+            self._notify(changed, removed)
+        return changed, removed
+
+    def add(self, filename: str, mtime: Optional[float] = None):
+        """저장된 프리셋을 카탈로그에 반영 (디렉토리 재스캔 없음)"""
+        if filename in NON_PRESET_FILES or not filename.endswith('.json'):
+            return
+        if mtime is None:
+            try:
+                mtime = os.path.getmtime(os.path.join(self.preset_dir, filename))
+            except OSError:
+                mtime = 0.0
+        with self._lock:
+            self._add_entry(filename, mtime)
+        self._notify({filename}, set())
+
+    def remove(self, filename: str):
+        """삭제된 프리셋을 카탈로그에서 제거"""
+        with self._lock:
+            if filename not in self._entries:
+                return
+            self._remove_entry(filename)
+        self._notify(set(), {filename})
+
+    def _add_entry(self, filename: str, mtime: float):
+        if filename in self._entries:
+            self._remove_entry(filename)
+
+        prefix, name, version = parse_preset_filename(filename)
+        self._entries[filename] = PresetEntry(filename, prefix, name, version, mtime)
+        self._tree.setdefault(prefix, {}).setdefault(name, {})[version] = filename
+        for base, base_version in _version_keys(filename):
+            self._base_versions.setdefault(base, set()).add(base_version)
+        self._structure_cache.clear()
+        self.generation += 1
+
+    def _remove_entry(self, filename: str):
+        entry = self._entries.pop(filename)
+        names = self._tree.get(entry.prefix, {})
+        versions = names.get(entry.name, {})
+        if versions.get(entry.version) == filename:
+            del versions[entry.version]
+        if not versions:
+            names.pop(entry.name, None)
+        if not names:
+            self._tree.pop(entry.prefix, None)
+        for base, base_version in _version_keys(filename):
+            used = self._base_versions.get(base)
+            if used is not None:
+                used.discard(base_version)
+                if not used:
+                    del self._base_versions[base]
+        self._structure_cache.clear()
+        self.generation += 1
+
+    def add_listener(self, callback: Callable[[Set[str], Set[str]], None]):
+        """변경 알림 콜백 등록 - callback(추가/수정 파일명, 삭제 파일명)"""
+        self._listeners.append(callback)
+
+    def _notify(self, changed: Set[str], removed: Set[str]):
+        for callback in list(self._listeners):
+            try:
+                callback(changed, removed)
+            except Exception as e:
+                logger.error(f"프리셋 카탈로그 리스너 오류: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        self.ensure_scanned()
+        return len(self._entries)
+
+    def __contains__(self, filename: str) -> bool:
+        self.ensure_scanned()
+        return filename in self._entries
+
+    def get_entry(self, filename: str) -> Optional[PresetEntry]:
+        """파일명으로 메타데이터 조회"""
+        self.ensure_scanned()
+        return self._entries.get(filename)
+
+    def entries(self) -> List[PresetEntry]:
+        """모든 프리셋 메타데이터"""
+        self.ensure_scanned()
+        with self._lock:
+            return list(self._entries.values())
+
+    def files(self, sort_by_date: bool = True) -> List[str]:
+        """프리셋 파일명 목록 (최신순 또는 알파벳순)"""
+        entries = self.entries()
+        if sort_by_date:
+            entries.sort(key=lambda e: e.mtime, reverse=True)
+            return [e.filename for e in entries]
+        return sorted(e.filename for e in entries)
+
+    def get_structure(self, sort_by_date: bool = True) -> Dict[str, Dict[str, list]]:
+        """
+        prefix -> name -> [(version, filename), ...] 구조 반환
+
+        prefix 순서는 최신순이면 가장 최근에 수정된 파일 기준, 아니면 이름순.
+        버전은 내림차순(최신 먼저). 결과는 변경이 있을 때까지 캐시됩니다.
+        """
+        self.ensure_scanned()
+        with self._lock:
+            cached = self._structure_cache.get(sort_by_date)
+            if cached is not None:
+                return cached
+
+            if sort_by_date:
+                latest = {}
+                for entry in self._entries.values():
+                    if entry.mtime > latest.get(entry.prefix, -1.0):
+                        latest[entry.prefix] = entry.mtime
+                prefixes = sorted(self._tree, key=lambda p: latest.get(p, 0.0), reverse=True)
+            else:
+                prefixes = sorted(self._tree)
+
+            structure = {
+                prefix: {
+                    name: sorted(versions.items(), reverse=True)
+                    for name, versions in self._tree[prefix].items()
+                }
+                for prefix in prefixes
+            }
+            self._structure_cache[sort_by_date] = structure
+            return structure
+
+    def get_versions(self, prefix: str, name: str) -> List[Tuple[int, str]]:
+        """특정 이름의 (version, filename) 목록 (최신 먼저)"""
+        self.ensure_scanned()
+        with self._lock:
+            versions = self._tree.get(prefix, {}).get(name, {})
+            return sorted(versions.items(), reverse=True)
+
+    def latest_version_filename(self, base_name: str) -> Optional[str]:
+        """베이스명의 가장 최신 버전 파일명 (없으면 None)"""
+        self.ensure_scanned()
+        with self._lock:
+            versions = self._base_versions.get(base_name)
+            if not versions:
+                return None
+            return _versioned_filename(base_name, max(versions))
+
+    def later_versions(self, filename: str) -> List[str]:
+        """filename보다 나중에 저장된 같은 계열의 버전 파일명들 (델타 의존 후보)"""
+        self.ensure_scanned()
+        with self._lock:
+            later = []
+            for base, version in _version_keys(filename):
+                later.extend(_versioned_filename(base, v)
+                             for v in self._base_versions.get(base, ()) if v > version)
+            return later
+
+    def next_version_filename(self, base_name: str) -> str:
+        """다음 버전의 파일명 (디렉토리를 다시 읽지 않음)"""
+        self.ensure_scanned()
+        with self._lock:
+            versions = self._base_versions.get(base_name)
+            return _versioned_filename(base_name, max(versions) + 1 if versions else 0)
@@ -0,0 +1,255 @@
+"""
+프리셋 버전 델타 인코딩 모듈
+execute()마다 저장되는 거의 같은 프리셋 버전을 이전 버전 대비 변경분만 기록합니다.
+
+파일 형식:
+- 전체 스냅샷: 기존과 같은 일반 프리셋 JSON
+- 델타: {"__delta__": {"base": 부모 파일명, "depth": 체인 길이,
+                       "set": {바뀐 필드: 값}, "patch": {긴 텍스트 필드: 줄 단위 패치},
+                       "unset": [삭제된 필드]}}
+
+체인이 PRESET_SNAPSHOT_INTERVAL에 도달하면 다시 전체 스냅샷을 저장하므로
+한 버전을 복원할 때 읽는 파일 수는 제한됩니다. 복원된 버전은 LRU로 캐시합니다.
+"""
+import difflib
+import json
+import os
+import threading
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Union
+
+from config import PRESET_SNAPSHOT_INTERVAL, PRESET_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+DELTA_KEY = '__delta__'
+
+# 이 길이 이상의 텍스트 필드는 줄 단위 패치로 저장 시도 (steps/description 등)
+LINE_PATCH_MIN_LENGTH = 200
+
+_MISSING = object()
+
+# 줄 단위 패치 항목: [시작, 끝] (부모의 줄 범위 복사) 또는 문자열 (새 내용)
+PatchOp = Union[List[int], str]
+
+
+def is_delta(raw: Any) -> bool:
+    """파일 내용이 델타 형식인지"""
+    return isinstance(raw, dict) and DELTA_KEY in raw
+
+
+def _line_patch(old: str, new: str) -> List[PatchOp]:
+    """old -> new 줄 단위 패치 생성"""
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops: List[PatchOp] = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append(''.join(new_lines[j1:j2]))
+    return ops
+
+
+def _apply_line_patch(old: str, ops: List[PatchOp]) -> str:
+    """줄 단위 패치 적용"""
+    old_lines = old.splitlines(keepends=True)
+    return ''.join(''.join(old_lines[op[0]:op[1]]) if isinstance(op, list) else op for op in ops)
+
+
+def make_delta(parent: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    parent -> data 변경분 계산
+
+    Returns:
+        {'set': ..., 'patch': ..., 'unset': ...} (바뀐 것이 없으면 모두 비어 있음)
+    """
+    changed, patches = {}, {}
+    for key, value in data.items():
+        old = parent.get(key, _MISSING)
+        if old == value:
+            continue
+        if isinstance(value, str) and isinstance(old, str) and len(value) >= LINE_PATCH_MIN_LENGTH:
+            ops = _line_patch(old, value)
+            if len(json.dumps(ops, ensure_ascii=False)) < len(json.dumps(value, ensure_ascii=False)):
+                patches[key] = ops
+                continue
+        changed[key] = value
+
+    delta = {}
+    if changed:
+        delta['set'] = changed
+    if patches:
+        delta['patch'] = patches
+    unset = [key for key in parent if key not in data]
+    if unset:
+        delta['unset'] = unset
+    return delta
+
+
+def apply_delta(parent: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """부모 데이터에 변경분을 적용한 새 딕셔너리 반환"""
+    data = dict(parent)
+    for key in delta.get('unset', ()):
+        data.pop(key, None)
+    for key, ops in delta.get('patch', {}).items():
+        data[key] = _apply_line_patch(str(parent.get(key, '')), ops)
+    data.update(delta.get('set', {}))
+    return data
+
+
+class PresetMaterializer:
+    """델타 체인을 따라 프리셋 버전을 복원하고 LRU로 캐시"""
+
+    def __init__(self, preset_dir: str, cache_size: int = PRESET_CACHE_SIZE,
+                 snapshot_interval: int = PRESET_SNAPSHOT_INTERVAL):
+        self.preset_dir = preset_dir
+        self.cache_size = cache_size
+        self.snapshot_interval = snapshot_interval
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # 파일명 -> (데이터, 체인 길이)
+        self._lock = threading.RLock()
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.preset_dir, filename)
+
+    def read_raw(self, filename: str) -> Any:
+        """파일 내용을 그대로 읽음 (델타 복원 없음)"""
+        with open(self._path(filename), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_raw(self, filename: str, raw: Dict[str, Any]):
+        # 임시 파일 + os.replace로 교체 (쓰는 도중 종료/디스크 부족에도 기존 파일, 즉
+        # 이 버전을 부모로 쓰는 델타 체인이 깨지지 않음). utils가 이 모듈을 import 하므로 지연 import
+        from utils import FileManager
+
+        FileManager.save_json(raw, self._path(filename))
+
+    def _remember(self, filename: str, data: Dict[str, Any], depth: int):
+        self._cache[filename] = (data, depth)
+        self._cache.move_to_end(filename)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _load_with_depth(self, filename: str) -> tuple:
+        """(복원된 데이터, 델타 체인 길이) 반환 - 캐시 우선"""
+        cached = self._cache.get(filename)
+        if cached is not None:
+            self._cache.move_to_end(filename)
+            return cached
+
+        # 캐시된 조상 또는 전체 스냅샷까지 체인을 거슬러 올라간 뒤 순서대로 적용
+        chain = []
+        current = filename
+        while True:
+            cached = self._cache.get(current)
+            if cached is not None:
+                data, depth = cached
+                break
+            raw = self.read_raw(current)
+            if not is_delta(raw):
+                data, depth = raw, 0
+                self._remember(current, data, depth)
+                break
+            chain.append((current, raw[DELTA_KEY]))
+            current = raw[DELTA_KEY]['base']
+            if len(chain) > self.snapshot_interval * 4:
+                raise ValueError(f"프리셋 델타 체인이 너무 깁니다: {filename}")
+
+        for name, delta in reversed(chain):
+            data = apply_delta(data, delta)
+            depth += 1
+            self._remember(name, data, depth)
+        return data, depth
+
+    def load(self, filename: str) -> Dict[str, Any]:
+        """
+        프리셋 버전 복원
+
+        Raises:
+            OSError / ValueError: 파일이 없거나 체인이 깨진 경우
+        """
+        with self._lock:
+            data, _ = self._load_with_depth(filename)
+            return dict(data)
+
+    def peek(self, filename: str) -> Optional[Dict[str, Any]]:
+        """캐시에 있으면 복원된 데이터 반환 (파일을 읽지 않음)"""
+        with self._lock:
+            cached = self._cache.get(filename)
+            if cached is None:
+                return None
+            self._cache.move_to_end(filename)
+            return dict(cached[0])
+
+    def save(self, filename: str, data: Dict[str, Any], parent: Optional[str] = None) -> bool:
+        """
+        새 버전 저장 - 부모가 있으면 델타로, 체인이 길면 전체 스냅샷으로 기록
+
+        Returns:
+            델타로 저장했으면 True
+        """
+        with self._lock:
+            raw, depth = data, 0
+            if parent:
+                try:
+                    parent_data, parent_depth = self._load_with_depth(parent)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"부모 프리셋 '{parent}' 복원 실패, 전체 저장: {e}")
+                else:
+                    if parent_depth + 1 < self.snapshot_interval:
+                        delta = make_delta(parent_data, data)
+                        candidate = {DELTA_KEY: dict(base=parent, depth=parent_depth + 1, **delta)}
+                        if len(json.dumps(candidate, ensure_ascii=False)) < len(json.dumps(data, ensure_ascii=False)):
+                            raw, depth = candidate, parent_depth + 1
+
+            self._write_raw(filename, raw)
+            self._remember(filename, dict(data), depth)
+            return depth > 0
+
+    def detach_dependents(self, filename: str, candidates: List[str]):
+        """
+        삭제 전에 filename을 부모로 쓰는 델타들을 전체 스냅샷으로 바꿔 체인을 끊음
+
+        Args:
+            filename: 삭제할 버전
+            candidates: 의존할 수 있는 후속 버전 파일명들
+        """
+        with self._lock:
+            for candidate in candidates:
+                try:
+                    raw = self.read_raw(candidate)
+                except (OSError, ValueError):
+                    continue
+                if is_delta(raw) and raw[DELTA_KEY].get('base') == filename:
+                    data, _ = self._load_with_depth(candidate)
+                    self._write_raw(candidate, data)
+                    self._remember(candidate, data, 0)
+                    logger.debug(f"프리셋 '{candidate}'를 전체 스냅샷으로 변환")
+            self.invalidate(filename)
+
+    def invalidate(self, filename: str):
+        """캐시에서 제거"""
+        with self._lock:
+            self._cache.pop(filename, None)
+
+    def clear(self):
+        """캐시 전체 비우기 (외부에서 파일이 바뀐 경우)"""
+        with self._lock:
+            self._cache.clear()
+
+
+_materializers: Dict[str, PresetMaterializer] = {}
+_materializers_lock = threading.Lock()
+
+
+def get_materializer(preset_dir: str) -> PresetMaterializer:
+    """preset 디렉토리별 공유 인스턴스 (GUI와 AI 인덱서가 같은 캐시 사용)"""
+    key = os.path.abspath(preset_dir)
+    with _materializers_lock:
+        materializer = _materializers.get(key)
+        if materializer is None:
+            materializer = PresetMaterializer(preset_dir)
+            _materializers[key] = materializer
+        return materializer
@@ -0,0 +1,402 @@
+"""
+SQLite 프리셋 저장소 모듈
+버전별 JSON 파일 대신 단일 DB 파일에 (prefix, name, version) 키로 프리셋을 저장합니다.
+
+- 저장: 버전 계산 + INSERT 한 번 (디렉토리 스캔 없음)
+- 트리 조회: 인덱스를 타는 쿼리 한 번
+- summary 전문 검색 (FTS5, 지원하지 않는 SQLite에서는 LIKE로 대체) + 파일명 부분 일치
+- 기존 preset 디렉토리의 JSON 파일을 그대로 이전 (migrate_from_directory)
+
+GUI/AI 코드와의 호환을 위해 각 버전은 기존과 같은 형식의 파일명 키
+(`prefix_name_N.json`)로 식별합니다.
+
+사용법 (기존 preset 디렉토리 이전):
+    python preset_store.py migrate [preset 디렉토리]
+"""
+import json
+import os
+import sys
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Set, Callable
+
+from config import DIR_PRESET, PRESET_STORE, PRESET_DB_FILE, PRESET_CACHE_SIZE
+from preset_catalog import NON_PRESET_FILES, parse_preset_filename
+from preset_delta import get_materializer
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS presets (
+    prefix   TEXT    NOT NULL,
+    name     TEXT    NOT NULL,
+    version  INTEGER NOT NULL,
+    filename TEXT    NOT NULL UNIQUE,
+    summary  TEXT    NOT NULL DEFAULT '',
+    data     TEXT    NOT NULL,
+    mtime    REAL    NOT NULL,
+    PRIMARY KEY (prefix, name, version)
+);
+CREATE INDEX IF NOT EXISTS idx_presets_mtime ON presets (mtime);
+"""
+
+
+def make_preset_filename(base_name: str, version: int) -> str:
+    """저장할 이름과 버전에 해당하는 파일명 키 (디렉토리 저장 방식과 같은 형식, 0은 원본)"""
+    return f"{base_name}.json" if version == 0 else f"{base_name}_{version}.json"
+
+
+class SqlitePresetStore:
+    """SQLite 기반 프리셋 저장소 (PresetCatalog와 같은 조회 인터페이스 제공)"""
+
+    def __init__(self, db_path: str):
+        import sqlite3  # 기본(directory) 저장 방식에서는 불필요하므로 사용할 때 import
+
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        # AI 인덱싱 스레드에서도 읽으므로 스레드 간 공유 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._fts = self._create_fts()
+        self._conn.commit()
+
+        self.generation = 0  # 내용이 바뀔 때마다 증가 (화면 갱신 필요 여부 판단용)
+        self._structure_cache: Dict[bool, Dict[str, Dict[str, list]]] = {}
+        self._listeners: List[Callable[[Set[str], Set[str]], None]] = []
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # 디코딩된 프리셋 LRU
+
+    def _create_fts(self) -> Optional[str]:
+        """summary 전문 검색 테이블 생성 (trigram > unicode61 > 없음 순으로 시도)"""
+        row = self._conn.execute("SELECT sql FROM sqlite_master WHERE name = 'presets_fts'").fetchone()
+        if row:
+            return 'trigram' if 'trigram' in row[0] else 'unicode61'
+
+        # trigram 토크나이저는 형태소 분석 없이 한글 부분 문자열 검색이 가능 (SQLite 3.34+)
+        import sqlite3
+
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                self._conn.execute(
+                    f"CREATE VIRTUAL TABLE presets_fts USING fts5(filename UNINDEXED, summary, tokenize='{tokenizer}')"
+                )
+                return tokenizer
+            except sqlite3.OperationalError:
+                continue
+        logger.warning("SQLite FTS5를 사용할 수 없어 summary 검색에 LIKE를 사용합니다.")
+        return None
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def _changed(self):
+        self._structure_cache.clear()
+        self.generation += 1
+
+    def add_listener(self, callback: Callable[[Set[str], Set[str]], None]):
+        """변경 알림 콜백 등록 - callback(추가된 파일명 키, 삭제된 파일명 키)"""
+        self._listeners.append(callback)
+
+    def _notify(self, changed: Set[str], removed: Set[str]):
+        for callback in list(self._listeners):
+            try:
+                callback(changed, removed)
+            except Exception as e:
+                logger.error(f"프리셋 저장소 리스너 오류: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드 / 삭제
+    # ------------------------------------------------------------------
+    def _insert(self, prefix: str, name: str, version: int, filename: str,
+                data: Dict[str, Any], mtime: float) -> bool:
+        """행 하나 추가 (트랜잭션 안에서 호출)"""
+        summary = str(data.get('summary', '') or '')
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO presets (prefix, name, version, filename, summary, data, mtime) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (prefix, name, version, filename, summary, json.dumps(data, ensure_ascii=False), mtime)
+        )
+        if cursor.rowcount == 0:
+            return False
+        if self._fts:
+            self._conn.execute("INSERT INTO presets_fts (filename, summary) VALUES (?, ?)", (filename, summary))
+        return True
+
+    def save(self, base_name: str, data: Dict[str, Any]) -> str:
+        """
+        새 버전으로 저장
+
+        Args:
+            base_name: 'prefix_name' 형식의 이름 (.json 없이)
+            data: 프리셋 데이터
+
+        Returns:
+            저장된 버전의 파일명 키
+        """
+        with self._lock, self._conn:
+            filename = self._next_filename(base_name)
+            # 트리 분류는 디렉토리 방식(PresetCatalog)과 같이 파일명에서 얻음 ('UI_인벤토리_1' -> 인벤토리의 1번째 버전)
+            prefix, name, version = parse_preset_filename(filename)
+            if not self._insert(prefix, name, version, filename, data, time.time()):
+                raise ValueError(f"같은 (prefix, name, version)이 이미 있습니다: {filename}")
+            self._changed()
+        self._notify({filename}, set())
+        return filename
+
+    def load(self, filename: str) -> Optional[Dict[str, Any]]:
+        """파일명 키로 프리셋 로드"""
+        cached = self.peek(filename)
+        if cached is not None:
+            return cached
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM presets WHERE filename = ?", (filename,)).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        with self._lock:
+            self._cache[filename] = data
+            while len(self._cache) > PRESET_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return dict(data)
+
+    def peek(self, filename: str) -> Optional[Dict[str, Any]]:
+        """캐시에 있으면 디코딩된 데이터 반환 (DB를 읽지 않음)"""
+        with self._lock:
+            cached = self._cache.get(filename)
+            if cached is None:
+                return None
+            self._cache.move_to_end(filename)
+            return dict(cached)
+
+    def delete(self, filename: str) -> bool:
+        """파일명 키로 프리셋 삭제"""
+        with self._lock, self._conn:
+            self._cache.pop(filename, None)
+            cursor = self._conn.execute("DELETE FROM presets WHERE filename = ?", (filename,))
+            if cursor.rowcount == 0:
+                return False
+            if self._fts:
+                self._conn.execute("DELETE FROM presets_fts WHERE filename = ?", (filename,))
+            self._changed()
+        self._notify(set(), {filename})
+        return True
+
+    # ------------------------------------------------------------------
+    # 조회 (PresetCatalog와 같은 인터페이스)
+    # ------------------------------------------------------------------
+    def refresh(self) -> Tuple[Set[str], Set[str]]:
+        """DB는 항상 최신이므로 다시 스캔할 것이 없음"""
+        return set(), set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM presets").fetchone()[0]
+
+    def __contains__(self, filename: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM presets WHERE filename = ?", (filename,)).fetchone() is not None
+
+    def files(self, sort_by_date: bool = True) -> List[str]:
+        """프리셋 파일명 키 목록 (최신순 또는 알파벳순)"""
+        order = "mtime DESC" if sort_by_date else "filename"
+        with self._lock:
+            return [row[0] for row in self._conn.execute(f"SELECT filename FROM presets ORDER BY {order}")]
+
+    def stamps(self) -> List[Tuple[str, float]]:
+        """(파일명 키, 저장 시각) 목록 - 예시 인덱스 증분 갱신용"""
+        with self._lock:
+            return self._conn.execute("SELECT filename, mtime FROM presets").fetchall()
+
+    def get_structure(self, sort_by_date: bool = True) -> Dict[str, Dict[str, list]]:
+        """prefix -> name -> [(version, filename), ...] 구조 반환 (쿼리 한 번, 변경 전까지 캐시)"""
+        with self._lock:
+            cached = self._structure_cache.get(sort_by_date)
+            if cached is not None:
+                return cached
+
+            rows = self._conn.execute(
+                "SELECT prefix, name, version, filename, mtime FROM presets ORDER BY prefix, name, version DESC"
+            ).fetchall()
+
+            tree: Dict[str, Dict[str, list]] = {}
+            latest: Dict[str, float] = {}
+            for prefix, name, version, filename, mtime in rows:
+                tree.setdefault(prefix, {}).setdefault(name, []).append((version, filename))
+                if mtime > latest.get(prefix, -1.0):
+                    latest[prefix] = mtime
+
+            if sort_by_date:
+                tree = {prefix: tree[prefix] for prefix in sorted(tree, key=lambda p: latest[p], reverse=True)}
+            self._structure_cache[sort_by_date] = tree
+            return tree
+
+    def _next_filename(self, base_name: str) -> str:
+        """
+        다음 버전의 파일명 키 (PresetCatalog.next_version_filename과 같은 규칙)
+
+        'base.json'은 0번, 'base_N.json'은 N번 버전을 차지합니다. (파일명 유일 인덱스 범위 조회)
+        """
+        rows = self._conn.execute(
+            "SELECT filename FROM presets WHERE filename = ? OR (filename >= ? AND filename < ?)",
+            (f"{base_name}.json", f"{base_name}_", f"{base_name}`")  # '`'는 '_' 다음 문자
+        ).fetchall()
+        versions = set()
+        for (filename,) in rows:
+            tail = filename[len(base_name) + 1:-5]
+            if filename == f"{base_name}.json":
+                versions.add(0)
+            elif filename.endswith('.json') and tail.isdigit():
+                versions.add(int(tail))
+        return make_preset_filename(base_name, max(versions) + 1 if versions else 0)
+
+    def next_version_filename(self, base_name: str) -> str:
+        """다음에 저장될 버전의 파일명 키"""
+        with self._lock:
+            return self._next_filename(base_name)
+
+    def search(self, text: str, limit: int = 20) -> List[str]:
+        """
+        summary 전문 검색 + 파일명 부분 일치
+
+        Args:
+            text: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            파일명 키 목록 (summary 관련도순, LIKE 대체 시 최신순, 이어서 파일명 일치)
+        """
+        return [filename for filename, _ in self.search_summaries(text, limit)]
+
+    def search_summaries(self, text: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """search와 같지만 (파일명 키, summary) 목록을 반환 (GUI 검색 결과 표시용)"""
+        import sqlite3
+
+        text = text.strip()
+        if not text:
+            return []
+
+        pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        with self._lock:
+            rows = None
+            # trigram은 3글자 이상부터 인덱스를 사용할 수 있음
+            if self._fts and (self._fts != 'trigram' or len(text) >= 3):
+                phrase = '"' + text.replace('"', '""') + '"'
+                try:
+                    rows = self._conn.execute(
+                        "SELECT filename, summary FROM presets_fts WHERE presets_fts MATCH ? ORDER BY rank LIMIT ?",
+                        (phrase, limit)
+                    ).fetchall()
+                except sqlite3.OperationalError as e:
+                    logger.debug(f"FTS 검색 실패, LIKE로 대체: {e}")
+
+            if rows is None:
+                rows = self._conn.execute(
+                    "SELECT filename, summary FROM presets WHERE summary LIKE ? ESCAPE '\\' "
+                    "ORDER BY mtime DESC LIMIT ?",
+                    (pattern, limit)
+                ).fetchall()
+            results = [tuple(row) for row in rows]
+
+            # 파일명(접두사/이름)으로도 검색 ('_'는 공백으로 보고 비교)
+            if len(results) < limit:
+                found = {filename for filename, _ in results}
+                for filename, summary in self._conn.execute(
+                    "SELECT filename, summary FROM presets WHERE REPLACE(filename, '_', ' ') LIKE ? ESCAPE '\\' "
+                    "ORDER BY mtime DESC LIMIT ?",
+                    (pattern.replace('\\_', ' '), limit)
+                ):
+                    if filename not in found and len(results) < limit:
+                        results.append((filename, summary))
+            return results
+
+    # ------------------------------------------------------------------
+    # 이전
+    # ------------------------------------------------------------------
+    def migrate_from_directory(self, preset_dir: str) -> int:
+        """
+        preset 디렉토리의 JSON 파일을 DB로 이전 (원본 파일은 그대로 둠)
+
+        이미 있는 파일명 키는 건너뛰므로 여러 번 실행해도 안전합니다.
+
+        Returns:
+            새로 이전된 프리셋 수
+        """
+        migrated = 0
+        materializer = get_materializer(preset_dir)
+        with self._lock, self._conn:
+            with os.scandir(preset_dir) as it:
+                for entry in it:
+                    filename = entry.name
+                    if not filename.endswith('.json') or filename in NON_PRESET_FILES or not entry.is_file():
+                        continue
+                    try:
+                        # 델타로 저장된 버전은 복원한 전체 데이터로 이전
+                        data = materializer.load(filename)
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.warning(f"프리셋 이전 건너뜀 ({filename}): {e}")
+                        continue
+                    if not isinstance(data, dict):
+                        continue
+
+                    prefix, name, version = parse_preset_filename(filename)
+                    if self._insert(prefix, name, version, filename, data, entry.stat().st_mtime):
+                        migrated += 1
+                    elif filename not in self:
+                        logger.warning(f"프리셋 이전 건너뜀 ({filename}): 같은 (prefix, name, version)이 이미 있음")
+            if migrated:
+                self._changed()
+
+        if migrated:
+            logger.info(f"프리셋 {migrated}개를 {self.db_path}로 이전했습니다.")
+        return migrated
+
+
+_stores: Dict[str, SqlitePresetStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_preset_db_store(preset_dir: str = DIR_PRESET) -> Optional[SqlitePresetStore]:
+    """
+    설정(PRESET_STORE)이 'sqlite'이면 preset 디렉토리의 DB 저장소를 반환 (아니면 None)
+
+    GUI와 AI 인덱서가 같은 연결을 공유하도록 경로별로 하나만 엽니다.
+    처음 열 때 DB가 비어 있으면 기존 JSON 프리셋을 자동으로 이전합니다.
+    """
+    if PRESET_STORE != 'sqlite':
+        return None
+
+    db_path = os.path.join(preset_dir, os.path.basename(PRESET_DB_FILE))
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            os.makedirs(preset_dir, exist_ok=True)
+            store = SqlitePresetStore(db_path)
+            if len(store) == 0:
+                store.migrate_from_directory(preset_dir)
+            _stores[db_path] = store
+        return store
+
+
+def main():
+    """명령줄 진입점: 기존 preset 디렉토리를 DB로 이전"""
+    if len(sys.argv) < 2 or sys.argv[1] != 'migrate':
+        print(__doc__)
+        return 1
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+    preset_dir = sys.argv[2] if len(sys.argv) > 2 else DIR_PRESET
+    store = SqlitePresetStore(os.path.join(preset_dir, os.path.basename(PRESET_DB_FILE)))
+    migrated = store.migrate_from_directory(preset_dir)
+    print(f"이전 완료: {migrated}개 (전체 {len(store)}개)")
+    print("JIRAAUTO_PRESET_STORE=sqlite 로 실행하면 DB 저장소를 사용합니다.")
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
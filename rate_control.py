@@ -0,0 +1,168 @@
+"""
+재시도/동시 실행 제어 모듈
+JIRA 요청이 몰릴 때 계정이 제한(throttle)되지 않으면서 허용되는 만큼 빠르게 실행하기 위한 도구입니다.
+
+- RetryPolicy: 일시적 실패에 지수 백오프 + 지터로 재시도 (Retry-After가 있으면 그 이상 대기)
+- AdaptiveLimiter: 동시 실행 한도를 AIMD로 조절
+  (응답이 빠르고 성공하면 한도를 조금씩 늘리고, 지연/429/5xx가 오면 절반으로 줄임)
+"""
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# AdaptiveLimiter.release 신호
+OK = 'ok'            # 성공 (지연이 목표 이하이면 한도 증가)
+CONGESTED = 'congested'  # 429/5xx/타임아웃 등 서버 부하 신호 (한도 감소)
+NEUTRAL = 'neutral'  # 입력 오류처럼 부하와 무관한 실패 (한도 유지)
+
+
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책"""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 jitter: float = 0.5, rng: Callable[[], float] = random.random):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함)
+            base_delay: 첫 재시도 대기 (초), 이후 2배씩 증가
+            max_delay: 대기 상한 (초)
+            jitter: 대기 시간 중 무작위로 줄이는 비율 (0~1, 동시에 실패한 요청이 같은 순간에 몰리지 않도록)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self._rng = rng
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt번째(0부터) 실패 후 대기 시간"""
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        backoff *= 1.0 - self.jitter * self._rng()
+        if retry_after is not None:
+            # 서버가 알려준 시간보다 일찍 다시 요청하지 않음
+            backoff = max(backoff, retry_after)
+        return backoff
+
+    def call(self, fn: Callable[[], T], is_retryable: Callable[[Exception], bool],
+             retry_after: Callable[[Exception], Optional[float]] = lambda e: None,
+             sleep: Callable[[float], None] = time.sleep, description: str = '') -> T:
+        """
+        fn() 실행, is_retryable(예외)가 True인 실패는 백오프 후 재시도
+
+        Raises:
+            마지막 시도의 예외, 또는 재시도 대상이 아닌 예외
+        """
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts or not is_retryable(e):
+                    raise
+                wait = self.delay(attempt, retry_after(e))
+                logger.warning(f"{description or '요청'} 실패, {wait:.1f}초 후 재시도 "
+                               f"({attempt + 1}/{self.max_attempts - 1}): {e}")
+                sleep(wait)
+                attempt += 1
+
+
+class AdaptiveLimiter:
+    """
+    AIMD 동시 실행 한도
+
+    - 성공하고 지연이 latency_target 이하: 한도 += increase / 한도 (한도만큼 성공하면 +increase)
+    - CONGESTED 또는 지연 초과: 한도 *= decrease (cooldown 동안은 한 번만 줄임)
+    - pause(초): Retry-After 동안 새 요청을 모두 대기
+    """
+
+    def __init__(self, initial: float = 2, minimum: float = 1, maximum: float = 16,
+                 latency_target: float = 5.0, increase: float = 1.0, decrease: float = 0.5,
+                 cooldown: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._clock = clock
+        self._limit = min(max(initial, minimum), self.maximum)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float('-inf')
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 실행 한도"""
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """실행 자리가 날 때까지 대기 (timeout 초과 시 False)"""
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._condition:
+            while True:
+                now = self._clock()
+                wait = None
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return True
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._condition.wait(wait)
+
+    def release(self, latency: float, signal: str = OK):
+        """요청 완료 기록 후 한도 조절"""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            if signal == CONGESTED or (signal == OK and latency > self.latency_target):
+                now = self._clock()
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    old = self._limit
+                    self._limit = max(self.minimum, self._limit * self.decrease)
+                    logger.info(f"동시 실행 한도 감소: {old:.1f} -> {self._limit:.1f} "
+                                f"({'지연' if signal == OK else '서버 부하'} {latency:.1f}초)")
+            elif signal == OK:
+                self._limit = min(self.maximum, self._limit + self.increase / self._limit)
+            self._condition.notify_all()
+
+    def pause(self, seconds: float):
+        """Retry-After 동안 새 요청 중지"""
+        with self._condition:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._condition.notify_all()
+        logger.warning(f"JIRA 요청 제한: {seconds:.1f}초 동안 새 요청을 멈춥니다")
+
+    @contextmanager
+    def slot(self, classify: Callable[[Exception], str] = lambda e: CONGESTED):
+        """
+        실행 자리 하나를 잡고 완료 시 지연/결과를 기록
+
+        예외가 나면 classify(예외)로 신호를 정한 뒤 예외를 그대로 전달합니다.
+        """
+        self.acquire()
+        start = self._clock()
+        try:
+            yield
+        except Exception as e:
+            self.release(self._clock() - start, classify(e))
+            raise
+        self.release(self._clock() - start, OK)
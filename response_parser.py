@@ -0,0 +1,326 @@
+"""
+AI 응답 파서 모듈
+LLM이 생성한 (종종 깨진) JSON에서 버그 리포트 필드를 한 번의 선형 스캔으로 복구합니다.
+
+스트리밍 생성 중에도 청크 단위로 feed()할 수 있어, 필요한 필드가 모두 나오면
+생성을 조기 종료할 수 있습니다.
+
+허용하는 오류 유형:
+- 코드 블록(```json) 및 JSON 앞뒤의 설명 문장
+- 문자열 안의 실제 줄바꿈/탭 (이스케이프 누락)
+- 문자열 안의 이스케이프되지 않은 따옴표 (alt="video.mp4" 등)
+- 누락되거나 남는 쉼표, 중첩된 객체
+- 배열로 출력된 값 (줄바꿈으로 합침)
+- 출력 길이 제한으로 잘린 마지막 문자열
+"""
+import re
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 버그 리포트 필수 필드
+REQUIRED_FIELDS = ('priority', 'severity', 'steps', 'description')
+
+# JSON 이스케이프 문자
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f'}
+
+# 문자열 안에서 특별히 처리해야 하는 문자 (그 외는 한 번에 복사)
+_STRING_SPECIAL = re.compile(r'["\\]')
+_KEY_SPECIAL = re.compile(r'["\n]')
+_BARE_END = re.compile(r'[,}\]\n]')
+
+# 이보다 긴 따옴표 문자열은 키로 보지 않음
+_MAX_KEY_LENGTH = 64
+
+# 스캐너 상태
+_SEEK_KEY = 0  # 키 시작(")을 찾는 중
+_IN_KEY = 1  # 키 문자열 수집 중
+_AFTER_KEY = 2  # 키 뒤의 ':'를 기다리는 중
+_SEEK_VALUE = 3  # 값 시작을 찾는 중
+_IN_STRING = 4  # 문자열 값 수집 중
+_MAYBE_END = 5  # 문자열 안에서 따옴표를 만남 - 종료인지 다음 문자로 판단
+_IN_ARRAY = 6  # 배열 값 안에서 다음 항목을 찾는 중
+_IN_BARE = 7  # 따옴표 없는 값 (숫자, true 등)
+
+
+class ResponseFieldScanner:
+    """
+    관대한 단일 패스 JSON 필드 스캐너
+
+    사용 예:
+        scanner = ResponseFieldScanner()
+        for chunk in stream:
+            if scanner.feed(chunk):
+                break  # 필수 필드가 모두 수집됨
+        result = scanner.close()
+    """
+
+    def __init__(self, fields: Tuple[str, ...] = REQUIRED_FIELDS):
+        self.fields_wanted = tuple(fields)
+        self.fields: Dict[str, str] = {}
+        self.truncated = False  # 잘린 문자열을 복구해서 사용했는지
+        self._remaining = len(set(self.fields_wanted))  # 아직 수집하지 못한 필드 수
+
+        self._state = _SEEK_KEY
+        self._key_parts = []
+        self._key_length = 0
+        self._key = None  # 현재 값이 속한 키 (수집 대상이 아니면 None)
+        self._value_parts = []
+        self._array_items = None  # 배열 값 수집 중일 때 항목 목록
+        self._pending = ''  # _MAYBE_END에서 보류 중인 따옴표+공백
+        self._escape = None  # 이스케이프 처리 중인 문자열 ('\\' 또는 '\\uXX..')
+
+    @property
+    def complete(self) -> bool:
+        """필수 필드를 모두 수집했는지"""
+        return self._remaining == 0
+
+    def feed(self, text: str) -> bool:
+        """
+        텍스트 조각을 스캔
+
+        Args:
+            text: 응답의 다음 조각
+
+        Returns:
+            필수 필드를 모두 수집했으면 True
+        """
+        i = 0
+        n = len(text)
+        while i < n and self._remaining:
+            state = self._state
+
+            if state == _IN_STRING:
+                if self._escape is not None:
+                    i = self._feed_escape(text, i)
+                    continue
+                match = _STRING_SPECIAL.search(text, i)
+                end = match.start() if match else n
+                if end > i:
+                    self._value_parts.append(text[i:end])
+                if not match:
+                    break
+                if text[end] == '\\':
+                    self._escape = '\\'
+                else:
+                    self._pending = '"'
+                    self._state = _MAYBE_END
+                i = end + 1
+                continue
+
+            if state == _SEEK_KEY:
+                # 다음 따옴표까지 건너뜀
+                end = text.find('"', i)
+                if end < 0:
+                    break
+                self._start_key()
+                i = end + 1
+                continue
+
+            if state == _IN_KEY:
+                match = _KEY_SPECIAL.search(text, i)
+                end = match.start() if match else n
+                self._key_parts.append(text[i:end])
+                self._key_length += end - i
+                if not match:
+                    break
+                if text[end] == '"' and self._key_length <= _MAX_KEY_LENGTH:
+                    self._state = _AFTER_KEY
+                else:
+                    # 줄바꿈이 있거나 너무 긴 문자열 - 키가 아닌 일반 문장 속 따옴표
+                    self._state = _SEEK_KEY
+                i = end + 1
+                continue
+
+            if state == _IN_BARE:
+                match = _BARE_END.search(text, i)
+                end = match.start() if match else n
+                self._value_parts.append(text[i:end])
+                if not match:
+                    break
+                self._finish_bare()
+                i = end + 1
+                continue
+
+            ch = text[i]
+            i += 1
+
+            if state == _AFTER_KEY:
+                if ch == ':':
+                    key = ''.join(self._key_parts).strip().lower()
+                    wanted = key in self.fields_wanted and key not in self.fields
+                    self._key = key if wanted else None
+                    self._state = _SEEK_VALUE
+                elif ch == '"':
+                    # "a" "b" 처럼 키가 아니었던 경우 - 새 키 후보로 시작
+                    self._start_key()
+                elif not ch.isspace():
+                    self._state = _SEEK_KEY
+
+            elif state == _SEEK_VALUE:
+                if ch.isspace():
+                    continue
+                if ch == '"':
+                    self._value_parts = []
+                    self._state = _IN_STRING
+                elif ch == '[':
+                    self._array_items = []
+                    self._state = _IN_ARRAY
+                elif ch == '{':
+                    # 중첩 객체 - 내부 키를 계속 스캔
+                    self._state = _SEEK_KEY
+                else:
+                    self._value_parts = [ch]
+                    self._state = _IN_BARE
+
+            elif state == _MAYBE_END:
+                if ch.isspace():
+                    self._pending += ch
+                elif ch in ',}]':
+                    self._finish_string()
+                    if ch == ']' and self._array_items is not None:
+                        self._finish_array()
+                elif ch == '"':
+                    # 쉼표 누락: 다음 키(또는 배열 항목)의 시작
+                    self._finish_string()
+                    if self._array_items is not None:
+                        self._value_parts = []
+                        self._state = _IN_STRING
+                    else:
+                        self._start_key()
+                else:
+                    # 이스케이프되지 않은 따옴표였음 - 값의 일부로 유지
+                    self._value_parts.append(self._pending)
+                    self._pending = ''
+                    self._state = _IN_STRING
+                    i -= 1
+
+            elif state == _IN_ARRAY:
+                if ch == '"':
+                    self._value_parts = []
+                    self._state = _IN_STRING
+                elif ch == ']':
+                    self._finish_array()
+
+
+        return self.complete
+
+    def _start_key(self):
+        """키 문자열 수집 시작"""
+        self._key_parts = []
+        self._key_length = 0
+        self._state = _IN_KEY
+
+    def _feed_escape(self, text: str, i: int) -> int:
+        """이스케이프 시퀀스 처리 (청크 경계에 걸쳐도 동작)"""
+        ch = text[i]
+        escape = self._escape + ch
+        if escape.startswith('\\u'):
+            if len(escape) > 2 and ch not in '0123456789abcdefABCDEF':
+                # 잘못된 \u 시퀀스 - 원문 유지
+                self._value_parts.append(self._escape)
+                self._escape = None
+                return i
+            self._escape = escape
+            if len(escape) == 6:
+                code = int(escape[2:], 16)
+                previous = self._value_parts[-1] if self._value_parts else ''
+                if 0xDC00 <= code <= 0xDFFF and len(previous) == 1 and 0xD800 <= ord(previous) <= 0xDBFF:
+                    # 서로게이트 쌍 (\ud83d\ude00 -> 😀): json.loads처럼 한 글자로 합침
+                    code = 0x10000 + ((ord(previous) - 0xD800) << 10) + (code - 0xDC00)
+                    self._value_parts[-1] = chr(code)
+                else:
+                    self._value_parts.append(chr(code))
+                self._escape = None
+            return i + 1
+
+        self._value_parts.append(_ESCAPES.get(ch, '\\' + ch))
+        self._escape = None
+        return i + 1
+
+    def _finish_string(self):
+        """문자열 값 종료"""
+        value = ''.join(self._value_parts)
+        self._value_parts = []
+        self._pending = ''
+        if self._array_items is not None:
+            self._array_items.append(value)
+            self._state = _IN_ARRAY
+            return
+        self._store(value)
+        self._state = _SEEK_KEY
+
+    def _finish_array(self):
+        """배열 값 종료 (항목을 줄바꿈으로 합침)"""
+        items = self._array_items or []
+        self._array_items = None
+        self._store('\n'.join(item for item in items if item))
+        self._state = _SEEK_KEY
+
+    def _finish_bare(self):
+        """따옴표 없는 값 종료"""
+        value = ''.join(self._value_parts).strip()
+        self._value_parts = []
+        if value and value not in ('null', 'None'):
+            self._store(value)
+        self._key = None
+        self._state = _SEEK_KEY
+
+    def _store(self, value: str):
+        """현재 키가 수집 대상이면 값 저장"""
+        if self._key is not None and self._key not in self.fields:
+            self.fields[self._key] = value
+            self._remaining -= 1
+        self._key = None
+
+    def close(self) -> Optional[Dict[str, str]]:
+        """
+        입력 종료 처리 후 결과 반환
+
+        Returns:
+            필수 필드가 모두 있으면 필드 딕셔너리, 아니면 None
+        """
+        if not self.complete:
+            if self._state == _MAYBE_END:
+                self._finish_string()
+            elif self._state == _IN_STRING and self._key is not None:
+                # 출력 길이 제한으로 잘린 문자열
+                if self._escape is not None:
+                    self._value_parts.append(self._escape)
+                    self._escape = None
+                self.truncated = True
+                self._finish_string()
+            elif self._state == _IN_BARE:
+                self._finish_bare()
+            elif self._state == _IN_ARRAY:
+                self._finish_array()
+
+        return self.result()
+
+    def result(self) -> Optional[Dict[str, str]]:
+        """필수 필드가 모두 있으면 필드 딕셔너리 반환"""
+        if not self.complete:
+            return None
+        return {field: self.fields[field] for field in self.fields_wanted}
+
+
+def parse_response_fields(text: str, fields: Tuple[str, ...] = REQUIRED_FIELDS) -> Optional[Dict[str, str]]:
+    """
+    응답 전체 텍스트에서 필드를 추출하는 편의 함수
+
+    Args:
+        text: AI 응답 텍스트
+        fields: 추출할 필드 이름
+
+    Returns:
+        필드 딕셔너리 또는 None (필수 필드 누락 시)
+    """
+    scanner = ResponseFieldScanner(fields)
+    scanner.feed(text)
+    result = scanner.close()
+    if result is None:
+        logger.debug(f"필드 추출 실패: 추출된 필드 {list(scanner.fields.keys())}")
+    elif scanner.truncated:
+        logger.debug("잘린 응답에서 마지막 필드를 복구했습니다.")
+    return result
@@ -4,9 +4,20 @@ AI Assistant 기능 테스트 스크립트
 사용법:
     python test_ai_assistant.py
 """
+import json
 import logging
-from ai_assistant import AIAssistant, get_ai_assistant
+import os
+import tempfile
+import threading
+import time
+
+from ai_assistant import AIAssistant, warm_up_ai_assistant
 from config import AIConfig, DIR_PRESET
+from llm_backends import OpenAICompatibleBackend, StubBackend, BackendBusyError
+from text_index import ExampleIndex, estimate_tokens, format_example
+
+# 테스트 실행이 작업 폴더에 디버깅용 응답 파일을 남기지 않도록
+AIConfig.LAST_RESPONSE_FILE = None
 
 # 로깅 설정
 logging.basicConfig(
@@ -56,8 +67,8 @@ def test_ai_generation():
         "하이드아웃 스폰 위치가 올바르지 않은 문제"
     ]
     
-    # AI 어시스턴트 생성
-    ai_assistant = get_ai_assistant(
+    # AI 어시스턴트 생성 (ollama 로드 및 예시 인덱싱 포함)
+    ai_assistant = warm_up_ai_assistant(
         preset_dir=DIR_PRESET,
         model_name=AIConfig.DEFAULT_MODEL
     )
@@ -89,6 +100,207 @@ def test_ai_generation():
             break
 
 
+def test_example_retrieval():
+    """유사 preset 예시 검색 테스트 (Ollama 불필요)"""
+    print("\n=== 예시 preset 검색 테스트 ===")
+    
+    presets = {
+        'UI_인벤토리_1.json': {'summary': '인벤토리에서 아이템명이 잘려서 출력되는 현상', 'priority': 'Medium',
+                               'severity': '3 - Minor', 'steps': '1. 인벤토리 열기', 'description': '아이템명 잘림'},
+        'UI_인벤토리_2.json': {'summary': '인벤토리에서 아이템명이 잘려서 출력되는 현상', 'priority': 'Medium',
+                               'severity': '3 - Minor', 'steps': '1. 인벤토리 열기', 'description': '아이템명 잘림'},
+        'CR_컨트랙트.json': {'summary': '컨트랙트 탭 클릭 시 클라이언트 크래쉬 발생', 'priority': 'Critical',
+                              'severity': '1 - Critical', 'steps': '1. 컨트랙트 탭 클릭', 'description': '크래쉬'},
+        'MAP_스폰.json': {'summary': '하이드아웃 스폰 위치 오류', 'priority': 'High',
+                          'severity': '2 - Major', 'steps': '1. 하이드아웃 접속', 'description': '스폰 위치 오류'},
+        'settings.json': {'summary': '설정 파일은 예시가 아님', 'steps': 'x'},
+    }
+    
+    with tempfile.TemporaryDirectory() as preset_dir:
+        for filename, data in presets.items():
+            with open(os.path.join(preset_dir, filename), 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        
+        index = ExampleIndex(preset_dir)
+        assert index.refresh() == 4
+        assert index.refresh() == 0  # 변경 없으면 다시 읽지 않음
+        
+        examples = index.select_examples('인벤토리 아이템명이 축약되어 출력되는 현상', max_examples=2, token_budget=400)
+        print(f"선택된 예시: {[e['summary'] for e in examples]}")
+        assert examples[0]['summary'].startswith('인벤토리')
+        # 같은 preset의 여러 버전은 한 번만 포함
+        assert len({e['summary'] for e in examples}) == len(examples)
+        
+        crash = index.select_examples('로비에서 클라이언트 크래쉬 발생', max_examples=1)
+        assert crash and crash[0]['priority'] == 'Critical'
+        
+        # 토큰 예산을 넘지 않음
+        long_budget = index.select_examples('인벤토리 아이템명', max_examples=2, token_budget=60)
+        assert sum(estimate_tokens(format_example(e)) for e in long_budget) <= 60
+        
+        # 삭제된 preset은 인덱스에서 제거
+        os.remove(os.path.join(preset_dir, 'CR_컨트랙트.json'))
+        assert index.refresh() == 1
+        assert all(e['priority'] != 'Critical' for e in index.examples())
+
+
+def test_example_index_concurrent_refresh():
+    """warm-up 스레드와 생성 스레드가 동시에 refresh/검색해도 인덱스가 깨지지 않음"""
+    print("\n=== 예시 인덱스 동시 갱신 ===")
+    presets = {f'preset_{i}.json': {'summary': f'인벤토리 아이템 {i}번 표시 오류', 'steps': '1. 열기',
+                                    'description': '표시 오류'} for i in range(200)}
+    index = ExampleIndex(loader=lambda key: presets[key])
+    keys = sorted(presets)
+    errors = []
+    
+    def refresher(offset):
+        try:
+            for round_ in range(30):
+                # 라운드마다 다른 절반을 남겨 추가/삭제가 계속 일어나게 함
+                subset = keys[(round_ + offset) % 2::2]
+                index.refresh([(key, float(round_)) for key in subset])
+        except Exception as e:
+            errors.append(e)
+    
+    def searcher():
+        try:
+            for _ in range(100):
+                index.select_examples('인벤토리 아이템 표시', max_examples=2)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=refresher, args=(n,)) for n in range(2)] + [threading.Thread(target=searcher)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    assert len(index) == len(index.examples()) <= len(presets)
+    print("✓ 동시 refresh/검색")
+
+
+def test_stub_backend_generation():
+    """스텁 백엔드로 생성/취소/동시 요청 한도 테스트 (네트워크 불필요)"""
+    print("\n=== 스텁 백엔드 생성 테스트 ===")
+    
+    response = json.dumps({
+        'priority': 'High',
+        'severity': '2 - Major',
+        'steps': '1. 하이드아웃 접속\n2. 상점 열기',
+        'description': '*Observed(관찰 결과):*\n\n* 상점 UI 깨짐'
+    }, ensure_ascii=False)
+    backend = StubBackend(response=response, chunk_size=8)
+    assistant = AIAssistant(backend=backend)
+    
+    result = assistant.generate_bug_details('상점 UI가 깨지는 현상')
+    print(f"생성 결과: {result}")
+    assert result['priority'] == 'High'
+    assert result['steps'].startswith('1. 하이드아웃')
+    assert '상점 UI가 깨지는 현상' in backend.prompts[-1]
+    
+    # 취소 이벤트가 설정되면 결과 없이 종료
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert assistant.generate_bug_details('상점 UI가 깨지는 현상', cancel_event=cancel_event) is None
+    
+    # 동시 요청 한도를 넘으면 타임아웃 후 BackendBusyError
+    busy = StubBackend(response=response, max_concurrency=1, timeout=0.05)
+    busy._slots.acquire()
+    try:
+        busy.generate(AIConfig.DEFAULT_MODEL, 'prompt', {})
+        assert False, "BackendBusyError가 발생해야 합니다"
+    except BackendBusyError:
+        pass
+    finally:
+        busy._slots.release()
+
+
+def test_cancel_before_first_token():
+    """첫 토큰 전(프롬프트 처리 중) 취소도 바로 반환, 슬롯은 요청이 끝난 뒤 반환"""
+    print("\n=== 첫 토큰 전 취소 ===")
+    backend = StubBackend(response='{"priority": "High"}', delay=2.0, max_concurrency=1, timeout=5)
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+    start = time.perf_counter()
+    assert backend.generate('model', 'prompt', {}, cancel_event=cancel_event) is None
+    assert time.perf_counter() - start < 1.0
+    assert backend._slots.acquire(timeout=0.1)  # 스트림을 끊을 수 있으면 다음 생성이 대기하지 않음
+    backend._slots.release()
+    
+    # 끊을 수 없는 백엔드(Ollama)는 남은 요청이 끝날 때까지 슬롯을 반환하지 않음
+    class UnabortableStub(StubBackend):
+        def abort_stream(self, worker):
+            pass
+    
+    stuck = UnabortableStub(response='{"priority": "High"}', delay=0.5, max_concurrency=1, timeout=5)
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+    start = time.perf_counter()
+    assert stuck.generate('model', 'prompt', {}, cancel_event=cancel_event) is None
+    assert time.perf_counter() - start < 0.4
+    assert not stuck._slots.acquire(timeout=0.05)
+    assert stuck._slots.acquire(timeout=2)  # 작업 스레드가 첫 청크에서 취소를 확인하고 종료한 뒤
+    stuck._slots.release()
+    
+    quick = StubBackend(response='{"priority": "High"}', chunk_size=4)
+    assert quick.generate('model', 'prompt', {}, cancel_event=threading.Event()) == '{"priority": "High"}'
+    print("✓ 취소 즉시 반환/슬롯 반환")
+
+
+class FakeSSEResponse:
+    """SSE 줄을 돌려주고 close/release_conn 호출을 기록하는 응답"""
+    
+    def __init__(self, lines):
+        self.lines = lines
+        self.read = 0
+        self.closed = False
+        self.released = False
+        self.raw = self
+    
+    def raise_for_status(self):
+        pass
+    
+    def iter_lines(self, decode_unicode=False):
+        for line in self.lines:
+            self.read += 1
+            yield line
+    
+    def release_conn(self):
+        self.released = True
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeSSESession:
+    def __init__(self, lines):
+        self.lines = lines
+        self.responses = []
+    
+    def post(self, url, **kwargs):
+        self.responses.append(FakeSSEResponse(self.lines))
+        return self.responses[-1]
+
+
+def test_openai_stream_connection_reuse():
+    """정상 종료한 스트림은 연결을 풀로 반환, 조기 종료는 연결을 닫음"""
+    print("\n=== OpenAI 호환 스트림 연결 재사용 ===")
+    lines = ['data: ' + json.dumps({'choices': [{'delta': {'content': text}}]}) for text in ('{"priority"', ': "High"}')]
+    lines += ['', 'data: [DONE]', '']
+    backend = OpenAICompatibleBackend(base_url='http://llm.invalid/v1', api_key='')
+    backend._session = FakeSSESession(lines)
+    
+    assert backend.generate('model', 'prompt', {}) == '{"priority": "High"}'
+    response = backend._session.responses[-1]
+    assert response.released and not response.closed
+    assert response.read == len(lines)  # [DONE] 뒤 본문까지 읽음
+    
+    assert backend.generate('model', 'prompt', {}, on_chunk=lambda text: True) == '{"priority"'
+    response = backend._session.responses[-1]
+    assert response.closed and not response.released
+    print("✓ 정상 종료 시 풀 반환, 조기 종료 시 닫기")
+
+
 def show_recommendations():
     """추천 모델 정보 출력"""
     print("\n=== 추천 모델 목록 ===")
@@ -0,0 +1,271 @@
+"""
+일괄 생성 CLI 테스트 스크립트
+CSV/JSONL 입력, JSON Lines 진행 출력, 체크포인트 이어 실행, PyQt5 미사용을 확인합니다.
+(JIRA에는 접속하지 않고 테스트용 백엔드 사용)
+
+사용법:
+    python test_batch_cli.py
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import batch_cli
+import description_templates
+from batch_cli import ProgressWriter, run_batch
+from batch_rows import iter_issue_rows
+from batch_validation import build_domains
+from description_templates import TemplateLibrary
+from jira_rest import JiraRestClient
+from log_pipeline import stop_logging
+
+
+class FakeBackend:
+    """요약에 '실패'가 있으면 예외를 내는 테스트용 백엔드"""
+
+    max_concurrency = 8
+    created = []
+
+    def __init__(self, concurrency):
+        pass
+
+    def create_issue(self, issue_data):
+        if '실패' in issue_data['summary']:
+            raise RuntimeError('필수 필드 누락')
+        FakeBackend.created.append(issue_data['summary'])
+        return f"P2-{len(FakeBackend.created)}"
+
+    def close(self):
+        pass
+
+
+def _events(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_csv_with_checkpoint():
+    """CSV 입력, 실패 행만 다시 실행"""
+    print("\n=== CSV + 체크포인트 ===")
+    batch_cli.BACKENDS['fake'] = FakeBackend
+    FakeBackend.created = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, 'bugs.csv')
+        checkpoint = os.path.join(temp_dir, 'bugs.ckpt.jsonl')
+        with open(input_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Summary', 'Priority', 'Build', 'Description'])
+            writer.writerow(['[UI] 아이콘이 표시되지 않는 현상', 'High', 'CL-1', ''])
+            writer.writerow(['', '', '', ''])
+            writer.writerow(['[로비] 실패하는 행', 'Low', 'CL-1', '직접 작성'])
+            writer.writerow(['[상점] 결제 팝업이 닫히지 않는 현상', 'Medium', 'CL-2', '직접 작성'])
+
+        stream = io.StringIO()
+        counts = run_batch(input_path, 'fake', concurrency=3, checkpoint_path=checkpoint,
+                           progress=ProgressWriter(stream))
+        assert counts == {'total': 3, 'created': 2, 'failed': 1, 'skipped': 0}, counts
+        events = _events(stream)
+        assert events[0]['event'] == 'start' and events[-1]['event'] == 'done'
+        rows = {event['row']: event for event in events if event['event'] == 'row'}
+        assert rows[4]['status'] == 'failed' and rows[4]['error'] == '필수 필드 누락'
+        assert rows[2]['status'] == 'created' and rows[2]['issue'].startswith('P2-')
+
+        # 두 번째 실행: 성공한 행은 건너뛰고 실패한 행만 다시 시도
+        stream = io.StringIO()
+        counts = run_batch(input_path, 'fake', checkpoint_path=checkpoint, progress=ProgressWriter(stream))
+        assert counts == {'total': 3, 'created': 0, 'failed': 1, 'skipped': 2}, counts
+    print("✓ 진행 출력/실패 행 재시도")
+
+
+def test_resume_after_template_change():
+    """실행 사이에 설명 템플릿이 바뀌어도 이미 만든 행은 다시 만들지 않음"""
+    print("\n=== 템플릿 변경 후 이어 실행 ===")
+    batch_cli.BACKENDS['fake'] = FakeBackend
+    FakeBackend.created = []
+    original = description_templates._library
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_dir = os.path.join(temp_dir, 'templates')
+        os.mkdir(template_dir)
+        template_path = os.path.join(template_dir, '기본값.md')
+        with open(template_path, 'w', encoding='utf-8') as f:
+            f.write('v1: {{main_text}}\n')
+        description_templates._library = TemplateLibrary(template_dir, check_interval=0)
+        try:
+            input_path = os.path.join(temp_dir, 'bugs.csv')
+            checkpoint = os.path.join(temp_dir, 'bugs.ckpt.jsonl')
+            with open(input_path, 'w', encoding='utf-8', newline='') as f:
+                csv.writer(f).writerows([
+                    ['Summary', 'Description', 'Template'],
+                    ['[UI] 아이콘 누락', '', ''],
+                    ['[상점] 결제 팝업 멈춤', '', '기본값'],
+                ])
+            counts = run_batch(input_path, 'fake', checkpoint_path=checkpoint, progress=ProgressWriter(io.StringIO()))
+            assert counts['created'] == 2
+
+            with open(template_path, 'w', encoding='utf-8') as f:
+                f.write('version 2 - {{main_text}} / {{expected_text}}\n')
+            assert list(iter_issue_rows(input_path))[0][1]['description'].startswith('version 2')
+            counts = run_batch(input_path, 'fake', checkpoint_path=checkpoint, progress=ProgressWriter(io.StringIO()))
+            assert counts == {'total': 2, 'created': 0, 'failed': 0, 'skipped': 2}, counts
+            assert len(FakeBackend.created) == 2
+        finally:
+            description_templates._library = original
+    print("✓ 템플릿이 바뀌어도 체크포인트 유지")
+
+
+def test_jsonl_and_dry_run():
+    """JSONL 입력, 설명 자동 생성, dry-run"""
+    print("\n=== JSONL + dry-run ===")
+    batch_cli.BACKENDS['fake'] = FakeBackend
+    FakeBackend.created = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, 'bugs.jsonl')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'Summary': '창이 열리는 현상', 'Template': '서버크래쉬'}, ensure_ascii=False) + '\n')
+            f.write('\n')
+            f.write(json.dumps({'Summary': '소리가 없는 현상', 'Build': 'CL-9'}, ensure_ascii=False) + '\n')
+
+        rows = list(iter_issue_rows(input_path))
+        assert [row for row, _ in rows] == [2, 3]
+        assert '* 창이 열리지 않아야 합니다.' in rows[0][1]['description']
+        assert rows[1][1]['build'] == 'CL-9'
+
+        stream = io.StringIO()
+        counts = run_batch(input_path, 'fake', dry_run=True, progress=ProgressWriter(stream))
+        assert counts['total'] == 2 and counts['created'] == 0
+        assert FakeBackend.created == []
+    print("✓ JSONL 읽기/설명 생성/dry-run")
+
+
+def test_header_report():
+    """알 수 없는 열은 실행 전에 알리고, 필수 열이 없으면 실행하지 않음"""
+    print("\n=== 헤더 보고 ===")
+    batch_cli.BACKENDS['fake'] = FakeBackend
+    FakeBackend.created = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, 'bugs.csv')
+        with open(input_path, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows([['제목', '우선순위', '메모'], ['[UI] 아이콘 누락', 'High', '참고']])
+        stream = io.StringIO()
+        counts = run_batch(input_path, 'fake', progress=ProgressWriter(stream))
+        events = _events(stream)
+        assert events[0]['event'] == 'headers' and events[0]['unknown'] == ['메모']
+        assert counts['created'] == 1
+
+        with open(input_path, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows([['Title', 'Priority'], ['[UI] 아이콘 누락', 'High']])
+        try:
+            run_batch(input_path, 'fake', progress=ProgressWriter(io.StringIO()))
+            assert False, "필수 열이 없으면 ValueError"
+        except ValueError as e:
+            assert 'summary' in str(e)
+        assert FakeBackend.created == ['[UI] 아이콘 누락']
+    print("✓ 헤더 보고/필수 열 확인")
+
+
+def test_invalid_rows_skipped():
+    """사전 검증에서 오류가 난 행은 생성하지 않고 invalid로 보고"""
+    print("\n=== 사전 검증 ===")
+    batch_cli.BACKENDS['fake'] = FakeBackend
+    FakeBackend.created = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, 'bugs.csv')
+        with open(input_path, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows([
+                ['Summary', 'Priority', 'Severity'],
+                ['[UI] 아이콘 누락', 'High', '2 - Major'],
+                ['[상점] 우선순위 오타', 'Hihg', 'Major'],
+            ])
+        stream = io.StringIO()
+        counts = run_batch(input_path, 'fake', progress=ProgressWriter(stream), domains=build_domains())
+        assert counts == {'total': 2, 'created': 1, 'failed': 1, 'skipped': 0}, counts
+        invalid = [event for event in _events(stream) if event.get('status') == 'invalid']
+        assert invalid[0]['row'] == 3 and invalid[0]['errors'][0]['field'] == 'priority'
+        assert FakeBackend.created == ['[UI] 아이콘 누락']
+
+        FakeBackend.created = []
+        counts = run_batch(input_path, 'fake', progress=ProgressWriter(io.StringIO()), validate=False)
+        assert counts['created'] == 2
+    print("✓ 오류 행 제외/보고")
+
+
+def test_backend_unavailable():
+    """백엔드 의존성이 없으면 error 이벤트와 종료 코드 2"""
+    print("\n=== 백엔드 생성 실패 ===")
+
+    def missing_backend(concurrency):
+        raise ImportError("No module named 'selenium'")
+
+    batch_cli.BACKENDS['missing'] = missing_backend
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, 'bugs.jsonl')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'summary': '[UI] 아이콘 누락'}, ensure_ascii=False) + '\n')
+        stream = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(stream):
+                exit_code = batch_cli.main([input_path, '--backend', 'missing', '--no-validate', '--log-level', 'ERROR'])
+        finally:
+            stop_logging()
+            del batch_cli.BACKENDS['missing']
+        assert exit_code == 2
+        events = _events(stream)
+        assert events[-1]['event'] == 'error' and 'selenium' in events[-1]['error']
+    print("✓ error 이벤트/종료 코드 2")
+
+
+def test_rest_payload():
+    """REST 요청 본문 구성 (네트워크 없음)"""
+    print("\n=== REST 요청 본문 ===")
+    client = JiraRestClient(base_url='http://jira.invalid', token='', project_key='P2',
+                            custom_fields={'build': ['customfield_100', 'options'],
+                                           'severity': ['customfield_200', 'option']})
+    client._myself = 'qa_user'
+    payload = client.build_payload({
+        'summary': '[UI] 아이콘 누락', 'priority': 'High', 'component': 'Tech_UXUI',
+        'label': 'facility ui', 'build': 'CL-1 CL-2', 'severity': '2 - Major', 'team': 'Progression',
+        'linkedIssues': 'relates to', 'issue': 'P2-55506',
+    })
+    fields = payload['fields']
+    assert fields['project'] == {'key': 'P2'} and fields['priority'] == {'name': 'High'}
+    assert fields['labels'] == ['facility', 'ui']
+    assert fields['customfield_100'] == [{'value': 'CL-1'}, {'value': 'CL-2'}]
+    assert fields['customfield_200'] == {'value': '2 - Major'}
+    assert fields['assignee'] == {'name': 'qa_user'}
+    assert 'team' not in fields  # 매핑 없는 필드는 건너뜀
+    assert payload['update']['issuelinks'][0]['add'] == {
+        'type': {'name': 'Relates'}, 'outwardIssue': {'key': 'P2-55506'}}
+    print("✓ 표준/커스텀 필드, 이슈 링크")
+
+
+def test_no_pyqt_import():
+    """CLI 모듈이 PyQt5/selenium/requests를 import 하지 않는지"""
+    print("\n=== import 확인 ===")
+    code = ("import sys, batch_cli; "
+            "print(sorted(m for m in ('PyQt5', 'selenium', 'requests') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == '[]', result.stdout
+    print("✓ PyQt5/selenium/requests 미사용")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_csv_with_checkpoint()
+    test_resume_after_template_change()
+    test_jsonl_and_dry_run()
+    test_header_report()
+    test_invalid_rows_skipped()
+    test_backend_unavailable()
+    test_rest_payload()
+    test_no_pyqt_import()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
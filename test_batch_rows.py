@@ -0,0 +1,201 @@
+"""
+일괄 실행 입력 행 테스트 스크립트
+CSV/JSONL 행 스트리밍, 입력 형식 추가, 빈 행 처리를 확인합니다.
+
+사용법:
+    python test_batch_rows.py
+"""
+import csv
+import json
+import os
+import tempfile
+import time
+
+from batch_rows import (
+    ISSUE_COLUMNS, ROW_SOURCES, compile_headers, count_rows, inspect_headers,
+    iter_issue_rows, iter_rows, parse_issue_row, register_row_source
+)
+
+HEADERS = ['Summary', 'Linked Issues', 'Issue', 'Fix Version', 'Priority', 'Build', 'Description']
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerows(rows)
+
+
+def test_csv_streaming():
+    """CSV 행을 하나씩 읽고 같은 헤더 매핑 사용"""
+    print("\n=== CSV 스트리밍 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'bugs.csv')
+        _write_csv(path, [
+            ['[UI] 아이콘 누락', 'relates to', 'P2-1', '1.0 1.1', 'High', 'CL-1', '직접 작성'],
+            ['', '', '', '', '', '', ''],
+            ['[상점] 팝업 미닫힘', '', '', '', 'Low', 'CL-2', '직접 작성'],
+        ])
+        rows = iter_rows(path)
+        row_number, headers, row_data = next(rows)
+        assert row_number == 2 and list(headers) == HEADERS and row_data[0] == '[UI] 아이콘 누락'
+        rows.close()
+
+        issues = list(iter_issue_rows(path))
+        assert [row for row, _ in issues] == [2, 4]
+        assert issues[0][1]['linkedIssues'] == 'relates to' and issues[0][1]['fixversion'] == '1.0 1.1'
+        assert count_rows(path) == 2
+    print("✓ 헤더 매핑/빈 행 건너뜀")
+
+
+def test_jsonl_lazy():
+    """JSONL은 읽은 행까지만 파싱 (뒤쪽 오류는 해당 행에서 발생)"""
+    print("\n=== JSONL 지연 읽기 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'bugs.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'Summary': '첫 행', 'Build': 'CL-1'}, ensure_ascii=False) + '\n')
+            f.write(json.dumps({'Priority': 'High', 'Summary': '키 순서가 다른 행'}, ensure_ascii=False) + '\n')
+            f.write('[1, 2]\n')
+
+        issues = iter_issue_rows(path)
+        assert next(issues)[1]['build'] == 'CL-1'
+        row_number, issue_data = next(issues)
+        assert row_number == 3 and issue_data['priority'] == 'High' and issue_data['build'] == ''
+        try:
+            next(issues)
+            assert False, "JSON 객체가 아닌 행은 ValueError"
+        except ValueError as e:
+            assert ':3:' in str(e)
+    print("✓ 레코드별 헤더, 지연 오류")
+
+
+def test_register_row_source():
+    """입력 형식 추가"""
+    print("\n=== 입력 형식 추가 ===")
+
+    def iter_tsv(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            headers = f.readline().rstrip('\n').split('\t')
+            for row_number, line in enumerate(f, 2):
+                yield row_number, headers, line.rstrip('\n').split('\t')
+
+    register_row_source('.TSV', iter_tsv)
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'bugs.tsv')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('Summary\tPriority\n탭 구분 행\tMedium\n')
+            assert [issue['priority'] for _, issue in iter_issue_rows(path)] == ['Medium']
+    finally:
+        ROW_SOURCES.pop('.tsv', None)
+
+    try:
+        iter_rows('bugs.txt')
+        assert False, "지원하지 않는 확장자는 ValueError"
+    except ValueError:
+        pass
+    print("✓ 등록한 형식으로 읽기")
+
+
+def test_header_mapping():
+    """별칭/대소문자 헤더 인식, 알 수 없는/없는 열 보고"""
+    print("\n=== 헤더 매핑 ===")
+    headers = ['생성시간', '요약', 'fix_version', 'PRIORITY', '메모', '빌드', 'Build', '템플릿', None]
+    mapping = compile_headers(headers)
+    assert mapping.unknown == ['메모']
+    assert mapping.duplicates == ['Build']
+    assert 'description' in mapping.missing and 'summary' not in mapping.missing
+    assert mapping.missing_required == []
+    assert compile_headers(list(headers)) is mapping  # 같은 헤더는 재사용
+
+    issue_data = parse_issue_row(headers, ['2025-01-01', '창이 열리는 현상', '1.0', 'High', 'x', 'CL-1', 'CL-2', '서버크래쉬'])
+    assert issue_data['fixversion'] == '1.0' and issue_data['priority'] == 'High'
+    assert issue_data['build'] == 'CL-2'  # 중복 열은 마지막 열
+    assert '* 창이 열리지 않아야 합니다.' in issue_data['description']
+    assert set(issue_data) == set(ISSUE_COLUMNS.values())
+
+    # 짧은 행/None/숫자 값
+    issue_data = parse_issue_row(['Summary', 'Build', 'Issue'], [12345, None])
+    assert issue_data['summary'] == '12345' and issue_data['build'] == '' and issue_data['issue'] == ''
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'bugs.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows([['Title', 'Priority'], ['요약 열 없음', 'High']])
+        mapping = inspect_headers(path)
+        assert mapping.missing_required == ['summary'] and mapping.unknown == ['Title']
+        assert mapping.problems()[0].startswith('필수 열 없음')
+    print("✓ 별칭/보고/변환")
+
+
+def _parse_with_dict(headers, row_data):
+    """이전 방식 (행마다 헤더 dict 생성, 벤치마크 비교용)"""
+    data_dict = {}
+    for i, header in enumerate(headers):
+        if i < len(row_data):
+            value = row_data[i]
+            data_dict[header] = value if value is not None else ''
+    return {field: str(data_dict.get(header, '')) for header, field in ISSUE_COLUMNS.items()}
+
+
+def benchmark_wide(count=20000, width=200):
+    """넓은 시트: 헤더 컴파일 vs 행마다 dict"""
+    print(f"\n=== 벤치마크 ({count}행 x {width}열) ===")
+    headers = list(ISSUE_COLUMNS) + [f'메모 {i}' for i in range(width - len(ISSUE_COLUMNS))]
+    rows = [[f'값 {i}'] * width for i in range(count)]
+
+    start = time.perf_counter()
+    for row in rows:
+        _parse_with_dict(headers, row)
+    dict_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mapping = compile_headers(headers)
+    for row in rows:
+        mapping.parse(row)
+    compiled_elapsed = time.perf_counter() - start
+    print(f"행마다 dict: {dict_elapsed * 1000:.1f}ms, 컴파일한 매핑: {compiled_elapsed * 1000:.1f}ms")
+
+
+def benchmark(count=20000):
+    """다른 도구에서 내보낸 대량 CSV"""
+    print(f"\n=== 벤치마크 ({count}행) ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'sweep.csv')
+        _write_csv(path, [[f'[UI] 아이템 {i}번 아이콘 누락', '', '', '', 'High', f'CL-{i}', '직접 작성']
+                          for i in range(count)])
+        start = time.perf_counter()
+        rows = sum(1 for _ in iter_issue_rows(path))
+        elapsed = time.perf_counter() - start
+        print(f"CSV {rows}행 변환: {elapsed * 1000:.1f}ms")
+
+        try:
+            import openpyxl
+        except ImportError:
+            print("openpyxl이 없어 xlsx 비교는 건너뜀")
+            return
+        xlsx_path = os.path.join(temp_dir, 'sweep.xlsx')
+        wb = openpyxl.Workbook()
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.reader(f):
+                wb.active.append(row)
+        wb.save(xlsx_path)
+        start = time.perf_counter()
+        rows = sum(1 for _ in iter_issue_rows(xlsx_path))
+        print(f"xlsx {rows}행 변환: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_csv_streaming()
+    test_jsonl_lazy()
+    test_register_row_source()
+    test_header_mapping()
+    benchmark()
+    benchmark_wide()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
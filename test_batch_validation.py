@@ -0,0 +1,159 @@
+"""
+일괄 실행 사전 검증 테스트 스크립트
+허용 값 검증, 행별 보고서, 입력 파일 사전 확인, 캐시된 JIRA 필드 허용 값 사용을 확인합니다.
+
+사용법:
+    python test_batch_validation.py
+"""
+import json
+import os
+import tempfile
+import time
+
+from batch_validation import ERROR, WARNING, build_domains, prepare_batch, validate_issue, validate_rows
+from jira_rest import JiraRestClient, load_cached_field_options
+
+
+class FakeOptionsManager:
+    """옵션 파일 대신 고정 목록을 반환"""
+
+    def __init__(self, options):
+        self.options = options
+
+    def load_options(self, field_name, options_file):
+        return self.options.get(field_name, [])
+
+
+def _issue(**fields):
+    data = {'summary': '[UI] 아이콘 누락', 'linkedIssues': '', 'issue': '', 'parent': ''}
+    data.update(fields)
+    return data
+
+
+def test_dropdown_domains():
+    """DropdownOptions 값 검증 (포함 검색 필드는 일부만 써도 허용)"""
+    print("\n=== 드롭다운 값 검증 ===")
+    domains = build_domains()
+    assert validate_issue(2, _issue(priority='high', severity='Major', repro_rate='5 - Seen Once'), domains) == []
+
+    issues = validate_issue(3, _issue(priority='Hihg', severity='9 - Unknown'), domains)
+    assert [(issue.field, issue.severity) for issue in issues] == [('priority', ERROR), ('severity', ERROR)]
+    assert '추천: High' in issues[0].message
+
+    issues = validate_issue(4, _issue(summary='', linkedIssues='relates to', issue=''), domains)
+    assert {issue.field for issue in issues} == {'summary', 'issue'}
+    assert all(issue.severity == ERROR for issue in issues)
+
+    issues = validate_issue(5, _issue(linkedIssues='relatez to', issue='12345'), domains)
+    assert [(issue.field, issue.severity) for issue in issues] == [('issue', WARNING), ('linkedIssues', WARNING)]
+    print("✓ 허용 값/필수 값/이슈 키 형식")
+
+
+def test_option_files_and_metadata():
+    """옵션 파일은 경고, 캐시된 JIRA 허용 값은 오류"""
+    print("\n=== 옵션 파일/JIRA 허용 값 ===")
+    options_manager = FakeOptionsManager({'component': ['Tech_UXUI', 'Tech_Sound'], 'build': ['CL-1']})
+    domains = build_domains(options_manager)
+    issues = validate_issue(2, _issue(component='Tech_UXUI Tech_Sond', build='CL-1'), domains)
+    assert [(issue.value, issue.severity) for issue in issues] == [('Tech_Sond', WARNING)]
+    assert 'Tech_Sound' in issues[0].message
+
+    domains = build_domains(options_manager, {'component': ['Tech_UXUI', 'Tech_Sound'], 'fixversion': ['1.0']})
+    issues = validate_issue(2, _issue(component='tech_uxui Tech_Sond', fixversion='2.0'), domains)
+    assert [(issue.field, issue.value, issue.severity) for issue in issues] == [
+        ('component', 'Tech_Sond', ERROR), ('fixversion', '2.0', ERROR)]
+    print("✓ 옵션 파일 경고, JIRA 허용 값 오류")
+
+
+def test_report():
+    """행별 보고서"""
+    print("\n=== 행별 보고서 ===")
+    rows = [(2, _issue(priority='High')), (3, _issue(priority='Hihg')), (4, _issue(summary='', issue='abc'))]
+    report = validate_rows(rows, build_domains())
+    assert report.rows_checked == 3
+    assert report.error_rows == {3, 4}
+    assert len(report.warnings) == 1 and sorted(report.by_row()) == [3, 4]
+    text = report.format()
+    assert text.splitlines()[0].startswith('❌ 행 3: priority')
+    assert '⚠ 행 4' in text and '⚠' not in report.format(include_warnings=False)
+    assert report.format(limit=1).endswith('... 외 2건')
+    print("✓ 오류 행/보고서 형식")
+
+
+def test_prepare_batch():
+    """파일을 한 번 읽어 헤더/행 수/검증 결과를 함께 반환"""
+    print("\n=== 입력 파일 사전 확인 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'batch.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write("Summary,Priority,Unknown\n아이콘 누락,High,x\n,,\n사운드 끊김,Hihg,y\n")
+        plan = prepare_batch(path, build_domains())
+        assert plan.rows == 2  # 빈 행 제외
+        assert plan.headers.problems() and not plan.headers.missing_required
+        assert plan.report.rows_checked == 2 and plan.report.error_rows == {4}
+
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write("Priority\nHihg\nLow\n")
+        plan = prepare_batch(path, build_domains())
+        assert plan.headers.missing_required and plan.rows == 2
+        assert plan.report.rows_checked == 0 and not plan.report.issues  # 실행하지 않으므로 검증 생략
+
+        open(path, 'w').close()
+        plan = prepare_batch(path, build_domains())
+        assert plan.rows == 0 and plan.headers.missing_required
+    print("✓ 헤더/행 수/검증 한 번에")
+
+
+def test_field_options_cache():
+    """createmeta 결과를 캐시에 저장하고 읽음 (네트워크 없음)"""
+    print("\n=== JIRA 허용 값 캐시 ===")
+    client = JiraRestClient(base_url='http://jira.invalid', token='', project_key='P2',
+                            custom_fields={'severity': ['customfield_200', 'option']})
+    client._request = lambda method, path, **kwargs: {'projects': [{'issuetypes': [{'fields': {
+        'priority': {'allowedValues': [{'name': 'High'}, {'name': 'Low'}]},
+        'components': {'allowedValues': [{'name': 'Tech_UXUI'}]},
+        'customfield_200': {'allowedValues': [{'value': '2 - Major'}]},
+    }}]}]}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'jira_field_options.json')
+        options = client.refresh_field_options(path)
+        assert options == {'priority': ['High', 'Low'], 'component': ['Tech_UXUI'], 'severity': ['2 - Major']}
+        assert load_cached_field_options(path) == options
+
+        # 오래된 캐시는 사용하지 않음
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        cache['fetched_at'] = time.time() - 3600
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        assert load_cached_field_options(path, max_age=60) == {}
+        assert load_cached_field_options(os.path.join(temp_dir, 'none.json')) == {}
+    print("✓ 캐시 저장/만료")
+
+
+def benchmark(count=20000):
+    """대량 일괄 실행 검증"""
+    print(f"\n=== 벤치마크 ({count}행) ===")
+    options_manager = FakeOptionsManager({'build': [f'CL-{i}' for i in range(200)]})
+    domains = build_domains(options_manager)
+    rows = [(i + 2, _issue(priority='High', severity='2 - Major', build=f'CL-{i % 300}'))
+            for i in range(count)]
+    start = time.perf_counter()
+    report = validate_rows(rows, domains)
+    elapsed = time.perf_counter() - start
+    print(f"{count}행 검증: {elapsed * 1000:.1f}ms (경고 {len(report.warnings)}건)")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_dropdown_domains()
+    test_option_files_and_metadata()
+    test_report()
+    test_prepare_batch()
+    test_field_options_cache()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+빌드명 피드 테스트 스크립트
+매니페스트에 추가된 줄만 읽어 build 옵션에 반영하는지, 파일 교체/반영 실패 시 다시 읽는지 확인합니다.
+
+사용법:
+    python test_build_feed.py
+"""
+import json
+import os
+import tempfile
+
+from build_feed import BuildFeedImporter
+from utils import OptionsManager, flush_settings_stores
+
+
+def _append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_tail_manifest_file():
+    """새 줄만 가져오기, 중복 제거, 개수 제한, 재시작 후 이어 읽기"""
+    print("\n=== 매니페스트 파일 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest = os.path.join(temp_dir, 'manifest.txt')
+        options_file = os.path.join(temp_dir, 'build_options.json')
+        state_file = os.path.join(temp_dir, 'build_feed_state.json')
+        manager = OptionsManager(max_options=3, prune_rules={})
+
+        def importer():
+            return BuildFeedImporter(manager, manifest, options_file=options_file, state_file=state_file,
+                                     name_pattern=r'(CompileBuild_\S+)')
+
+        feed = importer()
+        notified = []
+        feed.add_listener(notified.append)
+        assert feed.poll() == []  # 파일 없음
+
+        _append(manifest, "# 빌드 목록\nbuilt CompileBuild_DEV_r1\nbuilt CompileBuild_DEV_r2\nCompileBuild_DEV_r")
+        assert feed.poll() == ['CompileBuild_DEV_r1', 'CompileBuild_DEV_r2']
+        # 줄바꿈 전의 마지막 줄은 완성된 뒤에 읽음
+        _append(manifest, "3\nCompileBuild_DEV_r1\n")
+        assert feed.poll() == ['CompileBuild_DEV_r3']
+        assert feed.poll() == []
+        assert notified == [['CompileBuild_DEV_r1', 'CompileBuild_DEV_r2'], ['CompileBuild_DEV_r3']]
+        assert manager.load_options('build', options_file) == [
+            'CompileBuild_DEV_r3', 'CompileBuild_DEV_r2', 'CompileBuild_DEV_r1']
+
+        # 개수 제한: 오래된 빌드부터 밀려남
+        _append(manifest, "CompileBuild_DEV_r4\n")
+        assert feed.poll() == ['CompileBuild_DEV_r4']
+        assert 'CompileBuild_DEV_r1' not in manager.load_options('build', options_file)
+
+        # 재시작해도 이미 읽은 줄(밀려난 r1 포함)은 다시 가져오지 않음
+        flush_settings_stores()
+        assert importer().poll() == []
+
+        # 파일이 새로 작성되면 처음부터
+        with open(manifest, 'w', encoding='utf-8') as f:
+            f.write("CompileBuild_DEV_r5\n")
+        assert feed.poll() == ['CompileBuild_DEV_r5']
+        flush_settings_stores()
+        print("✓ 새 줄만 가져오기/중복 제거/제한/이어 읽기")
+
+
+def test_manifest_directory():
+    """폴더 안의 여러 매니페스트"""
+    print("\n=== 매니페스트 폴더 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        feed_dir = os.path.join(temp_dir, 'feed')
+        os.mkdir(feed_dir)
+        options_file = os.path.join(temp_dir, 'build_options.json')
+        feed = BuildFeedImporter(OptionsManager(prune_rules={}), feed_dir, options_file=options_file,
+                                 state_file=os.path.join(temp_dir, 'state.json'))
+        _append(os.path.join(feed_dir, 'dev.txt'), "DEV_r1\n")
+        _append(os.path.join(feed_dir, 'live.txt'), "LIVE_r1\nDEV_r1\n")
+        _append(os.path.join(feed_dir, '.hidden'), "무시\n")
+        assert sorted(feed.poll()) == ['DEV_r1', 'LIVE_r1']
+        _append(os.path.join(feed_dir, 'live.txt'), "LIVE_r2\n")
+        assert feed.poll() == ['LIVE_r2']
+        flush_settings_stores()
+        print("✓ 폴더 내 파일별 이어 읽기")
+
+
+def test_rotation_and_failed_import():
+    """더 긴 파일로 교체/덮어쓰기 감지, 반영 실패 시 위치 유지, 이전 상태 형식"""
+    print("\n=== 파일 교체/반영 실패 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest = os.path.join(temp_dir, 'manifest.txt')
+        options_file = os.path.join(temp_dir, 'build_options.json')
+        state_file = os.path.join(temp_dir, 'state.json')
+        manager = OptionsManager(prune_rules={})
+        feed = BuildFeedImporter(manager, manifest, options_file=options_file, state_file=state_file)
+        _append(manifest, "DEV_r1\n")
+        assert feed.poll() == ['DEV_r1']
+
+        # 회전: 새 파일로 교체 (이전보다 길어도 처음부터)
+        rotated = os.path.join(temp_dir, 'manifest.new')
+        _append(rotated, "DEV_r2\nDEV_r3\n")
+        os.replace(rotated, manifest)
+        assert feed.poll() == ['DEV_r2', 'DEV_r3']
+
+        # 같은 파일을 더 긴 내용으로 덮어쓰기 (앞부분 내용이 달라짐)
+        with open(manifest, 'w', encoding='utf-8') as f:
+            f.write("LIVE_r1\nLIVE_r2\nLIVE_r3\n")
+        assert feed.poll() == ['LIVE_r1', 'LIVE_r2', 'LIVE_r3']
+
+        # 옵션 반영이 실패하면 위치를 저장하지 않고 다음 확인 때 다시 읽음
+        _append(manifest, "LIVE_r4\n")
+        import_options = manager.import_options
+
+        def failing_import(*args, **kwargs):
+            raise OSError("디스크 가득 참")
+
+        manager.import_options = failing_import
+        try:
+            feed.poll()
+            assert False, "반영 실패는 호출자에게 전달"
+        except OSError:
+            pass
+        manager.import_options = import_options
+        assert feed.poll() == ['LIVE_r4']
+        flush_settings_stores()
+
+        # 이전 형식(파일별 오프셋 숫자)의 상태 파일도 이어 읽기
+        legacy_state = os.path.join(temp_dir, 'legacy_state.json')
+        with open(legacy_state, 'w', encoding='utf-8') as f:
+            json.dump({os.path.abspath(manifest): os.path.getsize(manifest)}, f)
+        _append(manifest, "LIVE_r5\n")
+        feed = BuildFeedImporter(manager, manifest, options_file=options_file, state_file=legacy_state)
+        assert feed.poll() == ['LIVE_r5']
+        flush_settings_stores()
+        print("✓ 교체/덮어쓰기 감지, 실패 후 재시도, 이전 상태 형식")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_tail_manifest_file()
+    test_manifest_directory()
+    test_rotation_and_failed_import()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
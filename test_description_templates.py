@@ -0,0 +1,92 @@
+"""
+설명 템플릿 테스트 스크립트
+템플릿 파일 컴파일/렌더링, 변경 시 재로드, 일괄 생성을 확인합니다.
+
+사용법:
+    python test_description_templates.py
+"""
+import os
+import tempfile
+import time
+
+from description_templates import TemplateLibrary, compile_template, BUILTIN_DEFAULT_TEMPLATE
+from utils import TextProcessor
+
+
+def test_compile_template():
+    """자리표시자만 치환하고 Jira 마크업 중괄호는 유지"""
+    print("\n=== 템플릿 컴파일 ===")
+    render = compile_template("* {{ main_text }}\n{color:#4c9aff}{{english}}{color}\n{{missing}}끝")
+    assert render({'main_text': '팝업 미출력', 'english': 'Popup missing'}) == \
+        "* 팝업 미출력\n{color:#4c9aff}Popup missing{color}\n끝"
+    assert compile_template("고정 문구")({}) == "고정 문구"
+    print("✓ 자리표시자 치환")
+
+
+def test_shipped_templates():
+    """기본 제공 템플릿으로 기존과 같은 설명 생성"""
+    print("\n=== 기본 제공 템플릿 ===")
+    description = TextProcessor.generate_description_template('아이템이 표시되지 않는 현상', '클라크래쉬')
+    assert description.startswith("**Observed:**\n* 아이템이 표시되지 않는 현상을 확인합니다.")
+    assert "**Expected (기대 결과):**\n* 아이템이 표시되어야 합니다." in description
+    assert description.endswith("**Callstack:**\n```\n\n")
+    # 없는 옵션은 기본값 템플릿
+    assert TextProcessor.generate_description_template('창이 열리는 현상', '없는 옵션') == \
+        TextProcessor.generate_description_template('창이 열리는 현상', '기본값')
+    print("✓ 기존 템플릿과 동일")
+
+
+def test_hot_reload_and_bulk():
+    """템플릿 파일 추가/수정 반영, 일괄 렌더링"""
+    print("\n=== 재로드/일괄 렌더링 ===")
+    with tempfile.TemporaryDirectory() as template_dir:
+        library = TemplateLibrary(template_dir, check_interval=0)
+        # 폴더가 비어 있으면 내장 기본 템플릿
+        assert library.names() == ['기본값']
+        assert library.render('기본값', main_text='A', expected_text='B') == \
+            compile_template(BUILTIN_DEFAULT_TEMPLATE)({'main_text': 'A', 'expected_text': 'B'})
+
+        path = os.path.join(template_dir, '사운드.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("* {{main_text}} / {{build_text}}\n")
+        assert library.names() == ['기본값', '사운드']
+        assert library.render('사운드', main_text='소리 없음', build_text='CL-1') == "* 소리 없음 / CL-1"
+
+        generation = library.generation
+        assert not library.refresh()
+        assert library.generation == generation
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("** {{main_text}}\n")
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        assert library.render('사운드', main_text='소리 없음') == "** 소리 없음"
+
+        rows = [{'main_text': f'행 {i}'} for i in range(3)]
+        assert library.render_many('사운드', rows) == ['** 행 0', '** 행 1', '** 행 2']
+
+    descriptions = TextProcessor.generate_descriptions(['버튼이 눌리지 않는 현상', '크래쉬 발생'], '기본값')
+    assert '* 버튼이 눌리지 않는 현상을 확인합니다.' in descriptions[0]
+    assert '* 크래쉬가 발생하지 않아야 합니다.' in descriptions[1]
+    print("✓ 파일 변경 반영, 일괄 렌더링")
+
+
+def benchmark(count=5000):
+    """엑셀 일괄 생성 규모"""
+    print(f"\n=== 벤치마크 ({count}행) ===")
+    summaries = [f"[UI] 아이템 {i}번 아이콘이 표시되지 않는 현상" for i in range(count)]
+    start = time.perf_counter()
+    TextProcessor.generate_descriptions(summaries, '서버크래쉬')
+    elapsed = time.perf_counter() - start
+    print(f"{count}행 설명 생성: {elapsed * 1000:.1f}ms")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_compile_template()
+    test_shipped_templates()
+    test_hot_reload_and_bulk()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+이슈 생성 스케줄러 테스트 스크립트
+interactive 레인 우선 실행, 레인별 취소, 백엔드 공유/지연 생성을 확인합니다.
+(브라우저 대신 테스트용 백엔드 사용)
+
+사용법:
+    python test_issue_scheduler.py
+"""
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import issue_scheduler
+from issue_scheduler import BATCH, INTERACTIVE, BrowserBackend, IssueScheduler
+from rate_control import RetryPolicy
+
+
+class RecordingBackend:
+    """생성 순서를 기록하고, gate가 열릴 때까지 첫 작업을 붙잡아 두는 백엔드"""
+
+    instances = 0
+
+    def __init__(self, delay=0.0):
+        RecordingBackend.instances += 1
+        self.delay = delay
+        self.order = []
+        self.gate = threading.Event()
+        self.closed = False
+
+    def create_issue(self, issue_data):
+        self.gate.wait(5)
+        if issue_data['summary'] == '실패':
+            raise RuntimeError('드롭다운 항목 선택 실패')
+        time.sleep(self.delay)
+        self.order.append(issue_data['summary'])
+        return f"P2-{len(self.order)}"
+
+    def close(self):
+        self.closed = True
+
+
+def test_interactive_jumps_ahead():
+    """대기 중인 batch 행보다 interactive 작업이 먼저 실행"""
+    print("\n=== interactive 우선 ===")
+    backend = RecordingBackend()
+    scheduler = IssueScheduler(lambda: backend)
+    batch = [scheduler.create_issue({'summary': f'행 {i}'}, BATCH) for i in range(4)]
+    time.sleep(0.05)  # 첫 행이 실행 중(gate 대기)인 상태
+    interactive = scheduler.create_issue({'summary': '단건'}, INTERACTIVE)
+    assert scheduler.pending_count(BATCH) == 3 and scheduler.pending_count(INTERACTIVE) == 1
+    backend.gate.set()
+
+    assert interactive.result(5) is not None
+    for future in batch:
+        future.result(5)
+    assert backend.order == ['행 0', '단건', '행 1', '행 2', '행 3'], backend.order
+    scheduler.shutdown()
+    assert backend.closed
+    print("✓ 실행 중인 행 다음에 interactive 실행")
+
+
+def test_cancel_batch_lane():
+    """batch 레인만 취소하고 interactive는 유지"""
+    print("\n=== 레인별 취소 ===")
+    backend = RecordingBackend()
+    scheduler = IssueScheduler(lambda: backend)
+    running = scheduler.create_issue({'summary': '행 0'}, BATCH)
+    time.sleep(0.05)
+    queued = [scheduler.create_issue({'summary': f'행 {i}'}, BATCH) for i in range(1, 3)]
+    interactive = scheduler.create_issue({'summary': '단건'}, INTERACTIVE)
+    assert scheduler.cancel(BATCH) == 2
+    backend.gate.set()
+
+    assert running.result(5) and interactive.result(5)
+    for future in queued:
+        try:
+            future.result(5)
+            assert False, "취소된 작업"
+        except CancelledError:
+            pass
+    scheduler.shutdown()
+    assert backend.order == ['행 0', '단건']
+    print("✓ 대기 중인 batch 행만 취소")
+
+
+def test_errors_and_lazy_backend():
+    """작업 오류는 Future로 전달, 백엔드는 첫 작업 때 한 번만 생성"""
+    print("\n=== 오류/백엔드 공유 ===")
+    RecordingBackend.instances = 0
+    scheduler = IssueScheduler(RecordingBackend, workers=2)
+    assert RecordingBackend.instances == 0
+
+    def open_gate(backend):
+        backend.gate.set()
+
+    scheduler.submit(open_gate, INTERACTIVE).result(5)
+    failed = scheduler.create_issue({'summary': '실패'})
+    ok = scheduler.create_issue({'summary': '성공'})
+    try:
+        failed.result(5)
+        assert False, "예외가 전달되어야 함"
+    except RuntimeError as e:
+        assert '드롭다운' in str(e)
+    assert ok.result(5) == 'P2-1'
+    assert RecordingBackend.instances == 1
+    scheduler.shutdown()
+    try:
+        scheduler.create_issue({'summary': '종료 후'})
+        assert False, "종료 후 추가 불가"
+    except RuntimeError:
+        pass
+    print("✓ 오류 전달/백엔드 1회 생성")
+
+
+class TransientError(Exception):
+    """테스트용 일시적 브라우저 오류 (WebDriverException 대신)"""
+
+
+class FakeAutomation:
+    """탭 열기/닫기와 폼 작성을 기록하고, fail_times만큼 폼 작성에 실패"""
+
+    def __init__(self, fail_times=0):
+        self.fail_times = fail_times
+        self.tabs = ['initial']
+        self.log = []
+
+    def create_new_tab(self):
+        self.tabs.append(f'tab{len(self.log)}')
+        self.log.append('new_tab')
+
+    def close_current_tab(self):
+        self.log.append(f'close:{self.tabs.pop()}')
+
+    def create_issue(self, issue_data, pause_for_review=True):
+        self.log.append(f"fill:{issue_data['summary']}")
+        if self.fail_times:
+            self.fail_times -= 1
+            raise TransientError('page not loaded')
+
+
+class FakeBrowserBackend(BrowserBackend):
+    """selenium 없이 BrowserBackend 재시도 경로 확인"""
+
+    def __init__(self, automation):
+        self.automation = automation
+        self._lock = threading.Lock()
+        self._first = True
+        self._form_tab_open = False
+        self.retry_policy = RetryPolicy(2, base_delay=0, jitter=0)
+
+    @staticmethod
+    def _is_retryable(error):
+        return isinstance(error, TransientError)
+
+
+def test_browser_retry_closes_failed_tab():
+    """재시도 전에 실패한 시도의 탭을 닫고, 이전 이슈 탭은 남겨 둠"""
+    print("\n=== 브라우저 재시도 탭 정리 ===")
+    original_time = issue_scheduler.time
+    issue_scheduler.time = type('NoSleep', (), {'sleep': staticmethod(lambda seconds: None)})
+    try:
+        automation = FakeAutomation()
+        backend = FakeBrowserBackend(automation)
+        backend.create_issue({'summary': '첫 이슈'})
+        automation.fail_times = 1
+        backend.create_issue({'summary': '두 번째'})
+        assert automation.log == ['fill:첫 이슈', 'new_tab', 'fill:두 번째', 'close:tab1', 'new_tab', 'fill:두 번째']
+        assert automation.tabs == ['initial', 'tab4']  # 첫 이슈 탭 + 성공한 탭
+
+        # 마지막 시도까지 실패하면 그 탭은 확인용으로 남기고 예외 전달
+        automation.fail_times = 2
+        try:
+            backend.create_issue({'summary': '세 번째'})
+            assert False, "재시도 후에도 실패하면 예외"
+        except TransientError:
+            pass
+        assert automation.log[6:] == ['new_tab', 'fill:세 번째', 'close:tab6', 'new_tab', 'fill:세 번째'] and len(automation.tabs) == 3
+    finally:
+        issue_scheduler.time = original_time
+    print("✓ 실패한 탭만 닫고 새 탭에서 재시도")
+
+
+def benchmark(count=200, delay=0.005):
+    """batch 행이 쌓여 있을 때 interactive 작업 대기 시간"""
+    print(f"\n=== 벤치마크 (batch {count}행 대기, 행당 {delay * 1000:.0f}ms) ===")
+    backend = RecordingBackend(delay)
+    backend.gate.set()
+    scheduler = IssueScheduler(lambda: backend)
+    for i in range(count):
+        scheduler.create_issue({'summary': f'행 {i}'}, BATCH)
+    time.sleep(delay * 5)
+    start = time.perf_counter()
+    scheduler.create_issue({'summary': '단건'}, INTERACTIVE).result(30)
+    waited = time.perf_counter() - start
+    position = backend.order.index('단건')
+    scheduler.shutdown(cancel_pending=True)
+    print(f"interactive 완료까지 {waited * 1000:.1f}ms ({position}번째 실행, FIFO였다면 약 {count * delay * 1000:.0f}ms)")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_interactive_jumps_ahead()
+    test_cancel_batch_lane()
+    test_errors_and_lazy_backend()
+    test_browser_retry_closes_failed_tab()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
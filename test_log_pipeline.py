@@ -0,0 +1,139 @@
+"""
+비동기 로그 파이프라인 테스트 스크립트
+JSON Lines 출력, 크기 기준 회전, % 인자 지연 포맷, 느린 디스크에서 호출 스레드 대기 시간을 확인합니다.
+
+사용법:
+    python test_log_pipeline.py
+"""
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from log_pipeline import JsonLinesFormatter, setup_logging, stop_logging
+
+
+def _read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_json_lines_output():
+    """파일은 JSON Lines, 콘솔은 텍스트, 예외는 별도 필드"""
+    print("\n=== JSON Lines 출력 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.jsonl')
+        console = io.StringIO()
+        setup_logging(logging.INFO, log_file=path, stream=console)
+        logger = logging.getLogger('test.pipeline')
+        values = ['Major']
+        logger.info("✅ %s (Dropdown - Click)", values[0])
+        values[0] = '바뀐 값'  # 큐에 들어간 뒤 인자가 바뀌어도 기록 시점 값
+        logger.debug("레벨에서 걸러짐")
+        try:
+            raise ValueError('드롭다운 없음')
+        except ValueError:
+            logger.exception("행 %d 실패", 3)
+        stop_logging()
+
+        records = _read_jsonl(path)
+        assert [r['message'] for r in records] == ["✅ Major (Dropdown - Click)", "행 3 실패"]
+        assert records[0]['level'] == 'INFO' and records[0]['logger'] == 'test.pipeline'
+        assert records[0]['thread'] == threading.current_thread().name
+        assert 'ValueError: 드롭다운 없음' in records[1]['exception']
+        assert 'test.pipeline - INFO - ✅ Major' in console.getvalue()
+    print("✓ JSON Lines/콘솔/예외 필드")
+
+
+def test_rotation():
+    """max_bytes를 넘으면 회전하고 backup_count개만 보관"""
+    print("\n=== 크기 기준 회전 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'app.jsonl')
+        setup_logging(logging.INFO, log_file=path, stream=None, max_bytes=2000, backup_count=2)
+        for i in range(200):
+            logging.getLogger('test.rotation').info("행 %d 생성 완료", i)
+        stop_logging()
+
+        files = sorted(os.listdir(tmp))
+        assert files == ['app.jsonl', 'app.jsonl.1', 'app.jsonl.2'], files
+        for name in files:
+            assert os.path.getsize(os.path.join(tmp, name)) <= 2000
+            _read_jsonl(os.path.join(tmp, name))  # 회전 경계에서도 줄이 깨지지 않음
+        assert _read_jsonl(path)[-1]['message'] == "행 199 생성 완료"
+    print("✓ 회전/보관 개수")
+
+
+def test_lazy_formatting():
+    """걸러지는 레벨의 인자는 문자열로 만들지 않음"""
+    print("\n=== 지연 포맷 ===")
+
+    class Expensive:
+        calls = 0
+
+        def __str__(self):
+            Expensive.calls += 1
+            return 'expensive'
+
+    setup_logging(logging.INFO, log_file=None, stream=io.StringIO())
+    logger = logging.getLogger('test.lazy')
+    for _ in range(100):
+        logger.debug("상태: %s", Expensive())
+    assert Expensive.calls == 0
+    logger.info("상태: %s", Expensive())
+    stop_logging()
+    assert Expensive.calls >= 1
+    assert JsonLinesFormatter().format(logging.makeLogRecord({'msg': '%s', 'args': ('a',)})).endswith('"a"}')
+    print("✓ DEBUG 인자 미평가")
+
+
+class SlowStream(io.StringIO):
+    """쓰기마다 지연되는 스트림 (느린 디스크/네트워크 드라이브)"""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def write(self, text):
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+def benchmark(count=200, delay=0.002):
+    """느린 스트림에서 호출 스레드가 기다리는 시간: 동기 핸들러 vs 큐"""
+    print(f"\n=== 벤치마크 ({count}줄, 쓰기당 {delay * 1000:.0f}ms) ===")
+    logger = logging.getLogger('test.bench')
+
+    root = logging.getLogger()
+    handler = logging.StreamHandler(SlowStream(delay))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    start = time.perf_counter()
+    for i in range(count):
+        logger.info("행 %d 생성 완료", i)
+    sync_time = time.perf_counter() - start
+    root.removeHandler(handler)
+
+    setup_logging(logging.INFO, log_file=None, stream=SlowStream(delay))
+    start = time.perf_counter()
+    for i in range(count):
+        logger.info("행 %d 생성 완료", i)
+    async_time = time.perf_counter() - start
+    stop_logging()
+    print(f"동기: {sync_time * 1000:.1f}ms, 큐: {async_time * 1000:.1f}ms (호출 스레드 기준)")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_json_lines_output()
+    test_rotation()
+    test_lazy_formatting()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+옵션 관리 테스트 스크립트
+메모리 옵션 목록의 순위(사용 빈도/최근성), 자동완성, 정리, 백그라운드 저장을 확인합니다.
+
+사용법:
+    python test_options_manager.py
+"""
+import os
+import tempfile
+import time
+
+from utils import OptionsManager, FileManager, flush_settings_stores
+
+
+def test_mru_and_cap():
+    """추가/삭제/최근 사용 순서/개수 제한"""
+    print("\n=== 최근 사용 순서 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        options_file = os.path.join(temp_dir, 'build_options.json')
+        # 예전 문자열 목록 형식
+        FileManager.save_json(['CL-1', 'CL-2', 'CL-1', ' '], options_file)
+
+        manager = OptionsManager(max_options=3)
+        # 중복/빈 항목은 읽을 때 정리
+        assert manager.load_options('build', options_file) == ['CL-1', 'CL-2']
+        assert manager.add_option('build', options_file, ' CL-3 ')
+        # 이미 있는 항목은 사용 기록만 갱신
+        assert not manager.add_option('build', options_file, 'CL-3')
+        assert manager.load_options('build', options_file) == ['CL-3', 'CL-1', 'CL-2']
+        # 개수 제한 초과 시 가장 오래 쓰지 않은 항목 제거
+        assert manager.add_option('build', options_file, 'CL-4')
+        assert manager.load_options('build', options_file) == ['CL-3', 'CL-4', 'CL-1']
+        assert manager.remove_option('build', options_file, 'CL-1')
+        assert not manager.remove_option('build', options_file, 'CL-1')
+        print("✓ 추가/삭제/순서/제한")
+
+        # 파일은 종료 시(또는 잠시 후) 한 번에 기록
+        flush_settings_stores()
+        assert [item['value'] for item in FileManager.load_json(options_file)] == ['CL-4', 'CL-3']
+        assert OptionsManager().load_options('build', options_file) == ['CL-3', 'CL-4']
+
+
+def test_ranking_completion_and_prune():
+    """사용 빈도/최근성 순위, 자동완성, 오래된 항목 정리"""
+    print("\n=== 순위/자동완성/정리 ===")
+    now = time.time()
+    day = 86400
+    with tempfile.TemporaryDirectory() as temp_dir:
+        options_file = os.path.join(temp_dir, 'build_options.json')
+        FileManager.save_json([
+            {'value': 'CompileBuild_DEV_game_SEL236613_r263331', 'count': 1, 'last_used': now},
+            {'value': 'CompileBuild_DEV_game_SEL236000_r263000', 'count': 10, 'last_used': now - day},
+            {'value': 'CompileBuild_LIVE_game_SEL230000_r250000', 'count': 10, 'last_used': now - 30 * day},
+            {'value': 'Old_build', 'count': 50, 'last_used': now - 90 * day},
+        ], options_file)
+
+        manager = OptionsManager(prune_rules={'build': {'max_age_days': 60, 'max_count': 100}})
+        # 60일 넘게 쓰지 않은 항목은 처음 읽을 때 정리
+        ranked = manager.load_options('build', options_file)
+        assert ranked == ['CompileBuild_DEV_game_SEL236000_r263000',
+                          'CompileBuild_LIVE_game_SEL230000_r250000',
+                          'CompileBuild_DEV_game_SEL236613_r263331'], ranked
+
+        # 접두어 일치가 먼저, 그 다음 부분 문자열 일치 (대소문자 무시)
+        assert manager.complete_options('build', options_file, 'compilebuild_live') == [
+            'CompileBuild_LIVE_game_SEL230000_r250000']
+        assert manager.complete_options('build', options_file, '263331') == [
+            'CompileBuild_DEV_game_SEL236613_r263331']
+        assert manager.complete_options('build', options_file, 'SEL23', limit=2) == ranked[:2]
+        assert manager.complete_options('build', options_file, '없음') == []
+
+        # 사용하면 순위가 올라감
+        for _ in range(20):
+            manager.record_use('build', options_file, 'CompileBuild_DEV_game_SEL236613_r263331')
+        assert manager.load_options('build', options_file)[0] == 'CompileBuild_DEV_game_SEL236613_r263331'
+        assert not manager.record_use('build', options_file, '목록에 없는 빌드')
+
+        # 개수 기준 정리: 점수가 낮은 항목부터
+        manager.prune_rules['build']['max_count'] = 1
+        assert manager.prune_options('build', options_file) == 2
+        assert manager.load_options('build', options_file) == ['CompileBuild_DEV_game_SEL236613_r263331']
+        flush_settings_stores()
+        print("✓ 순위/자동완성/정리")
+
+
+def benchmark(count=2000):
+    """연속 추가 시간, 자동완성 조회 시간"""
+    print(f"\n=== 벤치마크 ({count}번 추가) ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        options_file = os.path.join(temp_dir, 'build_options.json')
+        manager = OptionsManager()
+        start = time.perf_counter()
+        for i in range(count):
+            manager.add_option('build', options_file, f'CL-{i}')
+        elapsed = time.perf_counter() - start
+        flush_settings_stores()
+        print(f"추가 평균: {elapsed / count * 1e6:.1f}us (디스크 기록은 백그라운드)")
+
+        start = time.perf_counter()
+        for i in range(count):
+            manager.complete_options('build', options_file, f'CL-{i % 100}')
+        elapsed = time.perf_counter() - start
+        print(f"자동완성 평균 ({manager.max_options}개 중): {elapsed / count * 1e6:.1f}us")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_mru_and_cap()
+    test_ranking_completion_and_prune()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
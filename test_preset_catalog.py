@@ -0,0 +1,208 @@
+"""
+프리셋 카탈로그/검색 테스트 스크립트
+기존 listdir/getmtime 방식과 같은 구조를 만드는지, 증분 갱신과 검색이 맞는지 확인합니다.
+
+사용법:
+    python test_preset_catalog.py
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+import preset_store
+from preset_catalog import PresetCatalog, parse_preset_filename
+from text_index import TrigramIndex
+from utils import PresetManager
+
+
+def _write(preset_dir, filename, mtime):
+    path = os.path.join(preset_dir, filename)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'summary': filename}, f, ensure_ascii=False)
+    os.utime(path, (mtime, mtime))
+
+
+def _legacy_structure(preset_dir):
+    """기존 get_preset_names_and_versions 동작 (비교용)"""
+    files = [f for f in os.listdir(preset_dir) if f.endswith('.json')]
+    files.sort(key=lambda f: os.path.getmtime(os.path.join(preset_dir, f)), reverse=True)
+    structure = {}
+    for filename in files:
+        prefix, name, version = parse_preset_filename(filename)
+        structure.setdefault(prefix, {}).setdefault(name, []).append((version, filename))
+    for names in structure.values():
+        for versions in names.values():
+            versions.sort(reverse=True, key=lambda x: x[0])
+    return structure
+
+
+def test_structure_matches_legacy():
+    """카탈로그 구조가 기존 방식과 같은지"""
+    print("\n=== 기존 구조와 비교 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        base = time.time() - 1000
+        for i, filename in enumerate(['UI_인벤토리.json', 'UI_인벤토리_1.json', 'UI_인벤토리_2.json',
+                                      '크래시_로비_진입.json', '크래시_로비_진입_3.json', 'solo.json']):
+            _write(preset_dir, filename, base + i)
+
+        catalog = PresetCatalog(preset_dir)
+        structure = catalog.get_structure()
+        assert structure == _legacy_structure(preset_dir)
+        assert list(structure) == list(_legacy_structure(preset_dir))
+        assert structure['UI']['인벤토리'][0] == (2, 'UI_인벤토리_2.json')
+        print(f"✓ prefix 순서: {list(structure)}")
+
+
+def test_incremental_updates():
+    """저장/삭제/외부 변경이 재스캔 없이 반영되는지"""
+    print("\n=== 증분 갱신 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        manager = PresetManager(preset_dir)
+        assert manager.save_preset('UI_인벤토리', {'summary': 'a'})
+        assert manager.save_preset('UI_인벤토리', {'summary': 'b'})
+        assert manager.get_preset_files(sort_by_date=False) == ['UI_인벤토리.json', 'UI_인벤토리_1.json']
+
+        # 'UI_인벤토리_1'을 베이스로 저장하면 기존 규칙대로 _1_1이 아닌 새 원본이 생김
+        assert manager.catalog.next_version_filename('UI_인벤토리_1') == 'UI_인벤토리_1_1.json'
+        assert manager.catalog.next_version_filename('UI_상점') == 'UI_상점.json'
+
+        assert manager.delete_preset('UI_인벤토리_1.json')
+        assert manager.catalog.next_version_filename('UI_인벤토리') == 'UI_인벤토리_1.json'
+
+        # 설정/캐시 파일은 프리셋 목록에 나오지 않음
+        _write(preset_dir, 'settings.json', time.time())
+        _write(preset_dir, 'jira_field_options.json', time.time())
+        _write(preset_dir, 'build_feed_state.json', time.time())
+        # 외부에서 추가된 파일은 refresh로 반영
+        generation = manager.catalog.generation
+        _write(preset_dir, '서버_크래시.json', time.time())
+        assert manager.refresh()
+        assert not manager.refresh()
+        assert manager.catalog.generation > generation
+        assert 'settings.json' not in manager.get_preset_files()
+        assert not {'jira', 'build'} & set(manager.get_preset_names_and_versions())
+        assert manager.get_preset_names_and_versions()['서버'] == {'크래시': [(0, '서버_크래시.json')]}
+
+        os.remove(os.path.join(preset_dir, '서버_크래시.json'))
+        assert manager.refresh()
+        assert '서버' not in manager.get_preset_names_and_versions()
+        print("✓ 저장/삭제/외부 변경 반영")
+
+
+def test_search_presets():
+    """파일명/요약 검색과 증분 갱신"""
+    print("\n=== 프리셋 검색 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        manager = PresetManager(preset_dir)
+        manager.save_preset('UI_인벤토리', {'summary': '아이템명이 축약되어 출력됨'})
+        manager.save_preset('UI_인벤토리', {'summary': '아이템명이 축약되어 출력됨'})
+        manager.save_preset('크래시_로비', {'summary': '로비 진입 시 클라이언트 크래시'})
+        manager.build_search_index()
+
+        # 같은 이름의 여러 버전은 최신 버전 하나만
+        assert manager.search_presets('아이템명') == [('UI_인벤토리_1.json', '아이템명이 축약되어 출력됨')]
+        # 오타가 있어도 대부분의 3-gram이 일치하면 찾음
+        assert manager.search_presets('클라이언트 크레시')[0][0] == '크래시_로비.json'
+        # 파일명으로도 검색
+        assert manager.search_presets('로비')[0][0] == '크래시_로비.json'
+
+        # 저장/삭제가 인덱스에 바로 반영
+        manager.save_preset('상점_결제', {'summary': '결제 팝업이 닫히지 않음'})
+        assert manager.search_presets('결제 팝업')[0][0] == '상점_결제.json'
+        manager.delete_preset('상점_결제.json')
+        assert manager.search_presets('결제 팝업') == []
+        print("✓ 검색/증분 갱신")
+
+
+def test_search_presets_sqlite():
+    """SQLite 저장소 사용 시 DB 전문 검색으로 조회 (메모리 인덱스 없이)"""
+    print("\n=== 프리셋 검색 (SQLite) ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        preset_store.PRESET_STORE = 'sqlite'
+        try:
+            manager = PresetManager(preset_dir)
+        finally:
+            preset_store.PRESET_STORE = 'directory'
+        try:
+            manager.save_preset('UI_인벤토리', {'summary': '아이템명이 축약되어 출력됨'})
+            manager.save_preset('UI_인벤토리', {'summary': '아이템명이 축약되어 출력됨'})
+            manager.save_preset('크래시_로비', {'summary': '로비 진입 시 클라이언트 크래시'})
+            assert manager.build_search_index() == 3 and len(manager.search_index) == 0
+
+            assert manager.search_presets('아이템명') == [('UI_인벤토리_1.json', '아이템명이 축약되어 출력됨')]
+            assert manager.search_presets('클라이언트 크래시')[0][0] == '크래시_로비.json'
+            # 파일명으로도 검색 ('_'는 공백과 같게 취급)
+            assert manager.search_presets('인벤토리') == [('UI_인벤토리_1.json', '아이템명이 축약되어 출력됨')]
+            assert manager.search_presets('UI 인벤')[0][0] == 'UI_인벤토리_1.json'
+
+            # 저장/삭제가 바로 반영
+            manager.save_preset('상점_결제', {'summary': '결제 팝업이 닫히지 않음'})
+            assert manager.search_presets('결제 팝업')[0][0] == '상점_결제.json'
+            manager.delete_preset('상점_결제.json')
+            assert manager.search_presets('결제 팝업') == []
+        finally:
+            manager.db_store.close()
+            preset_store._stores.pop(manager.db_store.db_path, None)
+        print("✓ DB 검색/최신 버전/파일명 일치")
+
+
+def benchmark_search(count=30000):
+    """수만 개 프리셋에서 검색 시간"""
+    print(f"\n=== 검색 벤치마크 ({count}개) ===")
+    rng = random.Random(0)
+    words = ['인벤토리', '아이템', '로비', '크래시', '상점', '결제', '매칭', '낙하산', '차량', '무기',
+             '사운드', '텍스처', '번역', '툴팁', '팝업', '깨짐', '누락', '지연', '출력', '오류']
+    index = TrigramIndex()
+    start = time.perf_counter()
+    for i in range(count):
+        index.add(f"P{i % 40}_이름{i}.json", ' '.join(rng.choice(words) for _ in range(6)))
+    built = time.perf_counter() - start
+
+    queries = ['인벤토리 아이템', '크래시', '낙하산 사운드 누락', '결재 팝업', '매칭 지연 오류']
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, limit=20)
+    elapsed = (time.perf_counter() - start) / len(queries)
+    print(f"구축: {built * 1000:.0f}ms, 검색 평균: {elapsed * 1000:.2f}ms")
+
+
+def benchmark(count=5000):
+    """기존 방식과 조회 시간 비교"""
+    print(f"\n=== 벤치마크 ({count}개) ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        base = time.time() - count
+        for i in range(count):
+            _write(preset_dir, f"P{i % 50}_이름{i % 400}_{i}.json", base + i)
+
+        start = time.perf_counter()
+        _legacy_structure(preset_dir)
+        legacy = time.perf_counter() - start
+
+        catalog = PresetCatalog(preset_dir)
+        start = time.perf_counter()
+        catalog.get_structure()
+        first = time.perf_counter() - start
+
+        start = time.perf_counter()
+        catalog.next_version_filename('P1_이름1')
+        catalog.get_structure()
+        cached = time.perf_counter() - start
+
+        print(f"기존 방식: {legacy * 1000:.1f}ms, 최초 스캔: {first * 1000:.1f}ms, 이후 조회: {cached * 1000:.3f}ms")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_structure_matches_legacy()
+    test_incremental_updates()
+    test_search_presets()
+    test_search_presets_sqlite()
+    benchmark()
+    benchmark_search()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+프리셋 델타 저장 테스트 스크립트
+execute()처럼 거의 같은 버전을 반복 저장할 때 복원 결과와 디스크 사용량을 확인합니다.
+
+사용법:
+    python test_preset_delta.py
+"""
+import json
+import os
+import random
+import tempfile
+
+from config import PRESET_SNAPSHOT_INTERVAL
+from preset_delta import DELTA_KEY, apply_delta, make_delta, get_materializer
+from utils import PresetManager
+
+
+BASE_PRESET = {
+    'summary': '[인벤토리] 아이템명이 축약되어 출력됨',
+    'priority': 'High',
+    'severity': '2 - Major',
+    'steps': '\n'.join(f"{i}. 단계 {i} 진행" for i in range(1, 15)),
+    'description': '\n'.join(f"* 관찰 결과 {i}번째 줄입니다." for i in range(40)),
+    'build': 'CL-1000',
+}
+
+
+def _mutate(data, rng):
+    """실제 사용 패턴처럼 일부 필드만 조금 바꿈"""
+    data = dict(data)
+    data['build'] = f"CL-{rng.randint(1000, 9999)}"
+    if rng.random() < 0.5:
+        lines = data['description'].split('\n')
+        lines[rng.randrange(len(lines))] = f"* 수정된 줄 {rng.random()}"
+        data['description'] = '\n'.join(lines)
+    if rng.random() < 0.2:
+        data['summary'] = data['summary'] + ' (재현)'
+    if rng.random() < 0.1:
+        data.pop('build')
+    return data
+
+
+def test_delta_roundtrip():
+    """make_delta/apply_delta 왕복"""
+    print("\n=== 델타 왕복 ===")
+    rng = random.Random(1)
+    parent = dict(BASE_PRESET)
+    for _ in range(200):
+        child = _mutate(parent, rng)
+        assert apply_delta(parent, make_delta(parent, child)) == child
+        parent = child
+    assert make_delta(BASE_PRESET, BASE_PRESET) == {}
+    print("✓ 200회 왕복 일치")
+
+
+def test_versions_restore_and_snapshots():
+    """저장된 모든 버전이 그대로 복원되고, 주기적으로 전체 스냅샷이 생기는지"""
+    print("\n=== 버전 저장/복원 ===")
+    rng = random.Random(2)
+    with tempfile.TemporaryDirectory() as preset_dir:
+        manager = PresetManager(preset_dir)
+        saved = {}
+        data = dict(BASE_PRESET)
+        for i in range(PRESET_SNAPSHOT_INTERVAL * 3):
+            data = _mutate(data, rng)
+            assert manager.save_preset('UI_인벤토리', data)
+            saved['UI_인벤토리.json' if i == 0 else f'UI_인벤토리_{i}.json'] = data
+
+        full = [name for name in saved
+                if DELTA_KEY not in json.load(open(os.path.join(preset_dir, name), encoding='utf-8'))]
+        assert len(full) >= 3, full
+
+        # 캐시 없이 디스크에서 복원
+        get_materializer(preset_dir).clear()
+        for name, expected in saved.items():
+            assert manager.load_preset(name) == expected, name
+
+        # 중간 버전을 삭제해도 이후 버전은 복원됨
+        assert manager.delete_preset('UI_인벤토리_3.json')
+        del saved['UI_인벤토리_3.json']
+        get_materializer(preset_dir).clear()
+        for name, expected in saved.items():
+            assert manager.load_preset(name) == expected, name
+        print(f"✓ {len(saved)}개 버전 복원, 전체 스냅샷 {len(full)}개")
+
+
+def test_failed_write_keeps_base():
+    """쓰기 도중 실패해도 기존 버전(델타 체인의 부모) 파일은 그대로"""
+    print("\n=== 원자적 쓰기 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        manager = PresetManager(preset_dir)
+        manager.save_preset('UI_인벤토리', BASE_PRESET)
+        manager.save_preset('UI_인벤토리', dict(BASE_PRESET, build='CL-2000'))
+        path = os.path.join(preset_dir, 'UI_인벤토리.json')
+        with open(path, encoding='utf-8') as f:
+            before = f.read()
+
+        # 직렬화 도중 실패 (디스크 부족 등으로 쓰기가 중단된 경우)
+        try:
+            get_materializer(preset_dir)._write_raw('UI_인벤토리.json', {'summary': 'x', 'steps': {1, 2}})
+            assert False, "직렬화 오류가 전달되어야 함"
+        except TypeError:
+            pass
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == before
+        assert not [name for name in os.listdir(preset_dir) if name.startswith('.tmp_')]
+        get_materializer(preset_dir).clear()
+        assert manager.load_preset('UI_인벤토리_1.json') == dict(BASE_PRESET, build='CL-2000')
+        print("✓ 실패한 쓰기가 부모 파일을 덮어쓰지 않음")
+
+
+def test_async_load_and_prefetch():
+    """백그라운드 로드/미리 읽기 후 캐시에서 바로 꺼내지는지"""
+    print("\n=== 비동기 로드 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        manager = PresetManager(preset_dir)
+        manager.save_preset('UI_인벤토리', BASE_PRESET)
+        manager.save_preset('UI_인벤토리', dict(BASE_PRESET, build='CL-2000'))
+        get_materializer(preset_dir).clear()
+        assert manager.peek_preset('UI_인벤토리_1.json') is None
+
+        # 같은 파일에 대한 동시 요청은 하나의 로드를 공유
+        first = manager.load_preset_async('UI_인벤토리_1.json')
+        second = manager.load_preset_async('UI_인벤토리_1.json')
+        assert first.result(timeout=5) == dict(BASE_PRESET, build='CL-2000')
+        assert second.result(timeout=5) == first.result()
+
+        manager.prefetch_preset('UI_인벤토리.json')
+        manager.load_preset_async('UI_인벤토리.json').result(timeout=5)
+        assert manager.peek_preset('UI_인벤토리.json') == BASE_PRESET
+        # 없는 파일은 None
+        assert manager.load_preset_async('없음.json').result(timeout=5) is None
+        manager.shutdown()
+        print("✓ 비동기 로드/미리 읽기")
+
+
+def benchmark(count=500):
+    """전체 저장 대비 디스크 사용량"""
+    print(f"\n=== 디스크 사용량 ({count}개 버전) ===")
+    rng = random.Random(3)
+    versions = []
+    data = dict(BASE_PRESET)
+    for _ in range(count):
+        data = _mutate(data, rng)
+        versions.append(data)
+
+    full_size = sum(len(json.dumps(v, indent=4, ensure_ascii=False).encode('utf-8')) for v in versions)
+    with tempfile.TemporaryDirectory() as preset_dir:
+        manager = PresetManager(preset_dir)
+        for version in versions:
+            manager.save_preset('UI_인벤토리', version)
+        delta_size = sum(entry.stat().st_size for entry in os.scandir(preset_dir))
+    print(f"전체 저장: {full_size / 1024:.0f}KB, 델타 저장: {delta_size / 1024:.0f}KB "
+          f"({delta_size / full_size:.0%})")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_delta_roundtrip()
+    test_versions_restore_and_snapshots()
+    test_failed_write_keeps_base()
+    test_async_load_and_prefetch()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
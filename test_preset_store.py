@@ -0,0 +1,123 @@
+"""
+SQLite 프리셋 저장소 테스트 스크립트
+디렉토리 저장 방식과 같은 파일명 키/트리를 만드는지, 이전과 검색이 동작하는지 확인합니다.
+
+사용법:
+    python test_preset_store.py
+"""
+import json
+import os
+import tempfile
+import time
+
+from preset_catalog import PresetCatalog
+from preset_store import SqlitePresetStore
+from utils import PresetManager
+
+
+def _write(preset_dir, filename, data, mtime):
+    path = os.path.join(preset_dir, filename)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.utime(path, (mtime, mtime))
+
+
+def test_save_versions():
+    """저장 시 버전 번호와 파일명 키가 디렉토리 방식과 같은지"""
+    print("\n=== 버전 저장 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        store = SqlitePresetStore(os.path.join(preset_dir, 'presets.db'))
+        assert store.save('UI_인벤토리', {'summary': 'a'}) == 'UI_인벤토리.json'
+        assert store.save('UI_인벤토리', {'summary': 'b'}) == 'UI_인벤토리_1.json'
+        # 다른 (prefix, name)의 키와 겹치면 다음 번호로 저장
+        assert store.save('UI_인벤토리_1', {'summary': 'c'}) == 'UI_인벤토리_1_1.json'
+        assert store.next_version_filename('UI_인벤토리') == 'UI_인벤토리_2.json'
+
+        assert store.load('UI_인벤토리_1.json') == {'summary': 'b'}
+        assert store.get_structure()['UI']['인벤토리'] == [(1, 'UI_인벤토리_1.json'), (0, 'UI_인벤토리.json')]
+
+        generation = store.generation
+        assert store.delete('UI_인벤토리_1.json')
+        assert not store.delete('UI_인벤토리_1.json')
+        assert store.generation > generation
+        assert store.load('UI_인벤토리_1.json') is None
+        store.close()
+        print("✓ 저장/로드/삭제")
+
+
+def test_same_tree_as_directory():
+    """숫자로 끝나는 이름도 디렉토리 저장 방식과 같은 트리/파일명으로 저장"""
+    print("\n=== 디렉토리 방식과 같은 트리 ===")
+    names = ['UI_인벤토리', 'UI_인벤토리', 'UI_인벤토리_1', '서버_크래시_2', '서버_크래시', '빌드_v2', 'solo', 'solo']
+    with tempfile.TemporaryDirectory() as preset_dir, tempfile.TemporaryDirectory() as db_dir:
+        manager = PresetManager(preset_dir)
+        store = SqlitePresetStore(os.path.join(db_dir, 'presets.db'))
+        for name in names:
+            assert store.next_version_filename(name) == manager.catalog.next_version_filename(name), name
+            manager.save_preset(name, {'summary': name})
+            store.save(name, {'summary': name})
+        assert store.get_structure(sort_by_date=False) == manager.get_preset_names_and_versions(sort_by_date=False)
+        assert store.get_structure()['서버']['크래시'] == [(3, '서버_크래시_3.json'), (2, '서버_크래시_2.json')]
+        store.close()
+        manager.shutdown()
+        print("✓ 파일명/트리 일치")
+
+
+def test_migrate_and_search():
+    """디렉토리 이전 결과가 카탈로그와 같은 트리인지, summary 검색이 되는지"""
+    print("\n=== 디렉토리 이전 / 검색 ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        base = time.time() - 100
+        presets = {
+            'UI_인벤토리.json': '인벤토리 아이템명 축약 출력',
+            'UI_인벤토리_1.json': '인벤토리 아이템명 축약 출력',
+            '크래시_로비.json': '로비 진입 시 클라이언트 크래시',
+            'solo.json': '접두사만 있는 프리셋',
+        }
+        for i, (filename, summary) in enumerate(presets.items()):
+            _write(preset_dir, filename, {'summary': summary}, base + i)
+        _write(preset_dir, 'settings.json', {'summary': '설정'}, base)
+
+        store = SqlitePresetStore(os.path.join(preset_dir, 'presets.db'))
+        assert store.migrate_from_directory(preset_dir) == len(presets)
+        assert store.migrate_from_directory(preset_dir) == 0  # 다시 실행해도 안전
+        assert store.get_structure() == PresetCatalog(preset_dir).get_structure()
+        assert list(store.get_structure()) == list(PresetCatalog(preset_dir).get_structure())
+
+        assert set(store.search('아이템명')) == {'UI_인벤토리.json', 'UI_인벤토리_1.json'}
+        assert store.search('크래시') == ['크래시_로비.json']
+        assert store.search('없는 문장') == []
+        store.close()
+        print("✓ 이전 및 summary 검색")
+
+
+def benchmark(count=5000):
+    """저장/트리 조회 시간"""
+    print(f"\n=== 벤치마크 ({count}개) ===")
+    with tempfile.TemporaryDirectory() as preset_dir:
+        store = SqlitePresetStore(os.path.join(preset_dir, 'presets.db'))
+        data = {'summary': '인벤토리 아이템명 축약', 'steps': '1. 접속\n2. 확인' * 20, 'description': '설명' * 200}
+
+        start = time.perf_counter()
+        for i in range(count):
+            store.save(f"P{i % 50}_이름{i % 400}", data)
+        saved = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store.get_structure()
+        tree = time.perf_counter() - start
+        print(f"저장 {count}회: {saved * 1000:.1f}ms, 트리 조회: {tree * 1000:.1f}ms")
+        store.close()
+
+
+def main():
+    """메인 테스트 함수"""
+    test_save_versions()
+    test_same_tree_as_directory()
+    test_migrate_and_search()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+재시도/동시 실행 제어 테스트 스크립트
+지수 백오프 + 지터, Retry-After, AIMD 한도 조절, REST 클라이언트 재시도를 확인합니다.
+(JIRA에는 접속하지 않고 가짜 세션 사용)
+
+사용법:
+    python test_rate_control.py
+"""
+import random
+import threading
+import time
+
+from jira_rest import JiraRestClient, JiraRestError, is_transient, parse_retry_after
+from rate_control import CONGESTED, NEUTRAL, OK, AdaptiveLimiter, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body or {}
+        self.headers = headers or {}
+        self.content = b'{}'
+        self.text = str(self._body)
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    """정해 둔 응답을 차례로 반환"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+def test_retry_policy():
+    """지수 백오프 + 지터, Retry-After, 재시도 대상 구분"""
+    print("\n=== 재시도 정책 ===")
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=5.0, jitter=0.5, rng=lambda: 1.0)
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 2.5]
+    assert policy.delay(0, retry_after=7) == 7
+    assert RetryPolicy(jitter=0, base_delay=1.0, max_delay=5.0).delay(10) == 5.0
+
+    waits = []
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise JiraRestError(503, 'busy', retry_after=4 if len(attempts) == 2 else None)
+        return 'ok'
+
+    result = policy.call(flaky, is_retryable=lambda e: True,
+                         retry_after=lambda e: e.retry_after, sleep=waits.append)
+    assert result == 'ok' and waits == [0.5, 4]
+
+    try:
+        policy.call(lambda: (_ for _ in ()).throw(ValueError('입력 오류')),
+                    is_retryable=lambda e: not isinstance(e, ValueError), sleep=waits.append)
+        assert False, "재시도 대상이 아니면 바로 예외"
+    except ValueError:
+        assert waits == [0.5, 4]
+    print("✓ 백오프/Retry-After/재시도 대상")
+
+
+def test_aimd():
+    """성공 시 덧셈 증가, 부하 신호 시 곱셈 감소"""
+    print("\n=== AIMD ===")
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial=2, maximum=8, latency_target=2.0, cooldown=1.0, clock=clock)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(0.5, OK)
+    assert limiter.limit == 4, limiter.limit  # 2 -> 약 4.5
+
+    limiter.acquire()
+    limiter.release(0.5, CONGESTED)
+    assert limiter.limit == 2
+    limiter.acquire()
+    limiter.release(0.5, CONGESTED)  # cooldown 안에서는 한 번만 감소
+    assert limiter.limit == 2
+    clock.now += 1.5
+    limiter.acquire()
+    limiter.release(3.0, OK)  # 목표보다 느린 응답도 감소
+    assert limiter.limit == 1
+    limiter.acquire()
+    limiter.release(0.1, NEUTRAL)
+    assert limiter.limit == 1 and limiter.in_flight == 0
+    print("✓ 증가/감소/쿨다운")
+
+
+def test_limiter_blocks_and_pauses():
+    """한도만큼만 동시 실행, pause 동안 대기"""
+    print("\n=== 동시 실행 제한/일시 정지 ===")
+    limiter = AdaptiveLimiter(initial=2, maximum=2)
+    assert limiter.acquire() and limiter.acquire()
+    assert not limiter.acquire(timeout=0.05)
+    threading.Timer(0.05, lambda: limiter.release(0.01)).start()
+    assert limiter.acquire(timeout=1)
+    limiter.release(0.01)
+    limiter.release(0.01)
+
+    limiter.pause(0.2)
+    start = time.monotonic()
+    assert limiter.acquire(timeout=1)
+    assert time.monotonic() - start >= 0.15
+    limiter.release(0.01)
+    print("✓ 자리 대기/Retry-After 정지")
+
+
+def test_rest_client_retry():
+    """REST: 429는 Retry-After 후 재시도, POST는 502에서 재시도하지 않음"""
+    print("\n=== REST 재시도 ===")
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('') is None and parse_retry_after('곧') is None
+
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01, jitter=0)
+    limiter = AdaptiveLimiter(initial=4, maximum=4)
+    client = JiraRestClient(base_url='http://jira.invalid', token='', project_key='P2', custom_fields={},
+                            retry_policy=policy, limiter=limiter)
+    client._myself = 'qa_user'
+    client._session = FakeSession([
+        FakeResponse(429, {'errorMessages': ['rate limited']}, {'Retry-After': '0'}),
+        FakeResponse(201, {'key': 'P2-1'}),
+    ])
+    assert client.create_issue({'summary': '재시도'}) == 'P2-1'
+    assert client._session.calls == 2
+    assert limiter.limit == 2 and limiter.in_flight == 0  # 429로 한도 감소
+
+    client._session = FakeSession([FakeResponse(502, {'errorMessages': ['bad gateway']})])
+    try:
+        client.create_issue({'summary': '중복 방지'})
+        assert False, "POST 502는 재시도하지 않음"
+    except JiraRestError as e:
+        assert e.status_code == 502 and client._session.calls == 1
+
+    client._session = FakeSession([FakeResponse(502), FakeResponse(200, {'name': 'qa_user'})])
+    client._myself = None
+    assert client.myself() == 'qa_user' and client._session.calls == 2  # GET은 재시도
+
+    client._session = FakeSession([FakeResponse(400, {'errors': {'priority': 'invalid'}})])
+    client._myself = 'qa_user'
+    limit = limiter.limit
+    try:
+        client.create_issue({'summary': '입력 오류'})
+        assert False
+    except JiraRestError as e:
+        assert e.status_code == 400 and limiter.limit == limit  # 입력 오류는 한도 유지
+    print("✓ 429/Retry-After, POST 중복 방지, GET 재시도")
+
+
+# requests/urllib3 예외 구조를 흉내 낸 클래스 (이름으로 구분하므로 requests 없이 확인)
+class RequestsConnectionError(OSError):  # requests.ConnectionError
+    pass
+
+
+class ConnectTimeout(RequestsConnectionError):  # requests.ConnectTimeout
+    pass
+
+
+class NewConnectionError(OSError):  # urllib3 연결 단계 실패
+    pass
+
+
+class ProtocolError(OSError):  # urllib3 전송 후 끊김 (Connection aborted)
+    pass
+
+
+class MaxRetryError(OSError):
+    def __init__(self, reason):
+        super().__init__(str(reason))
+        self.reason = reason
+
+
+def test_post_retry_only_when_not_sent():
+    """POST는 요청이 전달되지 않은 연결 실패만 재시도 (전송 후 끊김은 중복 생성 위험)"""
+    print("\n=== POST 연결 오류 재시도 ===")
+    refused = RequestsConnectionError(MaxRetryError(NewConnectionError('Connection refused')))
+    aborted = RequestsConnectionError(ProtocolError('Connection aborted.', OSError('RemoteDisconnected')))
+    assert is_transient(refused, idempotent=False)
+    assert is_transient(ConnectTimeout('connect timeout'), idempotent=False)
+    assert not is_transient(aborted, idempotent=False)
+    assert not is_transient(TimeoutError('read timeout'), idempotent=False)
+    assert is_transient(aborted) and is_transient(refused)  # GET은 모두 재시도
+    print("✓ 연결 실패만 POST 재시도")
+
+
+def benchmark(requests_count=400, capacity=6, seed=1):
+    """서버 허용량(capacity)을 넘으면 429를 내는 가상 서버에서 고정 vs AIMD"""
+    print(f"\n=== 벤치마크 ({requests_count}요청, 서버 허용 동시 {capacity}) ===")
+    rng = random.Random(seed)
+
+    def simulate(limiter):
+        throttled = 0
+        for _ in range(requests_count):
+            in_flight = limiter.limit
+            latency = 0.2 + 0.05 * rng.random()
+            if in_flight > capacity:
+                throttled += 1
+                limiter.acquire()
+                limiter.release(latency, CONGESTED)
+            else:
+                limiter.acquire()
+                limiter.release(latency, OK)
+        return throttled
+
+    fixed = AdaptiveLimiter(initial=16, minimum=16, maximum=16)
+    aimd = AdaptiveLimiter(initial=2, maximum=16, cooldown=0)
+    fixed_throttled = simulate(fixed)
+    aimd_throttled = simulate(aimd)
+    print(f"고정 16: 429 {fixed_throttled}회, AIMD: 429 {aimd_throttled}회 (최종 한도 {aimd.limit})")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_retry_policy()
+    test_aimd()
+    test_limiter_blocks_and_pauses()
+    test_rest_client_retry()
+    test_post_retry_only_when_not_sent()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+AI 응답 파서 테스트 스크립트
+실제로 수집된 깨진 응답 유형을 코퍼스로 사용합니다.
+
+사용법:
+    python test_response_parser.py
+"""
+import json
+import random
+import re
+import time
+
+from response_parser import ResponseFieldScanner, parse_response_fields
+
+
+VALID = {
+    'priority': 'High',
+    'severity': '2 - Major',
+    'steps': '1. 하이드아웃 접속\n2. 인벤토리 열기\n3. 아이템명 확인',
+    'description': '*Observed(관찰 결과):*\n\n* 아이템명이 축약되어 출력됨\n{color:#4c9aff}Item name is truncated{color}',
+}
+
+# (이름, 응답 텍스트, 기대 결과) - 기대 결과가 None이면 VALID와 같아야 함
+MALFORMED_CORPUS = [
+    ('정상 JSON', json.dumps(VALID, ensure_ascii=False), None),
+    ('코드 블록', '```json\n' + json.dumps(VALID, ensure_ascii=False, indent=2) + '\n```', None),
+    ('앞뒤 설명 문장',
+     '다음은 요청하신 "버그 리포트"입니다:\n' + json.dumps(VALID, ensure_ascii=False) + '\n\n참고: "Priority"는 추정치입니다.',
+     None),
+    ('문자열 안의 실제 줄바꿈',
+     '{\n  "priority": "High",\n  "severity": "2 - Major",\n'
+     '  "steps": "1. 하이드아웃 접속\n2. 인벤토리 열기\n3. 아이템명 확인",\n'
+     '  "description": "*Observed(관찰 결과):*\n\n* 아이템명이 축약되어 출력됨\n{color:#4c9aff}Item name is truncated{color}"\n}',
+     None),
+    ('이스케이프 안 된 따옴표',
+     '{"priority": "High", "severity": "2 - Major", "steps": "1. 하이드아웃 접속", '
+     '"description": "* !video.mp4|width=2560,height=1440,alt="video.mp4"!\\n* 끝"}',
+     {'steps': '1. 하이드아웃 접속', 'description': '* !video.mp4|width=2560,height=1440,alt="video.mp4"!\n* 끝'}),
+    ('쉼표 누락',
+     '{"priority": "High"\n"severity": "2 - Major"\n"steps": "1. 접속"\n"description": "설명"}',
+     {'steps': '1. 접속', 'description': '설명'}),
+    ('남는 쉼표', '{"priority": "High", "severity": "2 - Major", "steps": "1. 접속", "description": "설명",}',
+     {'steps': '1. 접속', 'description': '설명'}),
+    ('대문자 키', '{"Priority": "High", "Severity": "2 - Major", "Steps": "1. 접속", "Description": "설명"}',
+     {'steps': '1. 접속', 'description': '설명'}),
+    ('배열로 출력된 steps',
+     '{"priority": "High", "severity": "2 - Major", "steps": ["1. 접속", "2. 확인"], "description": "설명"}',
+     {'steps': '1. 접속\n2. 확인', 'description': '설명'}),
+    ('중첩 객체', '{"bug": {"priority": "High", "severity": "2 - Major", "steps": "1. 접속", "description": "설명"}}',
+     {'steps': '1. 접속', 'description': '설명'}),
+    ('유니코드 이스케이프',
+     '{"priority": "High", "severity": "2 - Major", "steps": "1. \\ud558\\uc774\\ub4dc", "description": "\\u0041\\t\\/"}',
+     {'steps': '1. 하이드', 'description': 'A\t/'}),
+    ('서로게이트 쌍 이스케이프',
+     '{"priority": "High", "severity": "2 - Major", "steps": "1. \\ud83d\\ude00 \\ud83d", "description": "설명"}',
+     {'steps': '1. \U0001F600 \ud83d', 'description': '설명'}),
+    ('잘린 응답',
+     '{"priority": "High", "severity": "2 - Major", "steps": "1. 접속", "description": "*Observed:*\\n* 설명이 중간에',
+     {'steps': '1. 접속', 'description': '*Observed:*\n* 설명이 중간에'}),
+    ('중복 키는 첫 값 사용',
+     '{"priority": "High", "severity": "2 - Major", "steps": "1. 접속", "description": "설명", "priority": "Low"}',
+     {'steps': '1. 접속', 'description': '설명'}),
+    ('따옴표 없는 값', '{"priority": High, "severity": "2 - Major", "steps": "1. 접속", "description": "설명"}',
+     {'steps': '1. 접속', 'description': '설명'}),
+]
+
+# 필드가 부족해서 실패해야 하는 응답
+UNRECOVERABLE_CORPUS = [
+    '',
+    '죄송합니다. 버그 리포트를 작성할 수 없습니다.',
+    '{"priority": "High", "severity": "2 - Major"}',
+    '{"priority": "High", "severity": "2 - Major", "steps": "1. 접속"}',
+]
+
+
+def _expected(override):
+    return {**VALID, **(override or {})}
+
+
+def test_malformed_corpus():
+    """깨진 응답 코퍼스에서 필드 복구"""
+    print("\n=== 깨진 응답 코퍼스 ===")
+    for name, text, override in MALFORMED_CORPUS:
+        result = parse_response_fields(text)
+        print(f"{name}: {'성공' if result else '실패'}")
+        assert result == _expected(override), f"{name}: {result}"
+
+
+def test_unrecoverable_corpus():
+    """필수 필드가 없는 응답은 None"""
+    for text in UNRECOVERABLE_CORPUS:
+        assert parse_response_fields(text) is None
+
+
+def test_streaming_chunks_fuzz():
+    """임의 위치에서 청크를 나눠도 한 번에 파싱한 결과와 같아야 함"""
+    rng = random.Random(1234)
+    for name, text, override in MALFORMED_CORPUS:
+        expected = parse_response_fields(text)
+        for _ in range(30):
+            scanner = ResponseFieldScanner()
+            i = 0
+            while i < len(text):
+                step = rng.randint(1, 12)
+                scanner.feed(text[i:i + step])
+                i += step
+            assert scanner.close() == expected, name
+
+
+def test_streaming_early_complete():
+    """필수 필드가 모두 나오면 나머지 출력 전에 complete"""
+    text = json.dumps(VALID, ensure_ascii=False) + '\n\n추가 설명: ' + '가' * 1000
+    scanner = ResponseFieldScanner()
+    assert scanner.feed(text[:len(json.dumps(VALID, ensure_ascii=False))])
+    assert scanner.result() == VALID
+
+
+def test_random_garbage_fuzz():
+    """임의 문자열에서도 예외 없이 종료"""
+    rng = random.Random(42)
+    alphabet = '{}[]":,\\\n\t unlrtabf가나0123456789priorityseverity'
+    for _ in range(500):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+        parse_response_fields(text)
+
+
+def _legacy_parse(text):
+    """비교용: 기존 다단계 방식 (코드 블록 분리 → json.loads → 이스케이프 정리 → 정규식 4회)"""
+    json_text = text
+    if '```json' in json_text:
+        json_text = json_text.split('```json')[1].split('```')[0]
+    elif '```' in json_text:
+        json_text = json_text.split('```')[1].split('```')[0]
+    json_text = json_text.strip()
+    try:
+        data = json.loads(json_text, strict=False)
+    except json.JSONDecodeError:
+        cleaned = json_text.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+        cleaned = re.sub(r'\\n(?=\s*["}])', '\n', cleaned)
+        cleaned = re.sub(r'(?<=[{,])\s*\\n\s*', '\n', cleaned)
+        try:
+            data = json.loads(cleaned, strict=False)
+        except json.JSONDecodeError:
+            data = {}
+    if isinstance(data, dict) and all(k in data for k in ('priority', 'severity', 'steps', 'description')):
+        return data
+
+    result = {}
+    for field in ('priority', 'severity'):
+        match = re.search(rf'"{field}"\s*:\s*"([^"]+)"', text, re.IGNORECASE)
+        if match:
+            result[field] = match.group(1)
+    for field in ('steps', 'description'):
+        match = re.search(rf'"{field}"\s*:\s*"((?:[^"\\]|\\.)*)"', text, re.IGNORECASE | re.DOTALL)
+        if match:
+            result[field] = match.group(1)
+    return result if len(result) == 4 else None
+
+
+def test_linear_scaling():
+    """입력 길이에 선형으로 비례 (긴 description)"""
+    def run(size):
+        text = json.dumps(dict(VALID, description='설명 ' * size), ensure_ascii=False).replace('\\n', '\n')
+        start = time.perf_counter()
+        assert parse_response_fields(text) is not None
+        return time.perf_counter() - start
+
+    run(1000)  # 워밍업
+    small = min(run(2000) for _ in range(3))
+    large = min(run(20000) for _ in range(3))
+    print(f"\n2천 단어: {small * 1000:.2f}ms, 2만 단어: {large * 1000:.2f}ms")
+    assert large < small * 40
+
+
+def benchmark():
+    """기존 다단계 방식과 복구율/처리 시간 비교"""
+    print("\n=== 벤치마크 ===")
+    corpus = [text for _, text, _ in MALFORMED_CORPUS]
+    for label, func in (('단일 패스 스캐너', parse_response_fields), ('기존 다단계 파싱', _legacy_parse)):
+        recovered = sum(1 for text in corpus if func(text))
+        start = time.perf_counter()
+        for _ in range(200):
+            for text in corpus:
+                func(text)
+        elapsed = time.perf_counter() - start
+        print(f"{label}: 복구 {recovered}/{len(corpus)}건, {len(corpus) * 200}회 {elapsed * 1000:.1f}ms")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_malformed_corpus()
+    test_unrecoverable_corpus()
+    test_streaming_chunks_fuzz()
+    test_streaming_early_complete()
+    test_random_garbage_fuzz()
+    test_linear_scaling()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
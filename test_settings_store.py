@@ -0,0 +1,82 @@
+"""
+설정 저장소 테스트 스크립트
+원자적 저장과 지연(묶음) 저장이 동작하는지 확인합니다.
+
+사용법:
+    python test_settings_store.py
+"""
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+from utils import FileManager, SettingsStore
+
+
+def test_atomic_save_keeps_old_file():
+    """쓰는 도중 실패해도 기존 파일이 그대로 남는지"""
+    print("\n=== 원자적 저장 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'settings.json')
+        FileManager.save_json({'priority': 'High'}, path)
+
+        in_progress = []
+
+        def interrupted_dump(data, file, **kwargs):
+            in_progress.extend(os.listdir(temp_dir))
+            raise RuntimeError('중간 종료')
+
+        with mock.patch('utils.json.dump', side_effect=interrupted_dump):
+            try:
+                FileManager.save_json({'priority': 'Low'}, path)
+            except RuntimeError:
+                pass
+        assert FileManager.load_json(path) == {'priority': 'High'}
+        # 쓰는 중인 임시 파일은 .json이 아니므로 preset 스캔에 잡히지 않음
+        assert len(in_progress) == 2 and [name for name in in_progress if name.endswith('.json')] == ['settings.json']
+        # 임시 파일이 남지 않음
+        assert os.listdir(temp_dir) == ['settings.json']
+        print("✓ 실패 시 기존 파일 유지")
+
+
+def test_debounced_writes():
+    """연속 변경이 한 번의 기록으로 묶이는지"""
+    print("\n=== 지연 저장 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'settings.json')
+        store = SettingsStore(path, delay=0.05)
+        assert store.get() is None
+
+        with mock.patch('utils.FileManager.save_json', wraps=FileManager.save_json) as save_json:
+            for i in range(20):
+                store.set({'steps': f'단계 {i}'})
+            assert not os.path.exists(path)
+            assert store.get() == {'steps': '단계 19'}
+
+            time.sleep(0.3)
+            assert save_json.call_count == 1
+            with open(path, encoding='utf-8') as f:
+                assert json.load(f) == {'steps': '단계 19'}
+
+            # 같은 내용은 다시 쓰지 않음
+            store.set({'steps': '단계 19'})
+            assert not store.flush()
+
+            # 종료 시 flush로 즉시 기록
+            store.set({'steps': '마지막'})
+            assert store.flush()
+            assert save_json.call_count == 2
+        assert SettingsStore(path).get() == {'steps': '마지막'}
+        print("✓ 20번 변경 -> 1번 기록")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_atomic_save_keeps_old_file()
+    test_debounced_writes()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+시작 시간 import 테스트 스크립트
+python -X importtime 으로 모듈을 import 해서, 창을 띄우기 전에
+자동화/AI 의존성(selenium, requests, ollama 등)이 로드되지 않는지 확인합니다.
+
+사용법:
+    python test_startup_imports.py
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 처음 사용할 때까지 import 하면 안 되는 모듈
+DEFERRED_MODULES = (
+    'jira_automation', 'selenium', 'requests', 'chromedriver_autoinstaller',
+    'ai_assistant', 'ollama', 'openpyxl', 'sqlite3',
+)
+
+
+def import_times(module: str):
+    """-X importtime 결과 파싱 -> {모듈명: 누적 import 시간(us)}"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, cwd=ROOT)
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time:  self [us] | cumulative | imported package
+        parts = line[len('import time:'):].split('|')
+        if not line.startswith('import time:') or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # 헤더 줄
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def _has_module(module: str) -> bool:
+    result = subprocess.run([sys.executable, '-c', f'import {module}'], capture_output=True, cwd=ROOT)
+    return result.returncode == 0
+
+
+def _assert_deferred(module: str):
+    times = import_times(module)
+    loaded = sorted(name for name in times if name.split('.')[0] in DEFERRED_MODULES)
+    assert not loaded, f"{module} import 시 로드됨: {loaded}"
+    return times
+
+
+def test_core_modules_defer_heavy_imports():
+    """설정/유틸/CLI 모듈은 자동화/AI 의존성을 로드하지 않음"""
+    print("\n=== 핵심 모듈 import ===")
+    for module in ('config', 'utils', 'batch_rows', 'batch_cli'):
+        _assert_deferred(module)
+        print(f"✓ {module}")
+
+
+def test_gui_modules_defer_heavy_imports():
+    """GUI 모듈 import 시점(창 표시 전)에는 자동화/AI 의존성을 로드하지 않음"""
+    if not _has_module('PyQt5.QtWidgets'):
+        import pytest  # 스크립트 실행(main)에서는 호출 전에 확인하므로 pytest 실행 때만 도달
+        pytest.skip("PyQt5가 없어 건너뜀")
+    print("\n=== GUI 모듈 import ===")
+    for module in ('gui_widgets', 'main_application'):
+        _assert_deferred(module)
+        print(f"✓ {module}")
+
+
+def test_config_does_not_probe_chrome():
+    """config import 시 Chrome 경로를 찾지 않고, 처음 사용할 때 한 번만 찾음"""
+    print("\n=== Chrome 경로 지연 탐색 ===")
+    code = (
+        "import os, config\n"
+        "calls = []\n"
+        "exists = os.path.exists\n"
+        "os.path.exists = lambda p: calls.append(p) or exists(p)\n"
+        "print(config.get_chrome_executable_path.cache_info().misses)\n"
+        "path = config.CHROME_EXECUTABLE_PATH\n"
+        "assert path == config.get_chrome_executable_path()\n"
+        "print(config.get_chrome_executable_path.cache_info().misses, bool(calls))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=ROOT)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['0', '1', 'True'], result.stdout
+    print("✓ 처음 사용할 때 1회 탐색")
+
+
+def benchmark():
+    """모듈별 누적 import 시간"""
+    print("\n=== 벤치마크 (-X importtime) ===")
+    modules = ['config', 'utils', 'batch_cli']
+    if _has_module('PyQt5.QtWidgets'):
+        modules += ['gui_widgets', 'main_application']
+    for module in modules:
+        times = import_times(module)
+        print(f"{module}: {times.get(module, 0) / 1000:.1f}ms")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_core_modules_defer_heavy_imports()
+    if _has_module('PyQt5.QtWidgets'):
+        test_gui_modules_defer_heavy_imports()
+    else:
+        print("\nPyQt5가 없어 GUI 모듈 import 확인 건너뜀")
+    test_config_does_not_probe_chrome()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+텍스트 대체 규칙 엔진 테스트 스크립트
+한 번에 치환하는 결과가 규칙 순서와 무관하게 최장 일치인지, 규칙 팩을 읽는지 확인합니다.
+
+사용법:
+    python test_text_rules.py
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from config import TEXT_REPLACEMENT_RULES
+from text_rules import TextReplacer, DEFAULT_REPLACER, load_rule_packs
+from utils import TextProcessor
+
+
+def _sequential(text, rules=TEXT_REPLACEMENT_RULES):
+    """기존 규칙별 str.replace 방식 (비교용)"""
+    for old, new in rules:
+        text = text.replace(old, new)
+    return text
+
+
+def test_longest_match_first():
+    """규칙 순서와 무관하게 가장 긴 규칙이 적용되는지"""
+    print("\n=== 최장 일치 ===")
+    # 기존 방식은 '하는 현상'이 먼저 적용되어 '되지 않는 현상' 규칙이 동작하지 않았음
+    assert TextProcessor.apply_text_replacements('아이템이 표시되지 않는 현상') == '아이템이 표시되어야 합니다.'
+    assert TextProcessor.apply_text_replacements('UI가 가리는 현상') == 'UI가 가리지 않아야 합니다.'
+    assert TextProcessor.apply_text_replacements('일부 유저\n로그인 불가한 현상') == '모든 유저로그인 가능해야 합니다.'
+
+    # 순서를 뒤집어도 결과가 같음
+    reversed_replacer = TextReplacer(reversed(TEXT_REPLACEMENT_RULES))
+    for text in ['버튼이 눌리지 않는 현상', '창이 열리는 현상', '문이 닫혀진 현상', '크래쉬 발생']:
+        assert reversed_replacer.apply(text) == DEFAULT_REPLACER.apply(text), text
+
+    # 겹치지 않는 규칙만 있을 때는 기존 방식과 같음
+    for text in ['크래쉬 발생', '일부 구역에서 소리가 없는 현상', '아이콘이 다른 현상']:
+        assert DEFAULT_REPLACER.apply(text) == _sequential(text), text
+    print("✓ 긴 규칙 우선, 순서 무관")
+
+
+def test_rule_packs():
+    """규칙 팩 읽기와 덮어쓰기"""
+    print("\n=== 규칙 팩 ===")
+    with tempfile.TemporaryDirectory() as pack_dir:
+        with open(os.path.join(pack_dir, '01_team.json'), 'w', encoding='utf-8') as f:
+            json.dump({'튕김': '튕기지 않아야 합니다.', '일부': '전체'}, f, ensure_ascii=False)
+        with open(os.path.join(pack_dir, '02_pairs.json'), 'w', encoding='utf-8') as f:
+            json.dump([['멈춤', '멈추지 않아야 합니다.']], f, ensure_ascii=False)
+        with open(os.path.join(pack_dir, '03_broken.json'), 'w', encoding='utf-8') as f:
+            f.write('[1, 2, 3]')
+
+        rules = load_rule_packs(pack_dir)
+        replacer = DEFAULT_REPLACER.with_rules(rules)
+        assert replacer.apply('일부 맵에서 튕김') == '전체 맵에서 튕기지 않아야 합니다.'
+        assert replacer.apply('화면 멈춤') == '화면 멈추지 않아야 합니다.'
+        assert len(replacer) == len(DEFAULT_REPLACER) + 2
+    assert load_rule_packs(os.path.join(tempfile.gettempdir(), '없는_폴더')) == []
+    assert TextReplacer([]).apply('그대로') == '그대로'
+    print("✓ 팩 추가/덮어쓰기, 잘못된 팩 무시")
+
+
+def benchmark(count=5000):
+    """엑셀 일괄 생성 규모에서 기존 방식과 비교"""
+    print(f"\n=== 벤치마크 ({count}행) ===")
+    rng = random.Random(0)
+    endings = [old for old, _ in TEXT_REPLACEMENT_RULES if old != '\n'] + ['확인 필요']
+    texts = [f"[{rng.choice(['UI', '로비', '상점'])}] 아이템 {i}번 " + ' '.join(rng.choice(endings) for _ in range(2))
+             for i in range(count)]
+
+    start = time.perf_counter()
+    for text in texts:
+        _sequential(text)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    DEFAULT_REPLACER.apply_many(texts)
+    single = time.perf_counter() - start
+    print(f"규칙별 replace: {legacy * 1000:.1f}ms, 한 번에 치환: {single * 1000:.1f}ms")
+
+
+def main():
+    """메인 테스트 함수"""
+    test_longest_match_first()
+    test_rule_packs()
+    benchmark()
+    print("\n테스트 완료!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+"""
+텍스트 유사도 인덱스 모듈
+- ExampleIndex: 문자 n-gram TF-IDF로 preset summary 간 유사도를 계산하여
+  AI 프롬프트에 넣을 few-shot 예시를 고릅니다.
+- TrigramIndex: preset 파일명/요약에 대한 3-gram 역색인 (프리셋 검색창)
+- OptionIndex: 콤보 필드 옵션의 접두어/부분 문자열 자동완성
+"""
+import json
+import math
+import os
+import heapq
+from bisect import bisect_left
+import logging
+import threading
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Callable
+
+from preset_catalog import NON_PRESET_FILES
+from preset_delta import get_materializer
+
+logger = logging.getLogger(__name__)
+
+# 예시로 사용할 preset 필드
+EXAMPLE_FIELDS = ('summary', 'priority', 'severity', 'steps', 'description')
+
+
+def normalize_text(text: str) -> str:
+    """비교용 텍스트 정리 (소문자, 연속 공백 제거)"""
+    return ' '.join(str(text).lower().split())
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = (2, 3)) -> Counter:
+    """
+    문자 n-gram 빈도를 계산
+
+    한글은 형태소 분석 없이도 문자 2~3-gram이 충분한 유사도 신호가 됩니다.
+
+    Args:
+        text: 입력 텍스트
+        ngram_range: (최소 n, 최대 n)
+
+    Returns:
+        n-gram -> 빈도
+    """
+    text = normalize_text(text)
+    grams = Counter()
+    min_n, max_n = ngram_range
+    for n in range(min_n, max_n + 1):
+        for i in range(len(text) - n + 1):
+            gram = text[i:i + n]
+            if not gram.isspace():
+                grams[gram] += 1
+    return grams
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 대략 추정 (한글/영문 혼합 기준 2문자 ≈ 1토큰)"""
+    return (len(text) + 1) // 2
+
+
+def _load_preset_file(preset_dir: str, filename: str) -> Optional[Dict[str, Any]]:
+    """preset을 델타 복원 포함하여 조용히 로드 (인덱싱 중 로그 폭주 방지)"""
+    try:
+        data = get_materializer(preset_dir).load(filename)
+        return data if isinstance(data, dict) else None
+    except Exception as e:
+        logger.debug(f"preset 인덱싱 로드 실패 ({filename}): {e}")
+        return None
+
+
+class ExampleIndex:
+    """preset summary에 대한 증분 TF-IDF 검색 인덱스"""
+
+    def __init__(self, preset_dir: Optional[str] = None,
+                 loader: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+                 ngram_range: Tuple[int, int] = (2, 3)):
+        """
+        Args:
+            preset_dir: preset 디렉토리 (refresh 시 스캔 대상)
+            loader: key(파일명) -> preset 데이터 로더 (기본: preset_dir의 파일을 델타 복원하여 로드)
+            ngram_range: 사용할 문자 n-gram 범위
+        """
+        self.preset_dir = preset_dir
+        self.loader = loader or (lambda key: _load_preset_file(self.preset_dir, key))
+        self.ngram_range = ngram_range
+
+        self._stamps: Dict[str, float] = {}  # key -> 인덱싱 당시 변경 시각
+        self._examples: Dict[str, Dict[str, str]] = {}  # key -> 예시 데이터
+        self._doc_grams: Dict[str, Counter] = {}  # key -> n-gram 빈도
+        self._postings: Dict[str, Dict[str, int]] = {}  # n-gram -> {key: 빈도}
+        self._norms: Dict[str, float] = {}  # key -> TF-IDF 벡터 크기 (캐시)
+        self._norms_dirty = True
+        # AI 준비(warm-up) 스레드와 생성 스레드가 동시에 refresh/검색할 수 있음
+        # (refresh가 update/remove를 부르므로 재진입 가능한 RLock)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._examples)
+
+    def examples(self) -> List[Dict[str, str]]:
+        """인덱싱된 예시 목록"""
+        with self._lock:
+            return list(self._examples.values())
+
+    def refresh(self, entries: Optional[Iterable[Tuple[str, float]]] = None,
+                loader: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None) -> int:
+        """
+        변경된 preset만 다시 인덱싱
+
+        Args:
+            entries: (key, 변경 시각) 목록. None이면 preset_dir를 os.scandir로 스캔
+            loader: 이번 갱신부터 사용할 로더 (None이면 기존 로더)
+
+        Returns:
+            추가/갱신/삭제된 문서 수
+        """
+        with self._lock:
+            if loader is not None:
+                self.loader = loader
+            return self._refresh_locked(entries)
+
+    def _refresh_locked(self, entries: Optional[Iterable[Tuple[str, float]]]) -> int:
+        if entries is None:
+            entries = self._scan_directory()
+
+        current = dict(entries)
+        changed = 0
+
+        for key in [k for k in self._stamps if k not in current]:
+            self._remove_locked(key)
+            changed += 1
+
+        for key, stamp in current.items():
+            if self._stamps.get(key) == stamp:
+                continue
+            data = self.loader(key)
+            self._update_locked(key, data or {}, stamp)
+            changed += 1
+
+        if changed:
+            logger.debug(f"예시 인덱스 갱신: {changed}개 변경, 총 {len(self._examples)}개")
+        return changed
+
+    def _scan_directory(self) -> List[Tuple[str, float]]:
+        """preset 디렉토리의 (파일명, 수정 시각) 목록"""
+        if not self.preset_dir or not os.path.isdir(self.preset_dir):
+            return []
+
+        entries = []
+        try:
+            with os.scandir(self.preset_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.name not in NON_PRESET_FILES and entry.is_file():
+                        entries.append((entry.name, entry.stat().st_mtime))
+        except OSError as e:
+            logger.error(f"preset 디렉토리 스캔 실패: {e}")
+        return entries
+
+    def update(self, key: str, data: Dict[str, Any], stamp: float = 0.0):
+        """preset 하나를 인덱스에 추가하거나 갱신"""
+        with self._lock:
+            self._update_locked(key, data, stamp)
+
+    def _update_locked(self, key: str, data: Dict[str, Any], stamp: float):
+        self._remove_locked(key)
+        self._stamps[key] = stamp
+
+        example = {field: str(data.get(field, '') or '') for field in EXAMPLE_FIELDS}
+        # summary와 본문(steps/description)이 있어야 예시로 쓸 수 있음
+        if not example['summary'].strip() or not (example['steps'].strip() or example['description'].strip()):
+            return
+
+        grams = char_ngrams(example['summary'], self.ngram_range)
+        if not grams:
+            return
+
+        self._examples[key] = example
+        self._doc_grams[key] = grams
+        for gram, tf in grams.items():
+            self._postings.setdefault(gram, {})[key] = tf
+        self._norms_dirty = True
+
+    def remove(self, key: str):
+        """인덱스에서 preset 제거"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key: str):
+        self._stamps.pop(key, None)
+        self._examples.pop(key, None)
+        grams = self._doc_grams.pop(key, None)
+        if not grams:
+            return
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del self._postings[gram]
+        self._norms_dirty = True
+
+    def _idf(self, gram: str) -> float:
+        """스무딩된 IDF"""
+        df = len(self._postings.get(gram, ()))
+        return math.log((len(self._doc_grams) + 1) / (df + 1)) + 1.0
+
+    def _ensure_norms(self):
+        """문서 벡터 크기 재계산 (인덱스가 바뀐 뒤 첫 검색에서 한 번만)"""
+        if not self._norms_dirty:
+            return
+        idf = {gram: self._idf(gram) for gram in self._postings}
+        self._norms = {
+            key: math.sqrt(sum((tf * idf[gram]) ** 2 for gram, tf in grams.items()))
+            for key, grams in self._doc_grams.items()
+        }
+        self._norms_dirty = False
+
+    def search(self, text: str, top_k: int = 2, min_score: float = 0.0) -> List[Tuple[float, str]]:
+        """
+        코사인 유사도가 높은 preset 검색
+
+        Args:
+            text: 검색할 텍스트 (버그 제목)
+            top_k: 반환할 최대 개수
+            min_score: 최소 유사도
+
+        Returns:
+            (유사도, key) 목록 (유사도 내림차순)
+        """
+        query = char_ngrams(text, self.ngram_range)
+        with self._lock:
+            return self._search_locked(query, top_k, min_score)
+
+    def _search_locked(self, query: Counter, top_k: int, min_score: float) -> List[Tuple[float, str]]:
+        if not query or not self._doc_grams:
+            return []
+
+        self._ensure_norms()
+
+        scores: Dict[str, float] = {}
+        query_norm = 0.0
+        for gram, qtf in query.items():
+            posting = self._postings.get(gram)
+            idf = self._idf(gram)
+            qw = qtf * idf
+            query_norm += qw * qw
+            if not posting:
+                continue
+            for key, tf in posting.items():
+                scores[key] = scores.get(key, 0.0) + qw * tf * idf
+
+        query_norm = math.sqrt(query_norm)
+        results = []
+        for key, dot in scores.items():
+            norm = self._norms.get(key)
+            if norm:
+                score = dot / (norm * query_norm)
+                if score >= min_score:
+                    results.append((score, key))
+
+        results.sort(key=lambda x: (-x[0], x[1]))
+        return results[:top_k] if top_k else results
+
+    def select_examples(self, summary: str, max_examples: int = 2, token_budget: int = 600,
+                        min_score: float = 0.1) -> List[Dict[str, str]]:
+        """
+        토큰 예산 안에서 가장 유사한 예시를 선택
+
+        동일 preset의 여러 버전은 summary가 같으므로 한 번만 사용합니다.
+        예산을 넘는 예시는 steps/description을 잘라서 맞추고, 그래도 넘으면 건너뜁니다.
+
+        Args:
+            summary: 버그 제목
+            max_examples: 최대 예시 개수
+            token_budget: 예시 전체에 허용할 토큰 수
+            min_score: 최소 유사도
+
+        Returns:
+            예시 딕셔너리 목록 (유사도 내림차순)
+        """
+        if max_examples <= 0 or token_budget <= 0:
+            return []
+
+        selected = []
+        seen_summaries = set()
+        remaining = token_budget
+
+        # 버전 중복을 건너뛸 수 있도록 넉넉히 검색 (검색 결과와 예시를 같은 인덱스 상태에서 읽음)
+        with self._lock:
+            results = self.search(summary, top_k=max_examples * 8, min_score=min_score)
+            candidates = [self._examples[key] for _, key in results]
+        for example in candidates:
+            normalized = normalize_text(example['summary'])
+            if normalized in seen_summaries:
+                continue
+
+            fitted = self._fit_to_budget(example, remaining)
+            if fitted is None:
+                continue
+
+            seen_summaries.add(normalized)
+            selected.append(fitted)
+            remaining -= estimate_tokens(format_example(fitted))
+            if len(selected) >= max_examples or remaining <= 0:
+                break
+
+        return selected
+
+    @staticmethod
+    def _fit_to_budget(example: Dict[str, str], budget: int) -> Optional[Dict[str, str]]:
+        """예시를 토큰 예산에 맞게 자름 (맞출 수 없으면 None)"""
+        if estimate_tokens(format_example(example)) <= budget:
+            return example
+
+        fixed = dict(example, steps='', description='')
+        room = budget - estimate_tokens(format_example(fixed))
+        if room <= 40:
+            return None
+
+        # 남은 예산을 steps 1 : description 2 비율로 배분 (문자 수 ≈ 토큰 × 2)
+        steps_chars = room * 2 // 3
+        desc_chars = room * 4 // 3
+        fitted = dict(example)
+        fitted['steps'] = example['steps'][:steps_chars]
+        fitted['description'] = example['description'][:desc_chars]
+        return fitted
+
+
+def format_example(example: Dict[str, str]) -> str:
+    """프롬프트에 넣을 예시 문자열"""
+    output = json.dumps({
+        'priority': example.get('priority', ''),
+        'severity': example.get('severity', ''),
+        'steps': example.get('steps', ''),
+        'description': example.get('description', '')
+    }, ensure_ascii=False)
+    return f"버그 제목: {example.get('summary', '')}\n{output}"
+
+
+def trigrams(text: str) -> set:
+    """검색용 문자 3-gram 집합 (앞뒤 공백을 붙여 짧은 단어와 단어 시작도 구분)"""
+    text = f" {normalize_text(text)} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    증분 갱신되는 문자 3-gram 역색인 (오타/부분 일치 검색용)
+
+    후보는 질의 3-gram의 posting 목록에서만 모으므로 문서 수가 수만 개여도
+    질의 길이와 일치 문서 수에 비례하는 시간만 듭니다.
+    """
+
+    def __init__(self):
+        self._texts: Dict[str, str] = {}  # key -> 정규화된 검색 대상 텍스트
+        self._grams: Dict[str, set] = {}  # key -> 3-gram 집합
+        self._postings: Dict[str, set] = {}  # 3-gram -> key 집합
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._texts
+
+    def add(self, key: str, text: str):
+        """문서 추가 또는 갱신"""
+        grams = trigrams(text)
+        with self._lock:
+            self._remove_locked(key)
+            self._texts[key] = normalize_text(text)
+            self._grams[key] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str):
+        """문서 제거"""
+        with self._lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key: str):
+        self._texts.pop(key, None)
+        for gram in self._grams.pop(key, ()):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 20, min_score: float = 0.5) -> List[Tuple[float, str]]:
+        """
+        질의와 비슷한 문서 검색
+
+        점수는 질의 3-gram 중 문서에 있는 비율이며, 질의가 그대로 포함된 문서는 1점을 더합니다.
+        2글자 이하 질의는 3-gram이 부족하므로 부분 문자열 일치로 찾습니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            min_score: 최소 3-gram 일치 비율
+
+        Returns:
+            (점수, key) 목록 (점수 내림차순)
+        """
+        normalized = normalize_text(query)
+        if not normalized:
+            return []
+
+        with self._lock:
+            if len(normalized) < 3:
+                results = [(1.0, key) for key, text in self._texts.items() if normalized in text]
+            else:
+                query_grams = trigrams(normalized)
+                # posting 목록을 이어 붙여 C 구현 Counter로 한 번에 집계
+                counts = Counter(chain.from_iterable(
+                    self._postings[gram] for gram in query_grams if gram in self._postings
+                ))
+
+                total = len(query_grams)
+                threshold = min_score * total
+                # 질의가 그대로 포함되려면 앞뒤 경계 3-gram을 뺀 나머지는 모두 있어야 함
+                exact_min = total - 2
+                texts = self._texts
+                results = []
+                for key, count in counts.items():
+                    if count >= threshold:
+                        score = count / total
+                        if count >= exact_min and normalized in texts[key]:
+                            score += 1.0
+                        results.append((score, key))
+
+        if limit and len(results) > limit:
+            results = heapq.nlargest(limit, results, key=itemgetter(0))
+        results.sort(key=lambda x: (-x[0], x[1]))
+        return results
+
+
+class OptionIndex:
+    """
+    순위가 매겨진 옵션 목록의 자동완성 인덱스 (대소문자 무시)
+
+    접두어 일치는 정렬된 목록에서 이분 탐색으로, 부분 문자열 일치는 3-gram posting
+    교집합으로 후보를 좁힌 뒤 확인합니다. 결과는 접두어 일치 먼저, 각각 순위 순서입니다.
+    목록이 바뀌면 새로 만듭니다 (옵션 수백 개 기준 1ms 이하).
+    """
+
+    def __init__(self, options: Iterable[str]):
+        self._options = list(options)
+        self._lowered = [option.lower() for option in self._options]
+        self._sorted = sorted((text, rank) for rank, text in enumerate(self._lowered))
+        self._sorted_keys = [text for text, _ in self._sorted]
+        self._postings: Dict[str, List[int]] = {}  # 3-gram -> 순위 목록 (오름차순)
+        for rank, text in enumerate(self._lowered):
+            for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                self._postings.setdefault(gram, []).append(rank)
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def options(self) -> List[str]:
+        """전체 옵션 (순위 순)"""
+        return list(self._options)
+
+    def _substring_candidates(self, query: str) -> Iterable[int]:
+        if len(query) < 3:
+            return range(len(self._options))
+        postings = []
+        for gram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(candidates)
+
+    def complete(self, query: str, limit: int = 20) -> List[str]:
+        """
+        검색어로 시작하는 옵션, 그 다음 검색어를 포함하는 옵션
+
+        Args:
+            query: 입력 중인 텍스트 (비어 있으면 상위 순위 옵션)
+            limit: 최대 결과 수
+
+        Returns:
+            옵션 목록
+        """
+        query = query.strip().lower()
+        if not query:
+            return self._options[:limit]
+
+        lo = bisect_left(self._sorted_keys, query)
+        hi = bisect_left(self._sorted_keys, query + '\uffff')
+        ranks = sorted(rank for _, rank in self._sorted[lo:hi])[:limit]
+
+        if len(ranks) < limit:
+            seen = set(ranks)
+            for rank in self._substring_candidates(query):
+                if rank not in seen and query in self._lowered[rank]:
+                    ranks.append(rank)
+                    if len(ranks) >= limit:
+                        break
+        return [self._options[rank] for rank in ranks]
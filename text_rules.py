@@ -0,0 +1,121 @@
+"""
+텍스트 대체 규칙 엔진
+TEXT_REPLACEMENT_RULES(+ 사용자 규칙 팩)를 하나의 정규식 alternation으로 컴파일해
+텍스트를 한 번만 훑으며 치환합니다.
+
+- 같은 위치에서는 가장 긴 규칙이 먼저 일치 ('되지 않는 현상'이 '하는 현상'보다 우선 등
+  규칙 순서에 따라 결과가 달라지지 않음)
+- 치환 결과는 다시 치환하지 않음 (규칙끼리 연쇄 적용되지 않음)
+
+규칙 팩 파일 (TEXT_RULE_PACK_DIR/*.json):
+    {"원문": "대체문", ...} 또는 [["원문", "대체문"], ...]
+뒤에 읽은 팩의 같은 원문 규칙이 앞의 것을 덮어씁니다 (기본 규칙 < 팩, 팩은 파일명 순).
+"""
+import json
+import os
+import re
+import threading
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import TEXT_REPLACEMENT_RULES, TEXT_RULE_PACK_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class TextReplacer:
+    """컴파일된 다중 패턴 치환기 (불변, 여러 스레드에서 공유 가능)"""
+
+    def __init__(self, rules: Iterable[Tuple[str, str]]):
+        self.rules: Dict[str, str] = {}
+        for old, new in rules:
+            if old:
+                self.rules[old] = new
+        # 길이 내림차순 alternation: re는 같은 위치에서 앞쪽 대안을 먼저 시도하므로 최장 일치가 됨
+        keys = sorted(self.rules, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, keys))) if keys else None
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def _replace(self, match: 're.Match') -> str:
+        return self.rules[match.group()]
+
+    def apply(self, text: str) -> str:
+        """텍스트에 대체 규칙을 한 번에 적용"""
+        if self._pattern is None or not text:
+            return text
+        return self._pattern.sub(self._replace, text)
+
+    def apply_many(self, texts: Iterable[str]) -> List[str]:
+        """여러 텍스트에 적용 (엑셀 일괄 생성 등)"""
+        if self._pattern is None:
+            return list(texts)
+        sub, replace = self._pattern.sub, self._replace
+        return [sub(replace, text) if text else text for text in texts]
+
+    def with_rules(self, rules: Iterable[Tuple[str, str]]) -> 'TextReplacer':
+        """규칙을 덧붙인(같은 원문은 덮어쓴) 새 치환기"""
+        return TextReplacer(list(self.rules.items()) + list(rules))
+
+
+def load_rule_pack(path: str) -> List[Tuple[str, str]]:
+    """
+    규칙 팩 파일 읽기
+
+    Raises:
+        OSError / ValueError: 파일을 읽을 수 없거나 형식이 잘못된 경우
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        pairs = list(data.items())
+    elif isinstance(data, list) and all(isinstance(item, (list, tuple)) and len(item) == 2 for item in data):
+        pairs = [tuple(item) for item in data]
+    else:
+        raise ValueError(f"규칙 팩 형식이 잘못되었습니다: {path}")
+    return [(str(old), str(new)) for old, new in pairs]
+
+
+def load_rule_packs(pack_dir: str = TEXT_RULE_PACK_DIR) -> List[Tuple[str, str]]:
+    """폴더의 규칙 팩들을 파일명 순으로 읽음 (잘못된 파일은 경고 후 건너뜀)"""
+    if not pack_dir or not os.path.isdir(pack_dir):
+        return []
+    rules = []
+    for name in sorted(os.listdir(pack_dir)):
+        if not name.endswith('.json'):
+            continue
+        try:
+            pack = load_rule_pack(os.path.join(pack_dir, name))
+        except (OSError, ValueError) as e:
+            logger.warning(f"규칙 팩 '{name}' 로드 실패: {e}")
+            continue
+        rules.extend(pack)
+        logger.info(f"규칙 팩 '{name}' 로드: {len(pack)}개")
+    return rules
+
+
+# 기본 규칙은 import 시 한 번만 컴파일
+DEFAULT_REPLACER = TextReplacer(TEXT_REPLACEMENT_RULES)
+
+_replacer: Optional[TextReplacer] = None
+_replacer_lock = threading.Lock()
+
+
+def get_text_replacer() -> TextReplacer:
+    """기본 규칙 + 규칙 팩 치환기 (처음 호출할 때 팩을 읽고 이후 재사용)"""
+    global _replacer
+    if _replacer is None:
+        with _replacer_lock:
+            if _replacer is None:
+                packs = load_rule_packs()
+                _replacer = DEFAULT_REPLACER.with_rules(packs) if packs else DEFAULT_REPLACER
+    return _replacer
+
+
+def reload_rule_packs() -> TextReplacer:
+    """규칙 팩을 다시 읽어 치환기 교체"""
+    global _replacer
+    with _replacer_lock:
+        _replacer = None
+    return get_text_replacer()
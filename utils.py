@@ -3,11 +3,26 @@
 """
 import os
 import json
+import heapq
+import time
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Set
 import logging
+from collections import OrderedDict
 
-from config import TEXT_REPLACEMENT_RULES
+from config import (
+    OPTIONS_MAX_COUNT, OPTIONS_RECENCY_HALF_LIFE_DAYS, OPTIONS_PRUNE_RULES
+)
+from preset_catalog import PresetCatalog, parse_preset_filename
+from preset_store import get_preset_db_store
+from preset_delta import get_materializer
+from text_index import TrigramIndex, OptionIndex
+from text_rules import get_text_replacer
+from description_templates import get_template_library
+from log_pipeline import setup_logging as setup_async_logging
 
 logger = logging.getLogger(__name__)
 
@@ -58,14 +73,30 @@ class FileManager:
     
     @staticmethod
     def save_json(data: Dict[str, Any], filename: str) -> None:
-        """JSON 데이터를 파일에 저장"""
+        """
+        JSON 데이터를 파일에 저장
+        
+        같은 폴더의 임시 파일에 쓴 뒤 os.replace로 교체하므로
+        쓰는 도중 종료되어도 기존 파일이 깨지지 않습니다.
+        임시 파일은 .json으로 끝나지 않아 preset 스캔/파일 감시가 프리셋으로 보지 않습니다.
+        """
+        tmp_path = None
         try:
-            with open(filename, 'w', encoding='utf-8') as file:
+            directory = os.path.dirname(os.path.abspath(filename))
+            fd, tmp_path = tempfile.mkstemp(prefix='.tmp_', suffix='.json.tmp', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
                 json.dump(data, file, indent=4, ensure_ascii=False)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, filename)
+            tmp_path = None
             logger.info(f"JSON 파일 '{filename}' 저장 완료")
         except Exception as e:
             logger.error(f"JSON 파일 '{filename}' 저장 실패: {e}")
             raise
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
     @staticmethod
     def load_json(filename: str) -> Optional[Dict[str, Any]]:
@@ -123,120 +154,326 @@ class FileManager:
             return None, None
 
 
-class TextProcessor:
-    """텍스트 처리 관련 유틸리티 클래스"""
+class SettingsStore:
+    """
+    JSON 설정 파일 하나를 메모리에 두고 변경을 모아서 저장하는 저장소
     
-    @staticmethod
-    def apply_text_replacements(text: str) -> str:
-        """텍스트에 대체 규칙을 적용"""
-        result_text = text
-        for old, new in TEXT_REPLACEMENT_RULES:
-            result_text = result_text.replace(old, new)
-        return result_text
+    set()은 메모리만 바꾸고, 마지막 변경 후 delay초 동안 추가 변경이 없으면
+    백그라운드 타이머에서 한 번만 원자적으로 기록합니다.
+    """
     
-    @staticmethod
-    def generate_description_template(main_text: str, option: str, build_text: str = "") -> str:
-        """설명 템플릿을 생성"""
-        expected_text = TextProcessor.apply_text_replacements(main_text)
-        
-        templates = {
-            "클라크래쉬": f"""**Observed:**
-* {main_text}을 확인합니다.
-
-**Sentry:**
-* 링크를 첨부 중입니다.
-
-**Expected (기대 결과):**
-* {expected_text}
-
-**Callstack:**
-```
+    def __init__(self, filename: str, delay: float = 0.5):
+        self.filename = filename
+        self.delay = delay
+        self._data: Any = None
+        self._loaded = False
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+    
+    def get(self) -> Any:
+        """설정 반환 (최초 1회만 디스크에서 읽음, 파일이 없으면 None)"""
+        with self._lock:
+            if not self._loaded:
+                self._data = FileManager.load_json(self.filename)
+                self._loaded = True
+            return json.loads(json.dumps(self._data)) if self._data is not None else None
+    
+    def set(self, data: Any):
+        """설정 변경 후 지연 저장 예약 (내용이 같으면 아무것도 하지 않음)"""
+        with self._lock:
+            if self._loaded and data == self._data:
+                return
+            self._data = json.loads(json.dumps(data))
+            self._loaded = True
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self) -> bool:
+        """예약된 저장을 즉시 수행 (종료 시 호출)"""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return False
+                data = self._data
+                self._dirty = False
+            try:
+                FileManager.save_json(data, self.filename)
+            except Exception:
+                with self._lock:
+                    self._dirty = True
+                return False
+            return True
 
-""",
-            "서버크래쉬": f"""**Observed(관찰 결과):**
-* {main_text}을 확인합니다.
 
-**Video(영상):**
-* 영상을 첨부 중입니다.
+_settings_stores: Dict[str, SettingsStore] = {}
+_settings_stores_lock = threading.Lock()
 
-**Expected (기대 결과):**
-* {expected_text}
 
-**Note(참고):**
-* 작성 중입니다.""",
-            
-            "빌드실패": f"""**Observed(관찰 결과):**
-* {main_text}을 확인합니다.
+def get_settings_store(filename: str) -> SettingsStore:
+    """설정 파일별 공유 SettingsStore"""
+    key = os.path.abspath(filename)
+    with _settings_stores_lock:
+        store = _settings_stores.get(key)
+        if store is None:
+            store = SettingsStore(filename)
+            _settings_stores[key] = store
+        return store
 
-**Video(영상):**
-* 영상을 첨부 중입니다.
 
-**Expected (기대 결과):**
-* {expected_text}
+def flush_settings_stores():
+    """모든 설정 저장소의 대기 중인 변경을 기록"""
+    with _settings_stores_lock:
+        stores = list(_settings_stores.values())
+    for store in stores:
+        store.flush()
 
-**Note(참고):**
-* 작성 중입니다."""
-        }
-        
-        # 기본 템플릿
-        default_template = f"""**Observed(관찰 결과):**
-* {main_text}을 확인합니다.
 
-**Video(영상):**
-* 영상을 첨부 중입니다.
+class TextProcessor:
+    """텍스트 처리 관련 유틸리티 클래스"""
+    
+    @staticmethod
+    def apply_text_replacements(text: str) -> str:
+        """텍스트에 대체 규칙을 적용 (컴파일된 정규식으로 한 번에, 같은 위치에서는 긴 규칙 우선)"""
+        return get_text_replacer().apply(text)
+    
+    @staticmethod
+    def generate_description_template(main_text: str, option: str, build_text: str = "") -> str:
+        """설명 템플릿을 생성 (templates 폴더의 '{option}.md', 없으면 기본값 템플릿)"""
+        return get_template_library().render(
+            option,
+            main_text=main_text,
+            expected_text=TextProcessor.apply_text_replacements(main_text),
+            build_text=build_text,
+        )
+    
+    @staticmethod
+    def generate_descriptions(main_texts: List[str], option: str, build_text: str = "") -> List[str]:
+        """여러 요약에 대한 설명을 한 번에 생성 (엑셀 일괄 실행 등)"""
+        expected_texts = get_text_replacer().apply_many(main_texts)
+        return get_template_library().render_many(option, (
+            {'main_text': main_text, 'expected_text': expected_text, 'build_text': build_text}
+            for main_text, expected_text in zip(main_texts, expected_texts)
+        ))
 
-**Expected (기대 결과):**
-* {expected_text}
 
-**Note(참고):**
-* 작성 중입니다."""
-        
-        return templates.get(option, default_template)
+def option_score(count: float, last_used: float, now: float,
+                 half_life_days: float = OPTIONS_RECENCY_HALF_LIFE_DAYS) -> float:
+    """옵션 순위 점수: 사용 횟수에 마지막 사용 이후 경과 시간만큼 반감 가중치를 곱함"""
+    age_days = max(0.0, now - last_used) / 86400
+    return count * 0.5 ** (age_days / half_life_days)
 
 
 class OptionsManager:
-    """필드 옵션 관리 클래스"""
+    """
+    필드 옵션 관리 클래스
+    
+    필드별 옵션을 순서 있는 딕셔너리(앞쪽이 최근 사용, 값은 [사용 횟수, 마지막 사용 시각])로
+    메모리에 두고 추가/삭제는 O(1)로 처리합니다. 목록/자동완성은 사용 빈도와 최근성 순위로
+    보여 주며, 파일 기록은 SettingsStore가 백그라운드에서 모아서 수행합니다.
     
-    def __init__(self):
-        pass
+    파일 형식: [{"value": 옵션, "count": 사용 횟수, "last_used": 유닉스 시각}, ...]
+    (예전 문자열 목록 형식도 읽을 수 있음)
+    """
+    
+    def __init__(self, max_options: int = OPTIONS_MAX_COUNT,
+                 prune_rules: Optional[Dict[str, Dict[str, float]]] = None):
+        self.max_options = max_options
+        self.prune_rules = OPTIONS_PRUNE_RULES if prune_rules is None else prune_rules
+        self._options: Dict[str, "OrderedDict[str, List[float]]"] = {}
+        self._ranked: Dict[str, OptionIndex] = {}  # 필드 -> 순위순 자동완성 인덱스 (변경 시 무효화)
+        self._lock = threading.RLock()
+    
+    def _field_options(self, field_name: str, options_file: str) -> "OrderedDict[str, List[float]]":
+        """필드 옵션 딕셔너리 (최초 1회만 파일에서 읽고 오래된 항목 정리)"""
+        options = self._options.get(field_name)
+        if options is None:
+            data = get_settings_store(options_file).get()
+            now = time.time()
+            options = OrderedDict()
+            for item in data if isinstance(data, list) else ():
+                if isinstance(item, dict):
+                    value = str(item.get('value', ''))
+                    stats = [float(item.get('count', 1)), float(item.get('last_used', now))]
+                else:
+                    value, stats = str(item), [1.0, now]
+                if value.strip():
+                    options.setdefault(value.strip(), stats)
+            self._options[field_name] = options
+            if self._prune_locked(field_name, now):
+                self._persist(field_name, options_file)
+        return options
+    
+    def _persist(self, field_name: str, options_file: str):
+        """순위 캐시 무효화 후 백그라운드 저장 예약"""
+        self._ranked.pop(field_name, None)
+        get_settings_store(options_file).set([
+            {'value': value, 'count': int(count), 'last_used': int(last_used)}
+            for value, (count, last_used) in self._options[field_name].items()
+        ])
+    
+    def _index(self, field_name: str, options_file: str) -> OptionIndex:
+        """순위순 옵션 인덱스 (목록이 바뀐 뒤 처음 조회할 때만 다시 계산)"""
+        index = self._ranked.get(field_name)
+        if index is None:
+            options = self._field_options(field_name, options_file)
+            now = time.time()
+            # 점수가 같으면 최근 사용 순서 유지 (정렬은 안정적)
+            ranked = sorted(options, key=lambda value: -option_score(*options[value], now))
+            index = OptionIndex(ranked)
+            self._ranked[field_name] = index
+        return index
     
     def load_options(self, field_name: str, options_file: str) -> list:
-        """필드 옵션들을 로드"""
-        options = FileManager.load_json(options_file)
-        if options and isinstance(options, list):
-            return options
-        return []
+        """필드 옵션들을 로드 (사용 빈도/최근성 순)"""
+        with self._lock:
+            return self._index(field_name, options_file).options()
+    
+    def complete_options(self, field_name: str, options_file: str, text: str, limit: int = 20) -> List[str]:
+        """입력 중인 텍스트로 시작하거나 포함하는 옵션 (순위 순)"""
+        with self._lock:
+            return self._index(field_name, options_file).complete(text, limit)
     
     def save_options(self, field_name: str, options_file: str, options: list) -> bool:
         """필드 옵션들을 저장"""
         try:
-            FileManager.save_json(options, options_file)
+            with self._lock:
+                old = self._options.get(field_name) or {}
+                now = time.time()
+                self._options[field_name] = OrderedDict(
+                    (option.strip(), old.get(option.strip(), [1.0, now]))
+                    for option in options if option and option.strip()
+                )
+                self._persist(field_name, options_file)
             return True
         except Exception as e:
             logger.error(f"옵션 저장 실패 {field_name}: {e}")
             return False
     
+    def _touch(self, options: "OrderedDict[str, List[float]]", option: str):
+        """사용 횟수/시각 갱신 후 맨 앞으로 이동"""
+        stats = options.get(option)
+        if stats is None:
+            options[option] = [1.0, time.time()]
+        else:
+            stats[0] += 1
+            stats[1] = time.time()
+        options.move_to_end(option, last=False)
+    
     def add_option(self, field_name: str, options_file: str, new_option: str) -> bool:
-        """새 옵션 추가"""
+        """
+        새 옵션 추가 (이미 있으면 사용 기록만 갱신)
+        
+        Returns:
+            새 항목이 추가되었으면 True
+        """
         if not new_option or new_option.strip() == "":
             return False
-            
-        options = self.load_options(field_name, options_file)
         new_option = new_option.strip()
         
-        # 중복 확인
-        if new_option not in options:
-            options.insert(0, new_option)  # 최신 항목을 맨 앞에 추가
-            return self.save_options(field_name, options_file, options)
-        return False
+        with self._lock:
+            options = self._field_options(field_name, options_file)
+            added = new_option not in options
+            self._touch(options, new_option)
+            # 개수 제한: 가장 오래 쓰지 않은 항목부터 제거
+            while len(options) > self.max_options:
+                options.popitem(last=True)
+            self._persist(field_name, options_file)
+            return added
+    
+    def import_options(self, field_name: str, options_file: str, new_options: List[str]) -> List[str]:
+        """
+        외부 목록(빌드 매니페스트 등)에서 옵션 일괄 추가
+        
+        이미 있는 항목은 건드리지 않고, 새 항목은 뒤에 있는 것이 더 최신으로 보고 맨 앞에 추가합니다.
+        저장은 한 번만 예약합니다.
+        
+        Returns:
+            새로 추가된 옵션 목록
+        """
+        added = []
+        with self._lock:
+            options = self._field_options(field_name, options_file)
+            for option in new_options:
+                option = (option or '').strip()
+                if option and option not in options:
+                    self._touch(options, option)
+                    added.append(option)
+            if not added:
+                return []
+            while len(options) > self.max_options:
+                options.popitem(last=True)
+            self._prune_locked(field_name, time.time())
+            self._persist(field_name, options_file)
+            return [option for option in added if option in options]
+    
+    def record_use(self, field_name: str, options_file: str, option: str) -> bool:
+        """이슈 생성 등에 쓰인 옵션의 사용 기록 갱신 (목록에 있는 항목만)"""
+        option = (option or '').strip()
+        with self._lock:
+            options = self._field_options(field_name, options_file)
+            if option not in options:
+                return False
+            self._touch(options, option)
+            self._persist(field_name, options_file)
+            return True
     
     def remove_option(self, field_name: str, options_file: str, option: str) -> bool:
         """옵션 제거"""
-        options = self.load_options(field_name, options_file)
-        if option in options:
-            options.remove(option)
-            return self.save_options(field_name, options_file, options)
-        return False
+        with self._lock:
+            options = self._field_options(field_name, options_file)
+            if option not in options:
+                return False
+            del options[option]
+            self._persist(field_name, options_file)
+            return True
+    
+    def _prune_locked(self, field_name: str, now: float) -> int:
+        rule = self.prune_rules.get(field_name)
+        options = self._options[field_name]
+        if not rule or not options:
+            return 0
+        before = len(options)
+        
+        max_age_days = rule.get('max_age_days')
+        if max_age_days:
+            cutoff = now - max_age_days * 86400
+            for value in [value for value, (_, last_used) in options.items() if last_used < cutoff]:
+                del options[value]
+        
+        max_count = rule.get('max_count')
+        if max_count and len(options) > max_count:
+            keep = set(heapq.nlargest(int(max_count), options, key=lambda value: option_score(*options[value], now)))
+            for value in [value for value in options if value not in keep]:
+                del options[value]
+        
+        removed = before - len(options)
+        if removed:
+            self._ranked.pop(field_name, None)
+            logger.info(f"{field_name} 옵션 {removed}개 정리 (오래되었거나 개수 초과)")
+        return removed
+    
+    def prune_options(self, field_name: str, options_file: str) -> int:
+        """
+        정리 기준(OPTIONS_PRUNE_RULES)에 따라 오래 쓰지 않은 옵션 제거
+        
+        Returns:
+            제거된 옵션 수
+        """
+        with self._lock:
+            self._field_options(field_name, options_file)
+            removed = self._prune_locked(field_name, time.time())
+            if removed:
+                self._persist(field_name, options_file)
+            return removed
 
 
 class PresetManager:
@@ -246,80 +483,112 @@ class PresetManager:
         self.preset_dir = preset_dir
         if not os.path.exists(preset_dir):
             os.makedirs(preset_dir)
+        # SQLite 저장소 설정 시 DB 사용, 아니면 버전별 JSON 파일
+        self.db_store = get_preset_db_store(preset_dir)
+        # 디렉토리는 최초 조회 시 한 번만 스캔하고 이후에는 메모리 카탈로그 사용
+        self.catalog = self.db_store if self.db_store is not None else PresetCatalog(preset_dir)
+        # 버전 파일은 이전 버전 대비 델타로 저장되므로 복원/캐시를 담당
+        self.materializer = get_materializer(preset_dir)
+        
+        # 파일명/요약 검색 인덱스 (build_search_index 이후 카탈로그 변경을 따라 증분 갱신)
+        # SQLite 저장소는 DB의 전문 검색(FTS)을 사용하므로 메모리 인덱스를 만들지 않음
+        self.search_index = TrigramIndex()
+        self._search_summaries: Dict[str, str] = {}
+        if self.db_store is None:
+            self.catalog.add_listener(self._on_catalog_changed)
+        
+        # 비동기 로드 (네트워크 공유 폴더에서도 GUI가 멈추지 않도록)
+        self._load_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_loads: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
     
-    def get_preset_files(self, sort_by_date: bool = True) -> list:
-        """프리셋 파일 목록을 반환 (최신순 정렬 옵션)"""
+    def refresh(self) -> bool:
+        """디렉토리를 다시 스캔하여 외부 변경 반영 (변경이 있었으면 True)"""
+        changed, removed = self.catalog.refresh()
+        if changed or removed:
+            # 외부에서 바뀐 파일을 부모로 쓰는 복원 결과가 있을 수 있으므로 캐시 전체 무효화
+            self.materializer.clear()
+        return bool(changed or removed)
+    
+    def _index_preset(self, filename: str):
+        """검색 인덱스에 프리셋 하나 추가 (파일명 + 요약)"""
         try:
-            files = [f for f in os.listdir(self.preset_dir) if f.endswith('.json')]
-            
-            if sort_by_date:
-                # 파일 수정 시간으로 정렬 (최신순)
-                files.sort(key=lambda f: os.path.getmtime(os.path.join(self.preset_dir, f)), reverse=True)
-            else:
-                # 알파벳순 정렬
-                files.sort()
-            
-            return files
+            data = self.db_store.load(filename) if self.db_store is not None else self.materializer.load(filename)
         except Exception as e:
-            logger.error(f"프리셋 파일 목록 조회 실패: {e}")
-            return []
+            logger.debug(f"프리셋 검색 인덱싱 실패 ({filename}): {e}")
+            data = None
+        summary = str((data or {}).get('summary', '') or '').strip()
+        self._search_summaries[filename] = summary
+        self.search_index.add(filename, f"{filename[:-5].replace('_', ' ')} {summary}")
     
-    def get_preset_prefixes(self) -> Dict[str, list]:
-        """프리셋 파일들의 접두사별 그룹을 반환"""
-        preset_files = self.get_preset_files()
-        prefix_to_files = {}
-        
-        for filename in preset_files:
-            parts = filename.split('_')
-            if len(parts) > 1:
-                prefix = parts[0]
-            else:
-                prefix = parts[0].replace('.json', '')
-            
-            if prefix not in prefix_to_files:
-                prefix_to_files[prefix] = []
-            prefix_to_files[prefix].append(filename)
+    def _on_catalog_changed(self, changed: Set[str], removed: Set[str]):
+        """카탈로그 변경을 검색 인덱스에 반영"""
+        for filename in removed:
+            self.search_index.remove(filename)
+            self._search_summaries.pop(filename, None)
+        for filename in changed:
+            self._index_preset(filename)
+    
+    def build_search_index(self) -> int:
+        """
+        모든 프리셋으로 검색 인덱스 구축 (프리셋이 많으면 오래 걸리므로 백그라운드 스레드에서 호출)
         
-        return prefix_to_files
+        Returns:
+            인덱싱된 프리셋 수
+        """
+        if self.db_store is not None:
+            return len(self.db_store)  # DB가 저장 시 색인을 갱신함
+        for filename in self.catalog.files():
+            if filename not in self.search_index:
+                self._index_preset(filename)
+        logger.info(f"프리셋 검색 인덱스 구축 완료: {len(self.search_index)}개")
+        return len(self.search_index)
     
-    def get_preset_names_and_versions(self) -> Dict[str, Dict[str, list]]:
-        """프리셋을 prefix -> name -> versions 구조로 반환"""
-        preset_files = self.get_preset_files()
-        structure = {}
+    def search_presets(self, query: str, limit: int = 20) -> List[tuple]:
+        """
+        파일명/요약으로 프리셋 검색 (같은 이름의 여러 버전은 가장 최신 버전 하나만)
         
-        for filename in preset_files:
-            file_base = filename[:-5]  # .json 제거
-            parts = file_base.split('_')
-            
-            if len(parts) >= 2:
-                prefix = parts[0]
-                # 버전이 있는지 확인 (마지막이 숫자인지)
-                if parts[-1].isdigit():
-                    name = '_'.join(parts[1:-1])
-                    version = int(parts[-1])
-                else:
-                    name = '_'.join(parts[1:])
-                    version = 0  # 원본 버전
-            else:
-                # prefix만 있는 경우
-                prefix = parts[0]
-                name = ""
-                version = 0
-            
-            if prefix not in structure:
-                structure[prefix] = {}
-            
-            if name not in structure[prefix]:
-                structure[prefix][name] = []
-            
-            structure[prefix][name].append((version, filename))
+        Returns:
+            (파일명, 요약) 목록 (관련도순)
+        """
+        if self.db_store is not None:
+            return self._search_db_presets(query, limit)
+        best = {}
+        for score, filename in self.search_index.search(query, limit=limit * 5):
+            prefix, name, version = parse_preset_filename(filename)
+            current = best.get((prefix, name))
+            if current is None or (score, version) > current[:2]:
+                best[(prefix, name)] = (score, version, filename)
         
-        # 각 name의 버전들을 내림차순으로 정렬 (최신 먼저)
-        for prefix in structure:
-            for name in structure[prefix]:
-                structure[prefix][name].sort(reverse=True, key=lambda x: x[0])
+        ranked = sorted(best.values(), key=lambda x: (-x[0], -x[1]))[:limit]
+        return [(filename, self._search_summaries.get(filename, '')) for _, _, filename in ranked]
+    
+    def _search_db_presets(self, query: str, limit: int) -> List[tuple]:
+        """SQLite 저장소 검색 결과를 이름별 최신 버전 하나로 정리 (순위는 가장 먼저 나온 버전 기준)"""
+        best = {}
+        for rank, (filename, summary) in enumerate(self.db_store.search_summaries(query, limit=limit * 5)):
+            prefix, name, version = parse_preset_filename(filename)
+            current = best.get((prefix, name))
+            if current is None or version > current[1]:
+                best[(prefix, name)] = (current[0] if current else rank, version, filename, summary)
         
-        return structure
+        ranked = sorted(best.values())[:limit]
+        return [(filename, summary) for _, _, filename, summary in ranked]
+    
+    def get_preset_files(self, sort_by_date: bool = True) -> list:
+        """프리셋 파일 목록을 반환 (최신순 정렬 옵션)"""
+        return self.catalog.files(sort_by_date)
+    
+    def get_preset_prefixes(self) -> Dict[str, list]:
+        """프리셋 파일들의 접두사별 그룹을 반환"""
+        return {
+            prefix: [filename for versions in names.values() for _, filename in versions]
+            for prefix, names in self.catalog.get_structure().items()
+        }
+    
+    def get_preset_names_and_versions(self, sort_by_date: bool = True) -> Dict[str, Dict[str, list]]:
+        """프리셋을 prefix -> name -> versions 구조로 반환"""
+        return self.catalog.get_structure(sort_by_date)
     
     def save_preset(self, filename: str, data: Dict[str, Any]) -> bool:
         """프리셋을 저장 (버전 관리 포함)"""
@@ -329,10 +598,15 @@ class PresetManager:
             
             # 버전 관리: 동일 이름이 있으면 숫자 증가
             base_name = filename[:-5]  # .json 제거
-            versioned_filename = self._get_next_version_filename(base_name)
-            
-            filepath = os.path.join(self.preset_dir, versioned_filename)
-            FileManager.save_json(data, filepath)
+            if self.db_store is not None:
+                # 버전 계산과 저장이 INSERT 한 번으로 끝남
+                versioned_filename = self.db_store.save(base_name, data)
+            else:
+                # 직전 버전이 있으면 변경분만 기록 (주기적으로 전체 스냅샷)
+                parent = self.catalog.latest_version_filename(base_name)
+                versioned_filename = self._get_next_version_filename(base_name)
+                self.materializer.save(versioned_filename, data, parent)
+                self.catalog.add(versioned_filename)
             logger.info(f"프리셋 '{versioned_filename}' 저장 완료")
             return True
         except Exception as e:
@@ -341,41 +615,75 @@ class PresetManager:
     
     def _get_next_version_filename(self, base_name: str) -> str:
         """다음 버전의 파일명을 생성"""
-        existing_files = self.get_preset_files(sort_by_date=False)
-        
-        # 동일한 베이스명을 가진 파일들 찾기
-        versions = []
-        for file in existing_files:
-            file_base = file[:-5]  # .json 제거
-            
-            # 정확히 같은 이름이거나 _숫자 형태인지 확인
-            if file_base == base_name:
-                versions.append(0)  # 원본 파일
-            elif file_base.startswith(f"{base_name}_") and file_base[len(base_name)+1:].isdigit():
-                version_num = int(file_base[len(base_name)+1:])
-                versions.append(version_num)
-        
-        if not versions:
-            return f"{base_name}.json"
-        
-        # 가장 높은 버전 + 1
-        next_version = max(versions) + 1
-        return f"{base_name}_{next_version}.json"
+        return self.catalog.next_version_filename(base_name)
     
     def load_preset(self, filename: str) -> Optional[Dict[str, Any]]:
         """프리셋을 로드"""
         try:
-            filepath = os.path.join(self.preset_dir, filename)
-            return FileManager.load_json(filepath)
+            if self.db_store is not None:
+                return self.db_store.load(filename)
+            return self.materializer.load(filename)
         except Exception as e:
             logger.error(f"프리셋 '{filename}' 로드 실패: {e}")
             return None
     
+    def peek_preset(self, filename: str) -> Optional[Dict[str, Any]]:
+        """이미 디코딩되어 캐시에 있는 프리셋 반환 (없으면 None, 디스크를 읽지 않음)"""
+        if self.db_store is not None:
+            return self.db_store.peek(filename)
+        return self.materializer.peek(filename)
+    
+    def load_preset_async(self, filename: str) -> Future:
+        """
+        프리셋을 스레드 풀에서 로드
+        
+        같은 파일에 대한 로드가 진행 중이면 그 Future를 공유합니다.
+        
+        Returns:
+            결과가 프리셋 데이터(또는 None)인 Future
+        """
+        cached = self.peek_preset(filename)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        
+        with self._pending_lock:
+            future = self._pending_loads.get(filename)
+            if future is None:
+                if self._load_executor is None:
+                    self._load_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='preset-load')
+                future = self._load_executor.submit(self.load_preset, filename)
+                self._pending_loads[filename] = future
+                future.add_done_callback(lambda _: self._finish_pending_load(filename))
+        return future
+    
+    def _finish_pending_load(self, filename: str):
+        with self._pending_lock:
+            self._pending_loads.pop(filename, None)
+    
+    def prefetch_preset(self, filename: str):
+        """선택/강조된 프리셋을 미리 로드해 두어 적용이 즉시 끝나도록 함"""
+        if filename and self.peek_preset(filename) is None:
+            self.load_preset_async(filename)
+    
+    def shutdown(self):
+        """로드 스레드 풀 종료 (진행 중인 로드는 기다리지 않음)"""
+        if self._load_executor is not None:
+            self._load_executor.shutdown(wait=False)
+            self._load_executor = None
+    
     def delete_preset(self, filename: str) -> bool:
         """프리셋을 삭제"""
         try:
-            filepath = os.path.join(self.preset_dir, filename)
-            os.remove(filepath)
+            if self.db_store is not None:
+                if not self.db_store.delete(filename):
+                    raise FileNotFoundError(filename)
+            else:
+                # 이 버전을 부모로 쓰는 델타는 먼저 전체 스냅샷으로 변환
+                self.materializer.detach_dependents(filename, self.catalog.later_versions(filename))
+                os.remove(os.path.join(self.preset_dir, filename))
+                self.catalog.remove(filename)
             logger.info(f"프리셋 '{filename}' 삭제 완료")
             return True
         except Exception as e:
@@ -408,12 +716,5 @@ class ValidationHelper:
 
 
 def setup_logging(level: int = logging.INFO) -> None:
-    """로깅 설정을 초기화"""
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('jira_auto.log', encoding='utf-8')
-        ]
-    )
+    """로깅 설정을 초기화 (비동기 큐 -> JSON Lines 회전 파일 + 콘솔)"""
+    setup_async_logging(level)